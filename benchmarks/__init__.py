@@ -0,0 +1,15 @@
+"""
+Benchmarks
+
+Timing suite for the hot paths of the application (loading, hydration,
+serialization, ID allocation, pairing, report tables), run on synthetic
+data written by data_generator.
+
+Usage (from the project root):
+    python -m benchmarks.run_benchmarks
+    python -m benchmarks.run_benchmarks --players 20000 --tournaments 200
+    python -m benchmarks.run_benchmarks --save-baseline
+
+Correctness tests (pairing, result import) are in tests/:
+    python -m pytest
+"""
@@ -0,0 +1,282 @@
+"""
+Benchmark Data Generator
+
+Writes realistic players.json and tournaments.json files of any size:
+valid national IDs, finished rounds with chronological dates, byes for
+odd player counts, and player_scores matching the stored matches.
+
+Files are written through PlayerManager and TournamentManager, so they
+have exactly the application's format (and its ID sequences).
+
+Usage:
+    python -m benchmarks.data_generator --output /tmp/chess_data --players 5000
+"""
+
+import argparse
+import datetime
+import os
+import random
+
+from models.player import Player
+from models.tournament import Tournament
+from models.round import Round
+from models.match import Match
+from managers.player_manager import PlayerManager
+from managers.tournament_manager import TournamentManager
+
+LAST_NAMES = (
+    "MARTIN", "BERNARD", "THOMAS", "PETIT", "ROBERT", "RICHARD", "DURAND",
+    "DUBOIS", "MOREAU", "LAURENT", "SIMON", "MICHEL", "LEFEBVRE", "LEROY",
+    "ROUX", "DAVID", "BERTRAND", "MOREL", "FOURNIER", "GIRARD", "BONNET",
+    "DUPONT", "LAMBERT", "FONTAINE", "ROUSSEAU", "VINCENT", "MULLER",
+    "LEFEVRE", "FAURE", "ANDRE", "MERCIER", "BLANC", "GUERIN", "BOYER",
+)
+FIRST_NAMES = (
+    "Léa", "Hugo", "Chloé", "Lucas", "Emma", "Louis", "Inès", "Gabriel",
+    "Jade", "Arthur", "Manon", "Jules", "Camille", "Raphaël", "Sarah",
+    "Adam", "Zoé", "Nathan", "Alice", "Théo", "Louise", "Paul", "Lina",
+    "Éloïse", "Maël", "Anaïs", "Noé", "Juliette", "Sacha", "Clément",
+)
+CITIES = (
+    "Paris", "Lyon", "Marseille", "Toulouse", "Nice", "Nantes", "Strasbourg",
+    "Montpellier", "Bordeaux", "Lille", "Rennes", "Reims", "Dijon", "Grenoble",
+)
+
+# Match results: first player wins, second player wins, draw
+RESULTS = ((1.0, 0.0), (0.0, 1.0), (0.5, 0.5))
+
+
+def get_manager_paths(data_dir):
+    """
+    Build the file paths used inside a data directory.
+
+    Args:
+        data_dir (str): Data directory
+
+    Returns:
+        tuple: (players file path, tournaments file path)
+    """
+    return (
+        os.path.join(data_dir, "players.json"),
+        os.path.join(data_dir, "tournaments", "tournaments.json"),
+    )
+
+
+class DataGenerator:
+    """
+    Generates a synthetic player base and tournament archive.
+
+    Attributes:
+        data_dir (str): Directory receiving the files
+        random_generator (random.Random): Seeded source of all randomness
+        player_manager (PlayerManager): Manager writing players.json
+        tournament_manager (TournamentManager): Manager writing tournaments.json
+    """
+
+    def __init__(self, data_dir, seed=0):
+        """
+        Initialize the generator.
+
+        Args:
+            data_dir (str): Directory receiving the files
+            seed (int, optional): Seed making the data reproducible. Defaults to 0.
+        """
+        self.data_dir = data_dir
+        self.random_generator = random.Random(seed)
+
+        players_path, tournaments_path = get_manager_paths(data_dir)
+        self.player_manager = PlayerManager(file_path=players_path)
+        self.tournament_manager = TournamentManager(
+            file_path=tournaments_path, player_manager=self.player_manager
+        )
+
+    def generate(self, player_count, tournament_count, players_per_tournament, rounds_per_tournament):
+        """
+        Write the players and tournaments files.
+
+        Args:
+            player_count (int): Players in players.json
+            tournament_count (int): Tournaments in tournaments.json
+            players_per_tournament (int): Participants of each tournament
+                                          (capped at player_count)
+            rounds_per_tournament (int): Finished rounds of each tournament
+
+        Returns:
+            tuple: (list of Player, list of Tournament)
+        """
+        players = self.generate_players(player_count)
+        self.player_manager.save_items(players)
+
+        tournaments = self.generate_tournaments(
+            players, tournament_count, players_per_tournament, rounds_per_tournament
+        )
+        self.tournament_manager.save_items(tournaments)
+        return players, tournaments
+
+    # ========================================
+    # PLAYERS
+    # ========================================
+
+    def generate_players(self, count):
+        """
+        Build synthetic players with consecutive reserved IDs.
+
+        Args:
+            count (int): Number of players
+
+        Returns:
+            list: New Player objects (not saved)
+        """
+        players = []
+        for player_id in self.player_manager.reserve_ids(count):
+            last_name = self.random_generator.choice(LAST_NAMES)
+            first_name = self.random_generator.choice(FIRST_NAMES)
+            birth_date = datetime.date(1950, 1, 1) + datetime.timedelta(
+                days=self.random_generator.randrange(365 * 60)
+            )
+            players.append(Player(
+                last_name=last_name,
+                first_name=first_name,
+                date_of_birth=birth_date.isoformat(),
+                national_id=self._national_id(last_name, player_id),
+                player_id=player_id
+            ))
+        return players
+
+    @staticmethod
+    def _national_id(last_name, player_id):
+        """
+        Build a valid national ID (AB12345) that is unique per player.
+
+        The second letter and the digits encode the player ID, so IDs
+        stay unique up to 2.6 million players.
+
+        Args:
+            last_name (str): Player's last name (unaccented capitals)
+            player_id (int): Player's ID
+
+        Returns:
+            str: National ID
+        """
+        return f"{last_name[0]}{chr(ord('A') + player_id // 100000 % 26)}{player_id % 100000:05d}"
+
+    # ========================================
+    # TOURNAMENTS
+    # ========================================
+
+    def generate_tournaments(self, players, count, players_per_tournament, rounds_per_tournament):
+        """
+        Build finished tournaments, one week apart, oldest first.
+
+        Args:
+            players (list): Player pool
+            count (int): Number of tournaments
+            players_per_tournament (int): Participants of each tournament
+            rounds_per_tournament (int): Rounds of each tournament
+
+        Returns:
+            list: New Tournament objects (not saved)
+        """
+        participant_count = min(players_per_tournament, len(players))
+        round_ids = iter(self.tournament_manager.reserve_round_ids(count * rounds_per_tournament))
+        first_day = datetime.datetime(2020, 1, 4, 10, 0)
+
+        tournaments = []
+        for index, tournament_id in enumerate(self.tournament_manager.reserve_ids(count)):
+            start = first_day + datetime.timedelta(weeks=index)
+            city = self.random_generator.choice(CITIES)
+            tournament = Tournament(
+                name=f"Open de {city} {start.year} n°{tournament_id}",
+                location=city,
+                description="Tournoi généré pour les benchmarks",
+                start_date=start.date().isoformat(),
+                end_date=(start + datetime.timedelta(days=rounds_per_tournament // 2)).date().isoformat(),
+                number_of_rounds=rounds_per_tournament,
+                current_round=rounds_per_tournament + 1,
+                players=self.random_generator.sample(players, participant_count),
+                tournament_id=tournament_id
+            )
+            self._play_rounds(tournament, start, round_ids)
+            tournaments.append(tournament)
+        return tournaments
+
+    def _play_rounds(self, tournament, start, round_ids):
+        """
+        Add finished rounds with random pairings and results.
+
+        Players are paired within score groups (sorted by points, with a
+        random order inside each group), like a Swiss tournament.
+
+        Args:
+            tournament (Tournament): Tournament to fill
+            start (datetime.datetime): Start of the first round
+            round_ids (iterator): Source of reserved round IDs
+        """
+        manager = self.tournament_manager
+        participants = list(tournament.players)
+        for player in participants:
+            manager.get_player_score(tournament, player.player_id)
+
+        for round_index in range(tournament.number_of_rounds):
+            self.random_generator.shuffle(participants)
+            participants.sort(
+                key=lambda player: tournament.player_scores[player.player_id]["total_points"],
+                reverse=True
+            )
+
+            matches = []
+            for player_a, player_b in zip(participants[0::2], participants[1::2]):
+                score_a, score_b = self.random_generator.choice(RESULTS)
+                matches.append(Match(player_a, player_b, score_a, score_b))
+                for player, opponent, points in ((player_a, player_b, score_a), (player_b, player_a, score_b)):
+                    manager.add_points_to_player(tournament, player.player_id, points)
+                    manager.add_opponent_to_player(tournament, player.player_id, opponent.player_id)
+
+            if len(participants) % 2:
+                bye_player = participants[-1]
+                manager.add_points_to_player(tournament, bye_player.player_id, 1.0)
+                manager.add_opponent_to_player(tournament, bye_player.player_id, -1)
+
+            round_start = start + datetime.timedelta(hours=3 * round_index)
+            tournament.rounds.append(Round(
+                name=f"Round {round_index + 1}",
+                matches=matches,
+                start_date_time=round_start.isoformat(),
+                end_date_time=(round_start + datetime.timedelta(hours=2)).isoformat(),
+                round_id=next(round_ids)
+            ))
+
+
+def parse_arguments():
+    """
+    Read the command line options.
+
+    Returns:
+        argparse.Namespace: Parsed options
+    """
+    parser = argparse.ArgumentParser(description="Générateur de données de test")
+    parser.add_argument("--output", required=True, help="dossier des fichiers générés")
+    parser.add_argument("--players", type=int, default=2000, help="nombre de joueurs")
+    parser.add_argument("--tournaments", type=int, default=50, help="nombre de tournois")
+    parser.add_argument(
+        "--tournament-players", type=int, default=64, help="joueurs par tournoi"
+    )
+    parser.add_argument("--rounds", type=int, default=7, help="rounds par tournoi")
+    parser.add_argument("--seed", type=int, default=0, help="graine aléatoire")
+    return parser.parse_args()
+
+
+def main():
+    """Generator entry point."""
+    arguments = parse_arguments()
+    DataGenerator(arguments.output, seed=arguments.seed).generate(
+        arguments.players,
+        arguments.tournaments,
+        arguments.tournament_players,
+        arguments.rounds
+    )
+    print(f"Données générées dans {arguments.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,441 @@
+"""
+Benchmark Runner
+
+Times the hot paths of the application on generated data, writes the
+results to a JSON file and compares them with a stored baseline.
+
+Measured (each one repeated, best and median times kept):
+    - load_players: BaseManager.load_items on players.json (cold cache)
+    - load_tournaments: TournamentManager.load_items (headers only)
+    - hydrate_tournaments: load_items plus players and rounds of every
+      tournament converted to objects
+    - to_dict: Tournament.to_dict for every tournament
+    - save_items: TournamentManager.save_items of the whole archive
+    - get_next_id: ID_CALLS allocations from the player sequence
+    - get_next_round_id: ID_CALLS calls to TournamentController._get_next_round_id
+    - pairing: next round of a Swiss tournament with the configured
+      pairing engine (CHESS_PAIRING_MODE)
+    - pairing_greedy: same round with TournamentController._pair_greedy
+    - display_table: ReportView.display_table of every player (output
+      discarded, only the formatting is timed)
+    - display_paged_table: first page of the same table with
+      ReportView.display_paged_table (rows generated, then quit)
+
+Baseline comparison:
+    A measure regresses when its median is more than `threshold` slower
+    than the baseline's (and slower by at least MIN_SIGNIFICANT seconds,
+    to ignore noise on very fast measures). The exit code is 1 if any
+    measure regresses, so the runner can gate a CI job. Baselines are
+    machine-specific: record one with --save-baseline on the machine
+    that compares against it.
+
+Usage:
+    python -m benchmarks.run_benchmarks
+    python -m benchmarks.run_benchmarks --players 20000 --threshold 0.1
+    python -m benchmarks.run_benchmarks --save-baseline
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+from benchmarks.data_generator import DataGenerator, get_manager_paths
+from controllers.tournament_controller import TournamentController
+from managers.player_manager import PlayerManager
+from managers.tournament_manager import TournamentManager
+from managers.rating_manager import RatingManager
+from views.report_view import ReportView
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(__file__), "results.json")
+DEFAULT_THRESHOLD = 0.2
+
+# Calls per get_next_id / get_next_round_id measure
+ID_CALLS = 200
+
+# Differences below this many seconds are never reported as regressions
+MIN_SIGNIFICANT = 0.002
+
+
+class BenchmarkSuite:
+    """
+    Generated data set and the benchmarks running on it.
+
+    Attributes:
+        config (dict): Data set sizes and options (stored with the results)
+        data_dir (str): Directory holding the generated files
+        player_manager (PlayerManager): Manager on the generated players
+        tournament_manager (TournamentManager): Manager on the generated tournaments
+        controller (TournamentController): Controller on the same managers
+    """
+
+    def __init__(self, data_dir, config):
+        """
+        Generate the data set and build the managers.
+
+        Args:
+            data_dir (str): Empty directory receiving the generated files
+            config (dict): Keys 'players', 'tournaments', 'tournament_players',
+                           'rounds', 'pairing_players' and 'seed'
+        """
+        self.config = config
+        self.data_dir = data_dir
+
+        generator = DataGenerator(data_dir, seed=config["seed"])
+        players, _ = generator.generate(
+            config["players"],
+            config["tournaments"],
+            config["tournament_players"],
+            config["rounds"]
+        )
+
+        # Live tournament to pair: its rounds so far are played, not saved
+        live_tournament = generator.generate_tournaments(
+            players, 1, config["pairing_players"], config["rounds"] // 2
+        )[0]
+
+        players_path, tournaments_path = get_manager_paths(data_dir)
+        self.player_manager = PlayerManager(file_path=players_path)
+        self.tournament_manager = TournamentManager(
+            file_path=tournaments_path, player_manager=self.player_manager
+        )
+        self.controller = TournamentController(
+            tournament_manager=self.tournament_manager,
+            player_manager=self.player_manager,
+            rating_manager=RatingManager(
+                file_path=os.path.join(data_dir, "ratings.json"),
+                tournament_manager=self.tournament_manager
+            )
+        )
+        self.players_with_scores = self._build_players_with_scores(live_tournament)
+
+    @staticmethod
+    def _build_players_with_scores(tournament):
+        """
+        Build the pairing input of a tournament, as _generate_next_round does.
+
+        Args:
+            tournament (Tournament): Tournament with its rounds played
+
+        Returns:
+            list: Dicts with keys 'player', 'score' and 'opponents',
+                  sorted by score (highest first)
+        """
+        players_with_scores = [
+            {
+                'player': player,
+                'score': tournament.player_scores[player.player_id]['total_points'],
+                'opponents': tournament.player_scores[player.player_id]['opponents_history'],
+            }
+            for player in tournament.players
+        ]
+        players_with_scores.sort(key=lambda data: data['score'], reverse=True)
+        return players_with_scores
+
+    def _drop_caches(self):
+        """Empty the managers' caches so the next load reads the files."""
+        self.tournament_manager.invalidate_cache()
+        self.player_manager.invalidate_cache()
+
+    # ========================================
+    # BENCHMARKS
+    # ========================================
+
+    def get_benchmarks(self):
+        """
+        List the benchmarks in running order.
+
+        Returns:
+            list: (name, setup, function) tuples. setup (or None) runs
+                  untimed before each repetition; function is timed.
+        """
+        return [
+            ("load_players", self._drop_caches, self.player_manager.load_items),
+            ("load_tournaments", self._drop_caches, self.tournament_manager.load_items),
+            ("hydrate_tournaments", self._drop_caches, self._hydrate_tournaments),
+            ("to_dict", None, self._dehydrate_tournaments),
+            ("save_items", None, self._save_tournaments),
+            ("get_next_id", None, self._allocate_player_ids),
+            ("get_next_round_id", None, self._allocate_round_ids),
+            ("pairing", None, self._pair_with_engine),
+            ("pairing_greedy", None, self._pair_greedy),
+            ("display_table", None, self._display_players_table),
+            ("display_paged_table", None, self._display_players_first_page),
+        ]
+
+    def _hydrate_tournaments(self):
+        """Load every tournament and convert its players and rounds."""
+        for tournament in self.tournament_manager.load_items():
+            tournament.players
+            tournament.rounds
+
+    def _dehydrate_tournaments(self):
+        """Serialize every tournament."""
+        return [tournament.to_dict() for tournament in self.tournament_manager.load_items()]
+
+    def _save_tournaments(self):
+        """Write the whole tournament archive."""
+        self.tournament_manager.save_items(self.tournament_manager.load_items())
+
+    def _allocate_player_ids(self):
+        """Allocate ID_CALLS player IDs."""
+        for _ in range(ID_CALLS):
+            self.player_manager.get_next_id()
+
+    def _allocate_round_ids(self):
+        """Allocate ID_CALLS round IDs through the controller."""
+        for _ in range(ID_CALLS):
+            self.controller._get_next_round_id()
+
+    def _pair_with_engine(self):
+        """Pair the live tournament with the configured engine."""
+        if self.controller.pairing_engine is not None:
+            self.controller.pairing_engine.pair_players(self.players_with_scores)
+
+    def _pair_greedy(self):
+        """Pair the live tournament with the greedy routine."""
+        self.controller._pair_greedy(self.players_with_scores)
+
+    def _display_players_table(self):
+        """Format the table of every player, without printing it."""
+        rows = [
+            [player.player_id, player.last_name, player.first_name,
+             player.date_of_birth, player.national_id]
+            for player in self.player_manager.load_items()
+        ]
+        with contextlib.redirect_stdout(io.StringIO()):
+            ReportView().display_table(
+                "Liste des joueurs", ["ID", "Nom", "Prénom", "Naissance", "ID national"], rows
+            )
+
+    def _display_players_first_page(self):
+        """Show the first page of the paginated players table, then quit."""
+        rows = (
+            [player.player_id, player.last_name, player.first_name,
+             player.date_of_birth, player.national_id]
+            for player in self.player_manager.load_items()
+        )
+        view = ReportView()
+        view.prompt_for_page_command = lambda is_last_page: "q"
+        with contextlib.redirect_stdout(io.StringIO()):
+            view.display_paged_table(
+                "Liste des joueurs", ["ID", "Nom", "Prénom", "Naissance", "ID national"], rows
+            )
+
+    # ========================================
+    # TIMING
+    # ========================================
+
+    def run(self, repeat):
+        """
+        Run every benchmark.
+
+        Args:
+            repeat (int): Timed repetitions per benchmark
+
+        Returns:
+            dict: Benchmark name -> {"min": seconds, "median": seconds, "runs": int}
+        """
+        results = {}
+        for name, setup, function in self.get_benchmarks():
+            durations = []
+            for _ in range(repeat):
+                if setup is not None:
+                    setup()
+                start = time.perf_counter()
+                function()
+                durations.append(time.perf_counter() - start)
+            results[name] = {
+                "min": min(durations),
+                "median": statistics.median(durations),
+                "runs": repeat,
+            }
+        return results
+
+
+# ========================================
+# BASELINE COMPARISON
+# ========================================
+
+def compare_with_baseline(results, baseline, threshold):
+    """
+    Compare measured medians with the baseline's.
+
+    Args:
+        results (dict): Benchmark name -> timings (see BenchmarkSuite.run)
+        baseline (dict): Same format, or None without a baseline
+        threshold (float): Allowed slowdown (0.2 = 20% slower)
+
+    Returns:
+        dict: Benchmark name -> {"baseline": seconds or None,
+              "ratio": float or None, "regression": bool}
+    """
+    comparison = {}
+    for name, timings in results.items():
+        reference = (baseline or {}).get(name)
+        if reference is None or not reference.get("median"):
+            comparison[name] = {"baseline": None, "ratio": None, "regression": False}
+            continue
+
+        median = timings["median"]
+        reference_median = reference["median"]
+        comparison[name] = {
+            "baseline": reference_median,
+            "ratio": median / reference_median,
+            "regression": (
+                median > reference_median * (1 + threshold)
+                and median - reference_median >= MIN_SIGNIFICANT
+            ),
+        }
+    return comparison
+
+
+def load_baseline(path):
+    """
+    Read a baseline file.
+
+    Args:
+        path (str): Path to the baseline JSON file
+
+    Returns:
+        dict: Stored run ("config", "results", ...), or None if missing
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (json.JSONDecodeError, FileNotFoundError):
+        return None
+
+
+def write_json(path, data):
+    """
+    Write a JSON file, creating its directory.
+
+    Args:
+        path (str): Destination
+        data (dict): Content
+    """
+    dir_name = os.path.dirname(path)
+    if dir_name:
+        os.makedirs(dir_name, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=4)
+
+
+# ========================================
+# COMMAND LINE
+# ========================================
+
+def parse_arguments():
+    """
+    Read the command line options.
+
+    Returns:
+        argparse.Namespace: Parsed options
+    """
+    parser = argparse.ArgumentParser(description="Benchmarks du gestionnaire de tournois")
+    parser.add_argument("--players", type=int, default=2000, help="nombre de joueurs")
+    parser.add_argument("--tournaments", type=int, default=50, help="nombre de tournois")
+    parser.add_argument(
+        "--tournament-players", type=int, default=64, help="joueurs par tournoi"
+    )
+    parser.add_argument("--rounds", type=int, default=7, help="rounds par tournoi")
+    parser.add_argument(
+        "--pairing-players", type=int, default=1000,
+        help="joueurs du tournoi utilisé pour l'appariement"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="graine aléatoire")
+    parser.add_argument("--repeat", type=int, default=5, help="répétitions par mesure")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="fichier JSON des résultats")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="fichier JSON de référence")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help="ralentissement toléré (0.2 = 20 %%)"
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true",
+        help="enregistre cette exécution comme nouvelle référence"
+    )
+    return parser.parse_args()
+
+
+def main():
+    """
+    Runner entry point.
+
+    Returns:
+        int: Exit code (1 if a measure regressed)
+    """
+    arguments = parse_arguments()
+    config = {
+        "players": arguments.players,
+        "tournaments": arguments.tournaments,
+        "tournament_players": arguments.tournament_players,
+        "rounds": arguments.rounds,
+        "pairing_players": arguments.pairing_players,
+        "seed": arguments.seed,
+        "pairing_mode": os.environ.get("CHESS_PAIRING_MODE", "matching"),
+    }
+
+    data_dir = tempfile.mkdtemp(prefix="chess_benchmarks_")
+    try:
+        results = BenchmarkSuite(data_dir, config).run(arguments.repeat)
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    run = {
+        "config": config,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+    baseline = load_baseline(arguments.baseline)
+    baseline_results = None
+    if baseline is not None and baseline.get("config") == config:
+        baseline_results = baseline.get("results")
+    elif baseline is not None:
+        print("Référence ignorée : elle a été mesurée avec d'autres paramètres.")
+    comparison = compare_with_baseline(results, baseline_results, arguments.threshold)
+    run["comparison"] = comparison
+    run["threshold"] = arguments.threshold
+
+    write_json(arguments.output, run)
+    if arguments.save_baseline:
+        write_json(arguments.baseline, run)
+
+    headers = ["Mesure", "Min (s)", "Médiane (s)", "Référence (s)", "Rapport", "Statut"]
+    rows = []
+    for name, timings in results.items():
+        compared = comparison[name]
+        if compared["baseline"] is None:
+            reference, ratio, status = "-", "-", "-"
+        else:
+            reference = f"{compared['baseline']:.4f}"
+            ratio = f"x{compared['ratio']:.2f}"
+            status = "RÉGRESSION" if compared["regression"] else "OK"
+        rows.append([name, f"{timings['min']:.4f}", f"{timings['median']:.4f}", reference, ratio, status])
+
+    ReportView().display_table(
+        f"Benchmarks : {arguments.players} joueurs, {arguments.tournaments} tournois",
+        headers, rows
+    )
+    print(f"Résultats écrits dans {arguments.output}")
+
+    regressions = [name for name, compared in comparison.items() if compared["regression"]]
+    if regressions:
+        print(f"{len(regressions)} régression(s) au-delà de {arguments.threshold:.0%} : {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""
+Diagnostics Controller
+
+Displays the instrumentation counters (see managers/instrumentation.py):
+where the time of the previous menu actions went.
+"""
+
+from managers.instrumentation import instrumentation
+from views.main_view import MainView
+from views.report_view import ReportView
+
+
+class DiagnosticsController:
+    """
+    Controller for the diagnostics screen.
+
+    Responsibilities:
+    - Format the instrumentation counters for display
+    - Reset the counters on request
+    """
+
+    def __init__(self):
+        """Initialize controller with its views."""
+        self.view = MainView()
+        self.report_view = ReportView()
+
+    def show_diagnostics(self):
+        """
+        Display the counters, then offer to reset them.
+
+        Shows how to enable instrumentation when it is disabled.
+        """
+        if not instrumentation.enabled:
+            self.view.display_instrumentation_disabled()
+            return
+
+        headers = [
+            "Méthode", "Appels", "Total (s)", "Max (s)", "Lu (Ko)", "Écrit (Ko)"
+        ]
+        rows = [
+            [
+                name,
+                counter["calls"],
+                f"{counter['total_time']:.4f}",
+                f"{counter['max_time']:.4f}",
+                f"{counter['bytes_read'] / 1024:.1f}",
+                f"{counter['bytes_written'] / 1024:.1f}",
+            ]
+            for name, counter in instrumentation.get_counters().items()
+        ]
+        self.report_view.display_table("Diagnostics : compteurs de performance", headers, rows)
+
+        if instrumentation.output_path:
+            self.view.display_instrumentation_output(instrumentation.output_path)
+        if rows and self.view.prompt_for_counters_reset():
+            instrumentation.reset()
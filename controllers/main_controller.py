@@ -9,6 +9,7 @@ from views.main_view import MainView
 from controllers.player_controller import PlayerController
 from controllers.tournament_controller import TournamentController
 from controllers.report_controller import ReportController
+from controllers.diagnostics_controller import DiagnosticsController
 
 
 class MainController:
@@ -51,6 +52,10 @@ class MainController:
             elif choice == "5":
                 self._handle_quit()
                 break
+            elif choice == "6":
+                self._handle_import_players()
+            elif choice == "7":
+                self._handle_show_diagnostics()
             else:
                 self.view.display_validation_error("Choix invalide.")
 
@@ -78,6 +83,16 @@ class MainController:
         controller = ReportController()
         controller.show_reports_menu()
 
+    def _handle_import_players(self):
+        """Handle bulk player import (delegates to PlayerController)."""
+        controller = PlayerController()
+        controller.import_players()
+
+    def _handle_show_diagnostics(self):
+        """Handle performance counters display (delegates to DiagnosticsController)."""
+        controller = DiagnosticsController()
+        controller.show_diagnostics()
+
     def _handle_quit(self):
         """Handle application exit."""
         self.view.display_goodbye_message()
@@ -2,14 +2,35 @@
 Player Controller
 
 Manages player creation and validation logic.
+
+Bulk import:
+    Federation rating lists (CSV or JSONL, 100k+ rows) are streamed row
+    by row: each row is validated with the same rules as a typed player
+    and checked against the national IDs of the stored players and of the
+    rows already accepted. Memory is bounded by that set of national IDs:
+    accepted players are handed to PlayerManager.append_items as they are
+    read (their IDs reserved by chunks of IMPORT_CHUNK_SIZE), which writes
+    them after the stored records in one pass, and only the first
+    IMPORT_ERROR_LIMIT error messages are kept (rejected rows are
+    otherwise only counted).
 """
 
+import csv
+import json
 import re
 from datetime import datetime
 from models.player import Player
 from managers.player_manager import PlayerManager
+from managers.base_manager import DuplicateKeyError
+from managers.record_reader import read_records, clean_field, UnsupportedFormatError
 from views.main_view import MainView
 
+# Error messages kept (and shown) for the rejected rows of an import
+IMPORT_ERROR_LIMIT = 20
+
+# Accepted players given IDs at a time during an import
+IMPORT_CHUNK_SIZE = 1000
+
 
 class PlayerController:
     """
@@ -40,15 +61,18 @@ class PlayerController:
         Workflow:
         1. Prompt user for player data
         2. Validate data
-        3. Generate new ID
-        4. Create Player object
-        5. Save to storage
-        6. Display success message
+        3. Check the national ID is not already used
+        4. Generate new ID
+        5. Create Player object
+        6. Save to storage
+        7. Display success message
         """
         while True:
             player_data = self.view.prompt_for_new_player()
             
             error = self._validate_player_data(player_data)
+            if error is None and self.player_manager.get_by_national_id(player_data["national_id"]):
+                error = self._duplicate_national_id_message(player_data["national_id"])
             if error:
                 self.view.display_validation_error(error)
                 continue
@@ -63,11 +87,147 @@ class PlayerController:
                 player_id=new_id
             )
             
-            self.player_manager.add_item(player)
+            try:
+                self.player_manager.add_item(player)
+            except DuplicateKeyError:
+                # Added by another process since the check above
+                self.view.display_validation_error(
+                    self._duplicate_national_id_message(player.national_id)
+                )
+                continue
             
             self.view.create_player_message(player.last_name, player.first_name)
             break
 
+    def import_players(self):
+        """
+        Orchestrate the bulk import workflow.
+        
+        Workflow:
+        1. Prompt user for the file path
+        2. Import the file (see import_players_from_file)
+        3. Display the summary, with the rejected rows
+        """
+        file_path = self.view.prompt_for_players_file()
+        try:
+            summary = self.import_players_from_file(file_path)
+        except UnsupportedFormatError as error:
+            self.view.display_validation_error(str(error))
+            return
+        except OSError as error:
+            self.view.display_validation_error(
+                f"Lecture impossible de {file_path} : {error.strerror}."
+            )
+            return
+        except csv.Error as error:
+            self.view.display_validation_error(f"Fichier CSV invalide : {error}.")
+            return
+        except json.JSONDecodeError as error:
+            self.view.display_validation_error(
+                f"Import annulé : fichier des joueurs illisible ({error})."
+            )
+            return
+
+        self.view.display_players_import_summary(
+            summary["imported"], summary["duplicates"], summary["rejected"], summary["errors"]
+        )
+
+    def import_players_from_file(self, file_path):
+        """
+        Import every valid, new player of a CSV or JSONL file.
+        
+        Rows use the fields last_name, first_name, date_of_birth and
+        national_id. A row is rejected if it fails _validate_player_data;
+        it is skipped as a duplicate if its national_id belongs to an
+        existing player or to an earlier row of the file.
+        
+        Args:
+            file_path (str): CSV or JSONL file
+        
+        Returns:
+            dict: Keys 'imported' (number of new players), 'duplicates'
+                  (number of rows skipped), 'rejected' (number of invalid
+                  rows) and 'errors' (messages of the first
+                  IMPORT_ERROR_LIMIT rejected rows)
+        
+        Raises:
+            UnsupportedFormatError: If the file is neither CSV nor JSONL
+            OSError: If the file cannot be read
+            json.JSONDecodeError: If the stored players file is corrupted
+                                  (nothing is imported)
+        """
+        summary = {"imported": 0, "duplicates": 0, "rejected": 0, "errors": []}
+        summary["imported"] = self.player_manager.append_items(
+            self._iter_imported_players(file_path, summary)
+        )
+        return summary
+
+    def _iter_imported_players(self, file_path, summary):
+        """
+        Generate the valid, new players of an import file, with their IDs.
+        
+        IDs are reserved by chunks of IMPORT_CHUNK_SIZE players, so only
+        one chunk of players is held at a time.
+        
+        Args:
+            file_path (str): CSV or JSONL file
+            summary (dict): Import summary; its 'duplicates', 'rejected'
+                            and 'errors' entries are updated as rows are read
+        
+        Yields:
+            Player: New players, numbered
+        """
+        known_national_ids = {player.national_id for player in self.player_manager.iter_items()}
+        
+        chunk = []
+        for line_number, record in read_records(file_path):
+            if record is None:
+                error = "objet JSON invalide."
+            else:
+                player_data = {
+                    field: str(clean_field(record.get(field)) or "")
+                    for field in ("last_name", "first_name", "date_of_birth", "national_id")
+                }
+                error = self._validate_player_data(player_data)
+            if error:
+                summary["rejected"] += 1
+                if len(summary["errors"]) < IMPORT_ERROR_LIMIT:
+                    summary["errors"].append(f"Ligne {line_number} : {error}")
+                continue
+
+            national_id = player_data["national_id"]
+            if national_id in known_national_ids:
+                summary["duplicates"] += 1
+                continue
+            known_national_ids.add(national_id)
+
+            chunk.append(Player(
+                last_name=player_data["last_name"].upper(),
+                first_name=player_data["first_name"].capitalize(),
+                date_of_birth=player_data["date_of_birth"],
+                national_id=national_id
+            ))
+            if len(chunk) == IMPORT_CHUNK_SIZE:
+                yield from self._number_players(chunk)
+                chunk = []
+
+        yield from self._number_players(chunk)
+
+    def _number_players(self, players):
+        """
+        Give new players a block of reserved IDs.
+        
+        Args:
+            players (list): Players without IDs
+        
+        Returns:
+            list: The same players, numbered
+        """
+        if players:
+            for player, player_id in zip(players, self.player_manager.reserve_ids(len(players))):
+                player.player_id = player_id
+        return players
+
     # ========================================
     # VALIDATION
     # ========================================
@@ -102,3 +262,16 @@ class PlayerController:
             )
         
         return None
+
+    @staticmethod
+    def _duplicate_national_id_message(national_id):
+        """
+        Build the error shown when a national ID is already used.
+        
+        Args:
+            national_id (str): The duplicated federation ID
+        
+        Returns:
+            str: Error message
+        """
+        return f"Un joueur avec l'ID national {national_id} existe déjà."
@@ -1,16 +1,42 @@
 """
 Report Controller
 
-Manages report generation and display.
+Manages report generation, display and export.
 Prepares data from managers and formats it for views.
 """
 
+import json
+
 from managers.player_manager import PlayerManager
 from managers.tournament_manager import TournamentManager
+from managers.rating_manager import RatingManager
+from managers.record_reader import UnsupportedFormatError
+from managers.report_exporter import ReportExporter
 from views.main_view import MainView
 from views.report_view import ReportView
 from controllers.tournament_controller import TournamentController
 
+# Report columns: (export field name, displayed header)
+PLAYER_COLUMNS = [
+    ("player_id", "ID"),
+    ("last_name", "Nom"),
+    ("first_name", "Prénom"),
+    ("date_of_birth", "Date Naissance"),
+    ("national_id", "ID Echecs"),
+]
+TOURNAMENT_COLUMNS = [
+    ("tournament_id", "ID"),
+    ("name", "Nom du Tournoi"),
+    ("location", "Lieu"),
+    ("start_date", "Début"),
+    ("end_date", "Fin"),
+]
+TOURNAMENT_PLAYER_COLUMNS = [
+    ("last_name", "Nom"),
+    ("first_name", "Prénom"),
+    ("national_id", "ID Echecs"),
+]
+
 
 class ReportController:
     """
@@ -21,6 +47,7 @@ class ReportController:
     - Load data from managers
     - Format data for display
     - Delegate display to views
+    - Export reports to files
     
     Following Principle #2: Autonomous components
     Following Principle #4: Single responsibility (only handles reports)
@@ -31,8 +58,10 @@ class ReportController:
         """Initialize controller with its dependencies."""
         self.player_manager = PlayerManager()
         self.tournament_manager = TournamentManager()
+        self.rating_manager = RatingManager(tournament_manager=self.tournament_manager)
         self.view = MainView()
         self.report_view = ReportView()
+        self.exporter = ReportExporter()
         self.tournament_controller = TournamentController()
         self.tournament_controller.set_report_controller(self)
 
@@ -59,6 +88,10 @@ class ReportController:
                 self.display_tournament_rounds_report()
             elif choice == "6":
                 break
+            elif choice == "7":
+                self.display_ratings_report()
+            elif choice == "8":
+                self.export_report()
             else:
                 self.view.display_validation_error("Choix invalide.")
 
@@ -73,8 +106,8 @@ class ReportController:
         Steps:
         1. Load all players
         2. Sort alphabetically by last name, then first name
-        3. Format as table rows
-        4. Send to view for display
+        3. Format as table rows (generated page by page)
+        4. Send to the paginated view
         """
         players = self.player_manager.load_items()
 
@@ -84,73 +117,206 @@ class ReportController:
         )
 
         title = "Liste de Tous les Joueurs"
-        headers = ["ID", "Nom", "Prénom", "Date Naissance", "ID Echecs"]
-        rows = [
-            [p.player_id, p.last_name, p.first_name, p.date_of_birth, p.national_id]
-            for p in sorted_players
-        ]
+        headers = [header for _, header in PLAYER_COLUMNS]
+        rows = (self._player_row(p) for p in sorted_players)
 
-        self.report_view.display_table(title, headers, rows)
+        self.report_view.display_paged_table(title, headers, rows)
 
     def display_all_tournaments_report(self):
         """
         Generate and display a report of all tournaments.
         
         Steps:
-        1. Load all tournaments
+        1. Load the tournament headers (no players or rounds)
         2. Sort by start date
-        3. Format as table rows
-        4. Send to view for display
+        3. Format as table rows (generated page by page)
+        4. Send to the paginated view
         """
-        tournaments = self.tournament_manager.load_items()
+        tournaments = self.tournament_manager.load_headers()
 
         sorted_tournaments = sorted(
             tournaments,
-            key=lambda t: t.start_date
+            key=lambda t: t['start_date']
         )
 
         title = "Liste de Tous les Tournois"
-        headers = ["ID", "Nom du Tournoi", "Lieu", "Début", "Fin"]
-        rows = [
-            [t.tournament_id, t.name, t.location, t.start_date, t.end_date]
-            for t in sorted_tournaments
-        ]
+        headers = [header for _, header in TOURNAMENT_COLUMNS]
+        rows = (self._tournament_row(t) for t in sorted_tournaments)
         
-        self.report_view.display_table(title, headers, rows)
+        self.report_view.display_paged_table(title, headers, rows)
 
-    def display_tournament_players_report(self):
+    def display_ratings_report(self):
         """
-        Generate and display players enrolled in a specific tournament.
+        Generate and display the Elo rating list.
         
         Steps:
-        1. Load all tournaments
-        2. Let user select one
-        3. Sort enrolled players alphabetically
-        4. Format as table rows
-        5. Send to view for display
+        1. Load all players
+        2. Read current ratings from the rating store (no replay)
+        3. Sort by rating (highest first)
+        4. Format as table rows (generated page by page)
+        5. Send to the paginated view
         """
-        tournaments = self.tournament_manager.load_items()
+        players = self.player_manager.load_items()
+        ratings = self.rating_manager.get_ratings()
+        games_played = self.rating_manager.get_games_played()
+        initial_rating = self.rating_manager.initial_rating
         
-        selected_tournament = self.tournament_controller._prompt_user_for_tournament(
-            tournaments
+        sorted_players = sorted(
+            players,
+            key=lambda p: (
+                -ratings.get(p.player_id, initial_rating),
+                p.last_name.lower(), p.first_name.lower()
+            )
+        )
+        
+        title = "Classement Elo des Joueurs"
+        headers = ["Rang", "Nom", "Prénom", "Elo", "Parties"]
+        rows = (
+            [
+                rank, p.last_name, p.first_name,
+                ratings.get(p.player_id, initial_rating),
+                games_played.get(p.player_id, 0)
+            ]
+            for rank, p in enumerate(sorted_players, start=1)
         )
+        
+        self.report_view.display_paged_table(title, headers, rows)
+
+    def display_tournament_players_report(self):
+        """
+        Generate and display players enrolled in a specific tournament.
+        
+        Steps:
+        1. Let user select a tournament
+        2. Sort enrolled players alphabetically
+        3. Format as table rows (generated page by page)
+        4. Send to the paginated view
+        """
+        selected_tournament = self.tournament_controller._prompt_user_for_tournament()
         if selected_tournament is None:
             self.view.display_selection_cancelled()
             return
 
+        title = f"Joueurs Inscrits au Tournoi : {selected_tournament.name}"
+        headers = [header for _, header in TOURNAMENT_PLAYER_COLUMNS]
+        rows = self._tournament_player_rows(selected_tournament)
+
+        self.report_view.display_paged_table(title, headers, rows)
+
+    # ========================================
+    # EXPORT
+    # ========================================
+
+    def export_report(self):
+        """
+        Export a report to a CSV, JSONL or HTML file.
+        
+        Steps:
+        1. Let user choose the report (and the tournament, if needed)
+        2. Prompt for the destination file (its extension sets the format)
+        3. Stream the rows to the file
+        4. Display the number of rows written
+        
+        The full player and tournament lists are exported in storage order
+        (by ID), read one item at a time (BaseManager.iter_items and
+        TournamentManager.iter_headers): sorting them would need the whole
+        archive in memory.
+        """
+        choice = self.view.display_export_menu()
+        if choice == "1":
+            title, columns = "Liste de Tous les Joueurs", PLAYER_COLUMNS
+            rows = (self._player_row(p) for p in self.player_manager.iter_items())
+        elif choice == "2":
+            title, columns = "Liste de Tous les Tournois", TOURNAMENT_COLUMNS
+            rows = (self._tournament_row(t) for t in self.tournament_manager.iter_headers())
+        elif choice == "3":
+            selected_tournament = self.tournament_controller._prompt_user_for_tournament()
+            if selected_tournament is None:
+                self.view.display_selection_cancelled()
+                return
+            title = f"Joueurs Inscrits au Tournoi : {selected_tournament.name}"
+            columns = TOURNAMENT_PLAYER_COLUMNS
+            rows = self._tournament_player_rows(selected_tournament)
+        elif choice == "0":
+            self.view.display_selection_cancelled()
+            return
+        else:
+            self.view.display_validation_error("Choix invalide.")
+            return
+
+        file_path = self.view.prompt_for_export_file()
+        if not file_path:
+            self.view.display_selection_cancelled()
+            return
+
+        try:
+            count = self.exporter.export(file_path, title, columns, rows)
+        except UnsupportedFormatError as error:
+            self.view.display_validation_error(str(error))
+            return
+        except OSError as error:
+            self.view.display_validation_error(
+                f"Écriture impossible de {file_path} : {error.strerror}."
+            )
+            return
+        except json.JSONDecodeError as error:
+            self.view.display_validation_error(f"Fichier de données illisible : {error}.")
+            return
+
+        self.view.display_export_summary(count, file_path)
+
+    # ========================================
+    # ROW FORMATTING
+    # ========================================
+
+    @staticmethod
+    def _player_row(player):
+        """
+        Format a player as a row of PLAYER_COLUMNS.
+        
+        Args:
+            player (Player): Player to format
+        
+        Returns:
+            list: Row values
+        """
+        return [
+            player.player_id, player.last_name, player.first_name,
+            player.date_of_birth, player.national_id
+        ]
+
+    @staticmethod
+    def _tournament_row(tournament):
+        """
+        Format a tournament header as a row of TOURNAMENT_COLUMNS.
+        
+        Args:
+            tournament (dict): Header from TournamentManager.iter_headers
+        
+        Returns:
+            list: Row values
+        """
+        return [tournament[key] for key, _ in TOURNAMENT_COLUMNS]
+
+    @staticmethod
+    def _tournament_player_rows(tournament):
+        """
+        Generate the rows of a tournament's players, alphabetically.
+        
+        Args:
+            tournament (Tournament): Tournament whose players are listed
+        
+        Returns:
+            generator: Rows of TOURNAMENT_PLAYER_COLUMNS
+        """
         sorted_players = sorted(
-            selected_tournament.players,
+            tournament.players,
             key=lambda p: (p.last_name.lower(), p.first_name.lower())
         )
-
-        title = f"Joueurs Inscrits au Tournoi : {selected_tournament.name}"
-        headers = ["Nom", "Prénom", "ID Echecs"]
-        rows = [
+        return (
             [p.last_name, p.first_name, p.national_id]
             for p in sorted_players
-        ]
-
-        self.report_view.display_table(title, headers, rows)
+        )
 
     # ========================================
     # PLACEHOLDER REPORTS
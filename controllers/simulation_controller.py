@@ -0,0 +1,305 @@
+"""
+Simulation Controller
+
+Headless tournament simulator for load-testing pairing and persistence.
+
+Generates synthetic players, creates a tournament and plays every round
+through the real TournamentController code paths (_start_new_round,
+_enter_round_results, _generate_next_round), with results supplied by a
+SimulationView instead of the keyboard. All files are written to a
+separate data directory, never to the application's data/.
+
+Measured per round:
+    - pairing: building the round's pairs (pairing engine or greedy routine)
+    - hydration: cold reload of the tournament (cache dropped) with its
+      players and rounds converted to objects, as a new process would
+    - saving: TournamentManager.save_tournament calls
+    - total: creation of the round (pairing, save) plus entry of its
+      results (scores, standings, ratings, save), end to end
+
+Result modes:
+    - "random": first player wins 40%, second player wins 40%, draw 20%
+    - "rating": each synthetic player gets a hidden strength and results
+      follow the Elo expected score (20% of games drawn)
+"""
+
+import os
+import random
+import time
+from datetime import date
+
+from models.player import Player
+from models.tournament import Tournament
+from managers.player_manager import PlayerManager
+from managers.tournament_manager import TournamentManager
+from managers.rating_manager import RatingManager
+from controllers.tournament_controller import TournamentController
+from views.simulation_view import SimulationView
+
+RESULTS_RANDOM = "random"
+RESULTS_RATING = "rating"
+
+DRAW_RATE = 0.2
+
+TIMING_NAMES = ("pairing", "hydration", "saving", "total")
+
+
+class SimulationController:
+    """
+    Controller running a complete tournament without user interaction.
+
+    Attributes:
+        data_dir (str): Directory for all simulation files
+        player_count (int): Number of synthetic players
+        number_of_rounds (int): Rounds to play
+        results_mode (str): RESULTS_RANDOM or RESULTS_RATING
+        random_generator (random.Random): Seeded source of all randomness
+        strengths (dict): Player ID -> hidden strength (rating mode)
+        timings (dict): Round number -> {timing name: seconds}
+    """
+
+    def __init__(
+        self,
+        data_dir,
+        player_count,
+        number_of_rounds=7,
+        results_mode=RESULTS_RANDOM,
+        seed=None,
+        tournament_manager_options=None
+    ):
+        """
+        Initialize the simulation and its isolated managers.
+
+        Args:
+            data_dir (str): Directory for all simulation files
+            player_count (int): Number of synthetic players (at least 2)
+            number_of_rounds (int, optional): Rounds to play. Defaults to 7.
+            results_mode (str, optional): RESULTS_RANDOM (default) or RESULTS_RATING
+            seed (int, optional): Seed making results and round 1 reproducible
+            tournament_manager_options (dict, optional): Extra TournamentManager
+                                                         arguments (storage_mode,
+                                                         layout, columnar, ...)
+        """
+        if player_count < 2:
+            raise ValueError("A simulation needs at least 2 players")
+        if results_mode not in (RESULTS_RANDOM, RESULTS_RATING):
+            raise ValueError(f"Unknown results mode: {results_mode}")
+
+        self.data_dir = data_dir
+        self.player_count = player_count
+        self.number_of_rounds = number_of_rounds
+        self.results_mode = results_mode
+        self.random_generator = random.Random(seed)
+        self.strengths = {}
+        self.timings = {}
+
+        self.player_manager = PlayerManager(
+            file_path=os.path.join(data_dir, "players.json")
+        )
+        self.tournament_manager = TournamentManager(
+            file_path=os.path.join(data_dir, "tournaments", "tournaments.json"),
+            player_manager=self.player_manager,
+            **(tournament_manager_options or {})
+        )
+        self.rating_manager = RatingManager(
+            file_path=os.path.join(data_dir, "ratings.json"),
+            tournament_manager=self.tournament_manager
+        )
+        self.view = SimulationView(self._choose_result)
+        self.tournament_controller = TournamentController(
+            tournament_manager=self.tournament_manager,
+            player_manager=self.player_manager,
+            rating_manager=self.rating_manager,
+            view=self.view,
+            random_generator=self.random_generator
+        )
+        self.tournament = None
+
+    # ========================================
+    # SIMULATION
+    # ========================================
+
+    def run(self):
+        """
+        Play the whole tournament.
+
+        Returns:
+            dict: Round number -> {timing name: seconds}
+        """
+        players = self._create_players()
+        self.tournament = self._create_tournament(players)
+        self._instrument()
+
+        controller = self.tournament_controller
+        tournament = self.tournament
+
+        start = time.perf_counter()
+        controller._start_new_round(tournament)
+        self._add_timing(1, "total", time.perf_counter() - start)
+        self._measure_hydration()
+
+        while tournament.rounds and tournament.rounds[-1].end_date_time is None:
+            round_number = len(tournament.rounds)
+            next_round_total = self._get_timing(round_number + 1, "total")
+            start = time.perf_counter()
+            controller._enter_round_results(tournament)
+            elapsed = time.perf_counter() - start
+
+            # The next round's generation was timed separately (see _instrument)
+            generation = self._get_timing(round_number + 1, "total") - next_round_total
+            self._add_timing(round_number, "total", elapsed - generation)
+            self._measure_hydration()
+
+        return self.timings
+
+    def _create_players(self):
+        """
+        Generate and save the synthetic players in a single write.
+
+        Returns:
+            list: The new Player objects
+        """
+        player_ids = self.player_manager.reserve_ids(self.player_count)
+        players = [
+            Player(
+                last_name=f"JOUEUR{player_id}",
+                first_name="Simulé",
+                date_of_birth="2000-01-01",
+                national_id=f"SM{player_id:05d}",
+                player_id=player_id
+            )
+            for player_id in player_ids
+        ]
+        self.player_manager.save_items(players)
+
+        for player in players:
+            self.strengths[player.player_id] = self.random_generator.gauss(1500, 300)
+        return players
+
+    def _create_tournament(self, players):
+        """
+        Create and save the simulated tournament with every player enrolled.
+
+        Args:
+            players (list): Player objects
+
+        Returns:
+            Tournament: The new tournament
+        """
+        today = date.today().isoformat()
+        tournament = Tournament(
+            name=f"Simulation {self.player_count} joueurs",
+            location="Headless",
+            description=f"Résultats {self.results_mode}",
+            start_date=today,
+            end_date=today,
+            number_of_rounds=self.number_of_rounds,
+            players=list(players),
+            tournament_id=self.tournament_manager.get_next_id()
+        )
+        for player in players:
+            self.tournament_manager.get_player_score(tournament, player.player_id)
+        self.tournament_manager.add_item(tournament)
+        return tournament
+
+    def _choose_result(self, player_a, player_b):
+        """
+        Pick a match result (called by SimulationView).
+
+        Args:
+            player_a (Player): First player
+            player_b (Player): Second player
+
+        Returns:
+            str: "1", "2" or "3"
+        """
+        if self.results_mode == RESULTS_RATING:
+            expected = 1.0 / (1.0 + 10.0 ** (
+                (self.strengths[player_b.player_id] - self.strengths[player_a.player_id]) / 400.0
+            ))
+            win_a = max(0.0, expected - DRAW_RATE / 2)
+            win_b = max(0.0, 1.0 - expected - DRAW_RATE / 2)
+        else:
+            win_a = win_b = (1.0 - DRAW_RATE) / 2
+
+        draw = self.random_generator.random()
+        if draw < win_a:
+            return "1"
+        if draw < win_a + win_b:
+            return "2"
+        return "3"
+
+    # ========================================
+    # TIMING
+    # ========================================
+
+    def _add_timing(self, round_number, name, seconds):
+        """
+        Add time to one bucket of a round.
+
+        Args:
+            round_number (int): 1-based round number
+            name (str): One of TIMING_NAMES
+            seconds (float): Elapsed time
+        """
+        round_timings = self.timings.setdefault(
+            round_number, dict.fromkeys(TIMING_NAMES, 0.0)
+        )
+        round_timings[name] += seconds
+
+    def _get_timing(self, round_number, name):
+        """
+        Read one bucket of a round.
+
+        Args:
+            round_number (int): 1-based round number
+            name (str): One of TIMING_NAMES
+
+        Returns:
+            float: Seconds recorded so far
+        """
+        return self.timings.get(round_number, {}).get(name, 0.0)
+
+    def _instrument(self):
+        """
+        Wrap the pairing and saving methods of this simulation's objects.
+
+        Only the instances created for the simulation are wrapped; the
+        classes are untouched.
+        """
+        tournament = self.tournament
+        controller = self.tournament_controller
+
+        def timed(obj, method_name, timing_name, round_offset):
+            method = getattr(obj, method_name)
+
+            def wrapper(*args, **kwargs):
+                round_number = len(tournament.rounds) + round_offset
+                start = time.perf_counter()
+                try:
+                    return method(*args, **kwargs)
+                finally:
+                    self._add_timing(round_number, timing_name, time.perf_counter() - start)
+
+            setattr(obj, method_name, wrapper)
+
+        # Offsets are taken before the call: a new round is not appended yet
+        if controller.pairing_engine is not None:
+            timed(controller.pairing_engine, "pair_players", "pairing", 1)
+        timed(controller, "_pair_greedy", "pairing", 1)
+        timed(controller, "_generate_next_round", "total", 1)
+        timed(self.tournament_manager, "save_tournament", "saving", 0)
+
+    def _measure_hydration(self):
+        """Time a cold reload of the tournament with its players and rounds."""
+        self.tournament_manager.invalidate_cache()
+        self.player_manager.invalidate_cache()
+
+        start = time.perf_counter()
+        reloaded = self.tournament_manager.get_item_by_id(self.tournament.tournament_id)
+        reloaded.players
+        reloaded.rounds
+        self._add_timing(len(self.tournament.rounds), "hydration", time.perf_counter() - start)
+
+        # Drop the reloaded copy: the simulation goes on with its own object
+        self.tournament_manager.invalidate_cache()
@@ -9,6 +9,16 @@ Swiss System Pairing Algorithm:
     3. Avoid rematches using opponent history
     4. Handle odd players with "bye" (1 point, no match)
     5. Prioritize players who haven't received a bye
+
+Pairing modes:
+    - "matching" (default): all pairings of the round are chosen at once
+      by the PairingEngine (weighted graph matching), which never forces
+      a rematch when a rematch-free pairing exists
+    - "brackets": score groups paired in parallel worker processes,
+      then reconciled (ScoreBracketPairing)
+    - "greedy": top-to-bottom pairing, also the fallback when no
+      rematch-free pairing exists
+    Selected with the CHESS_PAIRING_MODE environment variable.
 """
 
 import re
@@ -16,9 +26,17 @@ import random
 from datetime import datetime
 from models.tournament import Tournament
 from models.round import Round
+from models.match import Match
 from managers.tournament_manager import TournamentManager
 from managers.player_manager import PlayerManager
+from managers.pairing_engine import create_pairing_engine
+from managers.rating_manager import RatingManager
+from managers.result_importer import ResultImporter, ResultImportError
 from views.main_view import MainView
+from views.report_view import ReportView
+
+# Number of players shown per name search when enrolling
+PLAYER_SEARCH_LIMIT = 15
 
 
 class TournamentController:
@@ -38,12 +56,41 @@ class TournamentController:
     Following Principle #5: Business logic in controller, not view
     """
 
-    def __init__(self):
-        """Initialize controller with its dependencies."""
-        self.tournament_manager = TournamentManager()
-        self.player_manager = PlayerManager()
-        self.view = MainView()
+    def __init__(
+        self,
+        tournament_manager=None,
+        player_manager=None,
+        rating_manager=None,
+        view=None,
+        random_generator=None
+    ):
+        """
+        Initialize controller with its dependencies.
+        
+        All dependencies default to the application's; they can be
+        injected to run on other data files or without a console
+        (see SimulationController).
+        
+        Args:
+            tournament_manager (TournamentManager, optional): Tournament storage
+            player_manager (PlayerManager, optional): Player storage
+            rating_manager (RatingManager, optional): Elo rating store
+            view (MainView, optional): View used for prompts and messages
+            random_generator (random.Random, optional): Source of the round 1
+                                                        shuffle (seed it for
+                                                        reproducible pairings)
+        """
+        self.tournament_manager = tournament_manager or TournamentManager()
+        self.player_manager = player_manager or PlayerManager()
+        self.rating_manager = rating_manager or RatingManager(
+            tournament_manager=self.tournament_manager
+        )
+        self.view = view or MainView()
+        self.random_generator = random_generator or random.Random()
+        self.report_view = ReportView()
         self.report_controller = None
+        self.pairing_engine = create_pairing_engine()
+        self.result_importer = ResultImporter()
 
     def set_report_controller(self, report_controller):
         """
@@ -148,9 +195,7 @@ class TournamentController:
         - In progress: Can enter results
         - Finished: Read-only mode
         """
-        tournaments = self.tournament_manager.load_items()
-        
-        selected_tournament = self._prompt_user_for_tournament(tournaments)
+        selected_tournament = self._prompt_user_for_tournament()
         if selected_tournament is None:
             self.view.display_selection_cancelled()
             return
@@ -190,9 +235,16 @@ class TournamentController:
                     self._enter_round_results(selected_tournament)
             
             elif choice == "3":
-                print("\nAffichage des résultats du tournoi... (Pas encore implémenté)")
+                self.display_standings(selected_tournament)
             elif choice == "4":
                 break
+            elif choice == "5":
+                if selected_tournament.rounds and not is_tournament_finished:
+                    self._import_round_results(selected_tournament)
+                else:
+                    self.view.display_validation_error(
+                        "Aucun round en cours : rien à importer."
+                    )
             else:
                 self.view.display_validation_error("Choix invalide. Veuillez réessayer.")
 
@@ -201,32 +253,24 @@ class TournamentController:
         Add a player to a tournament.
         
         Workflow:
-        1. Load all players
-        2. Filter out already enrolled players
-        3. Let user select from available players
-        4. Add Player OBJECT to tournament (not ID)
-        5. Initialize score data via manager
-        6. Save tournament
+        1. Check that some players are not enrolled yet
+        2. Let user search and select a player (enrolled players excluded)
+        3. Add Player OBJECT to tournament (not ID)
+        4. Initialize score data via manager
+        5. Save tournament
         
         Args:
             tournament (Tournament): Tournament to add player to
         """
-        all_players = self.player_manager.load_items()
-        
         enrolled_player_ids = {
             player.player_id for player in tournament.players
         }
         
-        available_players = [
-            player for player in all_players
-            if player.player_id not in enrolled_player_ids
-        ]
-        
-        if not available_players:
+        if self.player_manager.count_items() <= len(enrolled_player_ids):
             self.view.display_all_players_already_enrolled()
             return
 
-        selected_player = self._prompt_user_for_player(available_players)
+        selected_player = self._search_player(enrolled_player_ids)
         if selected_player is None:
             self.view.display_selection_cancelled()
             return
@@ -235,12 +279,7 @@ class TournamentController:
         
         self.tournament_manager.get_player_score(tournament, selected_player.player_id)
         
-        all_tournaments = self.tournament_manager.load_items()
-        for i, t in enumerate(all_tournaments):
-            if t.tournament_id == tournament.tournament_id:
-                all_tournaments[i] = tournament
-                break
-        self.tournament_manager.save_items(all_tournaments)
+        self.tournament_manager.save_tournament(tournament)
         
         player_name = f"{selected_player.first_name} {selected_player.last_name}"
         self.view.display_player_added_to_tournament(player_name, tournament.name)
@@ -274,28 +313,20 @@ class TournamentController:
             return
 
         players_list = list(tournament.players)
-        random.shuffle(players_list)
+        self.random_generator.shuffle(players_list)
 
         matches = []
         for i in range(0, len(players_list), 2):
             if i + 1 == len(players_list):
                 # Odd number: give bye to last player
                 player = players_list[i]
-                self.tournament_manager.add_points_to_player(
-                    tournament, player.player_id, 1.0
-                )
-                self.tournament_manager.add_opponent_to_player(
-                    tournament, player.player_id, -1
-                )
+                self._award_bye(tournament, player)
                 break
     
             player1 = players_list[i]
             player2 = players_list[i+1]
             
-            matches.append((
-                [player1, 0.0],
-                [player2, 0.0]
-            ))
+            matches.append(Match(player1, player2))
 
         new_round_id = self._get_next_round_id()
         round_name = f"Round {len(tournament.rounds) + 1}"
@@ -308,13 +339,7 @@ class TournamentController:
 
         tournament.rounds.append(new_round)
         
-        all_tournaments = self.tournament_manager.load_items()
-        for i, t in enumerate(all_tournaments):
-            if t.tournament_id == tournament.tournament_id:
-                all_tournaments[i] = tournament
-                break
-        
-        self.tournament_manager.save_items(all_tournaments)
+        self.tournament_manager.save_tournament(tournament)
         self.view.display_round_started(new_round.name, len(matches))
 
     # ========================================
@@ -328,73 +353,114 @@ class TournamentController:
         Workflow:
         1. Validate round exists and not yet completed
         2. For each match, prompt for result
-        3. Update player scores via manager
-        4. Update opponent history via manager
-        5. Mark round as complete
-        6. Save tournament
-        7. Generate next round OR display tournament finished
+        3. Apply and save all results (see _apply_round_results)
         
         Args:
             tournament (Tournament): Tournament with matches to record
         """
-        if not tournament.rounds:
-            self.view.display_validation_error("Erreur : Aucun round n'a été lancé.")
+        current_round = self._get_open_round(tournament)
+        if current_round is None:
             return
-        
-        current_round = tournament.rounds[-1]
 
-        if current_round.end_date_time is not None:
-            self.view.display_validation_error(
-                f"Les résultats pour le {current_round.name} ont déjà été saisis."
-            )
-            return
-
-        updated_matches = []
-        
-        for match_tuple in current_round.matches:
-            player_a = match_tuple[0][0]
-            player_b = match_tuple[1][0]
-                
+        scores = []
+        for match in current_round.matches:
             while True:
-                result_str = self.view.prompt_for_match_result(player_a, player_b)
+                result_str = self.view.prompt_for_match_result(match.white, match.black)
                 if result_str not in ["1", "2", "3"]:
                     self.view.display_validation_error("Veuillez entrer 1, 2, ou 3.")
                 else:
                     break
             
             if result_str == "1":
-                score_a, score_b = 1.0, 0.0
+                scores.append((1.0, 0.0))
             elif result_str == "2":
-                score_a, score_b = 0.0, 1.0
+                scores.append((0.0, 1.0))
             else:
-                score_a, score_b = 0.5, 0.5
+                scores.append((0.5, 0.5))
 
-            self.tournament_manager.add_points_to_player(
-                tournament, player_a.player_id, score_a
-            )
-            self.tournament_manager.add_points_to_player(
-                tournament, player_b.player_id, score_b
-            )
-            
-            self.tournament_manager.add_opponent_to_player(
-                tournament, player_a.player_id, player_b.player_id
+        self._apply_round_results(tournament, scores)
+
+    def _import_round_results(self, tournament):
+        """
+        Record the current round's results from a CSV or JSONL file.
+        
+        The whole file is validated first (see ResultImporter): if any
+        board is wrong or missing, every problem is displayed and nothing
+        is recorded, so the file can be fixed and imported again.
+        
+        Args:
+            tournament (Tournament): Tournament with matches to record
+        """
+        current_round = self._get_open_round(tournament)
+        if current_round is None:
+            return
+
+        file_path = self.view.prompt_for_results_file()
+        try:
+            scores = self.result_importer.read_round_results(current_round, file_path)
+        except ResultImportError as error:
+            self.view.display_results_import_errors(error.errors)
+            return
+
+        self._apply_round_results(tournament, scores)
+
+    def _get_open_round(self, tournament):
+        """
+        Get the round waiting for its results.
+        
+        Args:
+            tournament (Tournament): The tournament
+        
+        Returns:
+            Round: The last round if its results are not entered yet,
+                   None otherwise (an error is displayed)
+        """
+        if not tournament.rounds:
+            self.view.display_validation_error("Erreur : Aucun round n'a été lancé.")
+            return None
+        
+        current_round = tournament.rounds[-1]
+
+        if current_round.end_date_time is not None:
+            self.view.display_validation_error(
+                f"Les résultats pour le {current_round.name} ont déjà été saisis."
             )
-            self.tournament_manager.add_opponent_to_player(
-                tournament, player_b.player_id, player_a.player_id
+            return None
+        return current_round
+
+    def _apply_round_results(self, tournament, scores):
+        """
+        Record all results of the current round and close it.
+        
+        Workflow:
+        1. Update player scores, opponent history and standings via manager
+        2. Update the columnar match store (if built)
+        3. Mark round as complete
+        4. Save tournament (once) and update Elo ratings
+        5. Generate next round OR display tournament finished
+        
+        Args:
+            tournament (Tournament): The tournament
+            scores (list): (score_a, score_b) for each match of the
+                           current round, in order
+        """
+        current_round = tournament.rounds[-1]
+        round_index = len(tournament.rounds) - 1
+        for match, (score_a, score_b) in zip(current_round.matches, scores):
+            self.tournament_manager.record_match_result(
+                tournament, round_index,
+                match.white.player_id, match.black.player_id, score_a, score_b
             )
             
-            updated_matches.append(([player_a, score_a], [player_b, score_b]))
+            match.white_score = score_a
+            match.black_score = score_b
 
-        current_round.matches = updated_matches
         current_round.end_date_time = datetime.now().isoformat()
         tournament.current_round += 1
+        self.tournament_manager.add_round_to_match_columns(tournament, current_round)
 
-        all_tournaments = self.tournament_manager.load_items()
-        for i, t in enumerate(all_tournaments):
-            if t.tournament_id == tournament.tournament_id:
-                all_tournaments[i] = tournament
-                break
-        self.tournament_manager.save_items(all_tournaments)
+        self.tournament_manager.save_tournament(tournament)
+        self.rating_manager.update_with_round(current_round)
 
         self.view.display_results_saved(current_round.name)
         
@@ -403,6 +469,57 @@ class TournamentController:
         else:
             self.view.display_tournament_finished()
 
+    # ========================================
+    # STANDINGS
+    # ========================================
+
+    def display_standings(self, tournament):
+        """
+        Display the tournament ranking with its tiebreaks.
+        
+        Standings come from the manager's StandingsEngine, which is kept
+        up to date as results are entered (no re-sort at display time).
+        
+        Args:
+            tournament (Tournament): Tournament to display
+        """
+        standings = self.tournament_manager.get_standings(tournament)
+        players_by_id = {player.player_id: player for player in tournament.players}
+        
+        title = f"Classement du Tournoi : {tournament.name}"
+        headers = [
+            "Rang", "Nom", "Prénom", "Points", "Buchholz",
+            "Buchholz Cut-1", "Sonneborn-Berger", "Progressif"
+        ]
+        rows = self._standings_rows(standings, players_by_id)
+        
+        self.report_view.display_paged_table(title, headers, rows)
+
+    @staticmethod
+    def _standings_rows(standings, players_by_id):
+        """
+        Generate the standings table rows, one player at a time.
+        
+        Args:
+            standings (StandingsEngine): The tournament's standings
+            players_by_id (dict): Player ID -> Player
+        
+        Yields:
+            list: Rank, names, points and tiebreaks of a player
+        """
+        for entry in standings.iter_top():
+            player = players_by_id.get(entry["player_id"])
+            yield [
+                entry["rank"],
+                player.last_name if player else "?",
+                player.first_name if player else "?",
+                entry["points"],
+                entry["buchholz"],
+                entry["buchholz_cut1"],
+                entry["sonneborn_berger"],
+                entry["progressive"],
+            ]
+
     # ========================================
     # SWISS PAIRING ALGORITHM
     # ========================================
@@ -413,11 +530,13 @@ class TournamentController:
         
         Swiss System Algorithm:
         1. Get all players with their scores and opponent history
-        2. Sort players by score (highest first)
-        3. Pair players from top to bottom:
-           - Try to pair with next unpaired player
-           - Skip if they've already played each other
-           - Force pairing if no valid opponent (rematch as last resort)
+        2. Sort players by score, then Elo rating (highest first)
+        3. Pair players (matching or brackets mode):
+           - Minimize score differences over the whole round
+           - Never pair players who have already played each other
+           - Choose the bye among players who haven't had one
+           Falls back to greedy pairing if no rematch-free pairing exists
+           (see _pair_greedy).
         4. Handle odd player with bye:
            - Prioritize players who haven't had a bye (-1 in history)
            - Give 1 point and mark -1 in opponent history
@@ -438,10 +557,64 @@ class TournamentController:
                 'opponents': score_data['opponents_history']
             })
         
-        # Step 2: Sort by score (highest first)
-        players_with_scores.sort(key=lambda x: x['score'], reverse=True)
+        # Step 2: Sort by score, then rating (highest first)
+        ratings = self.rating_manager.get_ratings()
+        initial_rating = self.rating_manager.initial_rating
+        players_with_scores.sort(
+            key=lambda x: (x['score'], ratings.get(x['player'].player_id, initial_rating)),
+            reverse=True
+        )
         
         # Step 3: Create pairings
+        pairing = None
+        if self.pairing_engine is not None:
+            pairing = self.pairing_engine.pair_players(players_with_scores)
+        
+        if pairing is not None:
+            pairs, bye_player = pairing
+            matches = [Match(player_a, player_b) for player_a, player_b in pairs]
+            
+            # Step 4: Bye chosen by the engine
+            if bye_player:
+                self._award_bye(tournament, bye_player)
+        else:
+            matches, paired_player_ids = self._pair_greedy(players_with_scores)
+            
+            # Step 4: Handle bye if odd number of players
+            if len(paired_player_ids) < len(tournament.players):
+                self._assign_bye(
+                    tournament, players_with_scores, paired_player_ids
+                )
+        
+        # Step 5: Create and save round
+        new_round_id = self._get_next_round_id()
+        round_name = f"Round {len(tournament.rounds) + 1}"
+        
+        new_round = Round(
+            name=round_name,
+            matches=matches,
+            round_id=new_round_id
+        )
+        
+        tournament.rounds.append(new_round)
+        
+        self.tournament_manager.save_tournament(tournament)
+        self.view.display_round_started(new_round.name, len(matches))
+
+    def _pair_greedy(self, players_with_scores):
+        """
+        Pair players from top to bottom (greedy Swiss pairing).
+        
+        - Try to pair with next unpaired player
+        - Skip if they've already played each other
+        - Force pairing if no valid opponent (rematch as last resort)
+        
+        Args:
+            players_with_scores (list): List of player data dicts, sorted by score
+        
+        Returns:
+            tuple: (list of Match objects, set of paired player IDs)
+        """
         matches = []
         paired_player_ids = set()
         
@@ -462,7 +635,7 @@ class TournamentController:
                 player_b = candidate_data['player']
                 
                 if player_b.player_id not in player_data['opponents']:
-                    matches.append(([player_a, 0.0], [player_b, 0.0]))
+                    matches.append(Match(player_a, player_b))
                     paired_player_ids.add(player_a.player_id)
                     paired_player_ids.add(player_b.player_id)
                     opponent_found = True
@@ -477,37 +650,12 @@ class TournamentController:
                         continue
                     
                     player_b = candidate_data['player']
-                    matches.append(([player_a, 0.0], [player_b, 0.0]))
+                    matches.append(Match(player_a, player_b))
                     paired_player_ids.add(player_a.player_id)
                     paired_player_ids.add(player_b.player_id)
                     break
         
-        # Step 4: Handle bye if odd number of players
-        if len(paired_player_ids) < len(tournament.players):
-            self._assign_bye(
-                tournament, players_with_scores, paired_player_ids
-            )
-        
-        # Step 5: Create and save round
-        new_round_id = self._get_next_round_id()
-        round_name = f"Round {len(tournament.rounds) + 1}"
-        
-        new_round = Round(
-            name=round_name,
-            matches=matches,
-            round_id=new_round_id
-        )
-        
-        tournament.rounds.append(new_round)
-        
-        all_tournaments = self.tournament_manager.load_items()
-        for i, t in enumerate(all_tournaments):
-            if t.tournament_id == tournament.tournament_id:
-                all_tournaments[i] = tournament
-                break
-        
-        self.tournament_manager.save_items(all_tournaments)
-        self.view.display_round_started(new_round.name, len(matches))
+        return matches, paired_player_ids
 
     def _assign_bye(self, tournament, players_with_scores, paired_player_ids):
         """
@@ -525,27 +673,29 @@ class TournamentController:
             if player_data['player'].player_id not in paired_player_ids:
                 if -1 not in player_data['opponents']:
                     bye_player = player_data['player']
-                    self.tournament_manager.add_points_to_player(
-                        tournament, bye_player.player_id, 1.0
-                    )
-                    self.tournament_manager.add_opponent_to_player(
-                        tournament, bye_player.player_id, -1
-                    )
+                    self._award_bye(tournament, bye_player)
                     paired_player_ids.add(bye_player.player_id)
                     return
         
         # If all have had bye, give to first unpaired
         for player_data in players_with_scores:
             if player_data['player'].player_id not in paired_player_ids:
-                bye_player = player_data['player']
-                self.tournament_manager.add_points_to_player(
-                    tournament, bye_player.player_id, 1.0
-                )
-                self.tournament_manager.add_opponent_to_player(
-                    tournament, bye_player.player_id, -1
-                )
+                self._award_bye(tournament, player_data['player'])
                 break
 
+    def _award_bye(self, tournament, bye_player):
+        """
+        Give a bye in the round being created: 1 point and -1 recorded
+        in the opponent history.
+        
+        Args:
+            tournament (Tournament): The tournament
+            bye_player (Player): Player receiving the bye
+        """
+        self.tournament_manager.record_bye(
+            tournament, bye_player.player_id, len(tournament.rounds)
+        )
+
     # ========================================
     # HELPER METHODS
     # ========================================
@@ -557,29 +707,21 @@ class TournamentController:
         Returns:
             int: Next available round ID
         """
-        all_tournaments = self.tournament_manager.load_items()
-        all_round_ids = []
-        
-        for t in all_tournaments:
-            for r in t.rounds:
-                if r.round_id:
-                    all_round_ids.append(r.round_id)
-        
-        max_id = max(all_round_ids) if all_round_ids else 0
-        return max_id + 1
+        return self.tournament_manager.get_next_round_id()
 
-    def _prompt_user_for_tournament(self, tournaments):
+    def _prompt_user_for_tournament(self):
         """
         Display tournament selection menu and get user choice.
         
-        Args:
-            tournaments (list): List of Tournament objects
+        The menu is built from the tournament headers (the manifest only,
+        with the sharded layout); only the chosen tournament is loaded.
         
         Returns:
             Tournament: Selected tournament, or None if cancelled
         """
+        tournaments = self.tournament_manager.load_headers()
         items_as_strings = [
-            f"{i}. {t.name} (ID: {t.tournament_id})"
+            f"{i}. {t['name']} (ID: {t['tournament_id']})"
             for i, t in enumerate(tournaments, 1)
         ]
             
@@ -600,42 +742,49 @@ class TournamentController:
             if choice_int == 0:
                 return None
             if 1 <= choice_int <= len(tournaments):
-                return tournaments[choice_int - 1]
+                return self.tournament_manager.get_item_by_id(
+                    tournaments[choice_int - 1]['tournament_id']
+                )
             else:
                 self.view.display_validation_error("Ce numéro n'est pas dans la liste.")
 
-    def _prompt_user_for_player(self, players):
+    def _search_player(self, excluded_player_ids):
         """
-        Display player selection menu and get user choice.
+        Let the user find a player by name and select them.
+        
+        Each search shows the best PLAYER_SEARCH_LIMIT matches (accents
+        and case ignored, name starts are enough: "dup je" finds Jean
+        DUPONT). The user picks a number, or types another search to
+        refine it.
         
         Args:
-            players (list): List of Player objects
+            excluded_player_ids (set): IDs never offered (already enrolled)
         
         Returns:
             Player: Selected player, or None if cancelled
         """
-        items_as_strings = [
-            f"{i}. {p.last_name} {p.first_name} (ID: {p.player_id})"
-            for i, p in enumerate(players, 1)
-        ]
-
-        if not self.view.display_selection_list(
-            "Sélectionner un Joueur", items_as_strings
-        ):
-            return None
-
+        query = self.view.prompt_for_player_search()
         while True:
-            choice_str = self.view.prompt_for_choice()
-            
-            if not choice_str.isdigit():
-                self.view.display_validation_error("Veuillez entrer un numéro valide.")
-                continue
-
-            choice_int = int(choice_str)
-            
-            if choice_int == 0:
+            if query in ("", "0"):
                 return None
-            if 1 <= choice_int <= len(players):
-                return players[choice_int - 1]
-            else:
+
+            players = self.player_manager.search_items(
+                query, limit=PLAYER_SEARCH_LIMIT, exclude_ids=excluded_player_ids
+            )
+            items_as_strings = [
+                f"{i}. {p.last_name} {p.first_name} "
+                f"(ID national : {p.national_id}, né(e) le {p.date_of_birth})"
+                for i, p in enumerate(players, 1)
+            ]
+            self.view.display_selection_list(
+                f"Joueurs correspondant à « {query} »", items_as_strings
+            )
+
+            answer = self.view.prompt_for_player_choice_or_search()
+            if answer.isdigit() and answer != "0":
+                choice_int = int(answer)
+                if 1 <= choice_int <= len(players):
+                    return players[choice_int - 1]
                 self.view.display_validation_error("Ce numéro n'est pas dans la liste.")
+                continue
+            query = answer
@@ -3,17 +3,49 @@ Chess Tournament Management Application
 
 Main entry point for the application.
 Creates and runs the main controller.
+
+Options:
+    --instrument: record performance counters (see managers/instrumentation.py),
+                  also enabled by CHESS_INSTRUMENT=1
+    --instrument-output PATH: JSON file receiving the counters at exit
 """
 
+import argparse
+
 from controllers.main_controller import MainController
+from managers.instrumentation import instrumentation
+
+
+def parse_arguments():
+    """
+    Read the command line options.
+    
+    Returns:
+        argparse.Namespace: Parsed options
+    """
+    parser = argparse.ArgumentParser(description="Gestionnaire de tournois d'échecs")
+    parser.add_argument(
+        "--instrument", action="store_true", default=None,
+        help="active les compteurs de performance"
+    )
+    parser.add_argument(
+        "--instrument-output", default=None,
+        help="fichier JSON des compteurs, écrit à la fermeture"
+    )
+    return parser.parse_args()
 
 
 def main():
     """
     Application entry point.
     
-    Creates the main controller and starts the application loop.
+    Enables instrumentation if requested, then creates the main
+    controller and starts the application loop.
     """
+    arguments = parse_arguments()
+    instrumentation.configure(
+        enabled=arguments.instrument, output_path=arguments.instrument_output
+    )
     app = MainController()
     app.run()
 
@@ -9,10 +9,117 @@ the file path, model class, and ID attribute name.
 Data Flow:
     Load:  JSON file -> Python dict -> Model object (hydration)
     Save:  Model object -> Python dict -> JSON file (dehydration)
+
+Caching:
+    Hydrated objects are kept in an in-process identity map shared by every
+    manager working on the same file. The file is only re-read when its
+    modification time or size changes, so repeated lookups during one menu
+    action cost a single parse.
+
+Storage modes:
+    "json"    - (default) every write rewrites the whole JSON file
+    "journal" - inserts and updates are appended as JSON lines to a journal
+                file next to the JSON file; both are merged on load and the
+                journal is folded back into the JSON file (compaction) once
+                it grows past a size threshold, or on demand
+
+Unique secondary indexes:
+    A child manager lists fields that must be unique across items in
+    `unique_fields` (e.g., PlayerManager: national_id). Each field gets an
+    index value -> item, kept in the shared cache next to the primary-key
+    index: built once per file load (or from the items of save_items), then
+    updated in place by every upsert. Lookups are O(1) (get_by_unique) and
+    writes that would create a duplicate raise DuplicateKeyError.
+
+Name search:
+    Fields listed in `search_fields` (e.g., last and first names) get a
+    NameSearchIndex (accent-insensitive prefix and trigram search), also
+    kept in the shared cache: built on the first search after a file
+    load, then updated in place by every upsert (see search_items).
+
+Streaming:
+    iter_items() hands out the items one at a time, for exports of the
+    whole collection in constant memory: when the cache is cold the
+    records are decoded from storage one by one (see _iter_data) and
+    are not kept in the identity map. append_items() is the write
+    counterpart, for bulk imports: new items are stored as they come
+    (see _append_records), without loading the stored ones.
+
+Storage backends:
+    A manager can hand its raw storage hooks (_load_data, _iter_data,
+    _save_data, _write_record, _file_signature) to another manager, the storage
+    backend (e.g., SqliteManager). Hydration, caching and business logic
+    stay in the manager itself.
 """
 
+import itertools
 import json
 import os
+import threading
+
+from managers.sequence_manager import SequenceManager
+from managers.name_search import NameSearchIndex
+from managers.record_reader import iter_json_array
+
+STORAGE_JSON = "json"
+STORAGE_JOURNAL = "journal"
+
+# Journal size (bytes) above which compaction is triggered
+DEFAULT_JOURNAL_THRESHOLD = 1024 * 1024
+
+# Same layout as json.dump(..., indent=4), one array element at a time
+_RECORD_ENCODER = json.JSONEncoder(indent=4, ensure_ascii=False)
+
+
+class DuplicateKeyError(ValueError):
+    """
+    Raised when a write would give two items the same unique field value.
+
+    Attributes:
+        field (str): Name of the unique field
+        value: Duplicated value
+        existing_id (int): ID of the item already using the value
+    """
+
+    def __init__(self, field, value, existing_id):
+        super().__init__(f"Duplicate {field} {value!r} (already used by item {existing_id})")
+        self.field = field
+        self.value = value
+        self.existing_id = existing_id
+
+
+class _CacheEntry:
+    """
+    Hydrated items of one storage file, tagged with the file signature
+    they were built from.
+
+    The entry may be partial: after a load restricted to some IDs, only
+    those items are in the index and `items` stays None until a full load.
+
+    Attributes:
+        signature (tuple): File signature at load time (see _file_signature)
+        items (list): All hydrated model instances in file order, or None
+                      if only some items were loaded
+        index (dict): Primary-key index, item ID -> model instance
+        unique_indexes (dict): Unique field -> (value -> model instance,
+                               item ID -> value), or None until built
+                               from a full load
+        search_index (NameSearchIndex): Index over the search fields, or
+                                        None until the first search
+        hits (int): Number of loads served from memory
+        misses (int): Number of loads that had to re-read the file
+        lock (threading.RLock): Serializes writes and journal compaction
+    """
+
+    def __init__(self):
+        self.signature = None
+        self.items = None
+        self.index = {}
+        self.unique_indexes = None
+        self.search_index = None
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.RLock()
 
 
 class BaseManager:
@@ -26,9 +133,39 @@ class BaseManager:
         file_path (str): Path to the JSON storage file
         model_class (class): The model class to instantiate (e.g., Player, Tournament)
         id_attribute_name (str): Name of the ID field (e.g., "player_id")
+        storage_mode (str): STORAGE_JSON or STORAGE_JOURNAL
+        journal_path (str): Path to the JSON Lines journal (journal mode)
+        journal_threshold (int): Journal size in bytes triggering compaction
+        background_compaction (bool): Compact in a background thread
+        storage_backend (BaseManager): Manager providing the raw storage
+                                       hooks, or None to use the JSON file
+        sequences (SequenceManager): Persistent ID counters, stored in
+                                     sequences.json next to the data file
+        unique_fields (tuple): Fields whose values must be unique (class
+                               attribute, set by child managers)
+        search_fields (tuple): Fields covered by search_items (class
+                               attribute, set by child managers)
     """
 
-    def __init__(self, file_path, model_class, id_attribute_name):
+    # Fields with a unique secondary index (see module docstring)
+    unique_fields = ()
+
+    # Fields indexed for name search (see module docstring)
+    search_fields = ()
+
+    # Identity map shared by all managers: cache key -> _CacheEntry
+    _cache_registry = {}
+
+    def __init__(
+        self,
+        file_path,
+        model_class,
+        id_attribute_name,
+        storage_mode=STORAGE_JSON,
+        journal_threshold=DEFAULT_JOURNAL_THRESHOLD,
+        background_compaction=False,
+        storage_backend=None,
+    ):
         """
         Initialize the base manager.
         
@@ -36,11 +173,31 @@ class BaseManager:
             file_path (str): Path to JSON file (e.g., "data/players.json")
             model_class (class): Model class to create instances from
             id_attribute_name (str): Name of the ID attribute
+            storage_mode (str, optional): STORAGE_JSON (default) or STORAGE_JOURNAL
+            journal_threshold (int, optional): Journal size in bytes above
+                                               which compaction runs
+            background_compaction (bool, optional): If True, threshold-triggered
+                                                    compaction runs in a thread
+            storage_backend (BaseManager, optional): Manager to delegate raw
+                                                     storage to (e.g., SqliteManager)
         """
+        if storage_mode not in (STORAGE_JSON, STORAGE_JOURNAL):
+            raise ValueError(f"Unknown storage mode: {storage_mode}")
+
         self.file_path = file_path
         self.model_class = model_class
         self.id_attribute_name = id_attribute_name
-        self._ensure_file_exists()
+        self.storage_mode = storage_mode
+        self.journal_path = os.path.splitext(file_path)[0] + ".journal.jsonl"
+        self.journal_threshold = journal_threshold
+        self.background_compaction = background_compaction
+        self.storage_backend = storage_backend
+        self.sequences = SequenceManager(
+            os.path.join(os.path.dirname(file_path), "sequences.json")
+        )
+        
+        if storage_backend is None:
+            self._ensure_file_exists()
 
     # ========================================
     # FILE SYSTEM OPERATIONS
@@ -60,9 +217,98 @@ class BaseManager:
             with open(self.file_path, 'w') as f:
                 json.dump([], f)
 
-    def _load_data(self):
+    def _file_signature(self):
+        """
+        Describe the current state of the storage file.
+        
+        Two identical signatures mean the file has not been modified,
+        so previously hydrated objects can be reused.
+        
+        In journal mode the journal file is part of the signature.
+        
+        Returns:
+            tuple: (mtime in nanoseconds, size in bytes), or None if missing
+        """
+        if self.storage_backend is not None:
+            return self.storage_backend._file_signature()
+
+        signature = self._stat_signature(self.file_path)
+        if self.storage_mode == STORAGE_JOURNAL:
+            return (signature, self._stat_signature(self.journal_path))
+        return signature
+
+    @staticmethod
+    def _stat_signature(path):
         """
-        Load raw data from the JSON file.
+        Get the (mtime, size) signature of a single file.
+        
+        Args:
+            path (str): File to inspect
+        
+        Returns:
+            tuple: (mtime in nanoseconds, size in bytes), or None if missing
+        """
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _load_data(self, ids=None):
+        """
+        Load raw data from storage.
+        
+        In journal mode, journal records are merged over the JSON file.
+        
+        Args:
+            ids (list, optional): Only return records with these IDs.
+                                  Returns everything if None.
+        
+        Returns:
+            list: List of dictionaries from JSON file, or empty list if error
+        """
+        if self.storage_backend is not None:
+            return self.storage_backend._load_data(ids)
+
+        data = self._load_json_file()
+        if self.storage_mode == STORAGE_JOURNAL:
+            data = self._merge_records(data, self._load_journal())
+        if ids is not None:
+            id_set = set(ids)
+            data = [raw for raw in data if raw.get(self.id_attribute_name) in id_set]
+        return data
+
+    def _iter_data(self):
+        """
+        Stream raw data from storage, one record at a time.
+        
+        Same records and order as _load_data(). In journal mode the
+        journal (bounded by the compaction threshold) is read first, then
+        its records replace the JSON file's as they stream by.
+        
+        Yields:
+            dict: Raw records
+        
+        Raises:
+            json.JSONDecodeError: If the JSON file is corrupted (raised when
+                                  the damaged part is reached)
+        """
+        if self.storage_backend is not None:
+            yield from self.storage_backend._iter_data()
+            return
+
+        journal_records = {}
+        if self.storage_mode == STORAGE_JOURNAL:
+            for record in self._load_journal():
+                journal_records[record.get(self.id_attribute_name)] = record
+
+        for raw in iter_json_array(self.file_path):
+            yield journal_records.pop(raw.get(self.id_attribute_name), raw)
+        yield from journal_records.values()
+
+    def _load_json_file(self):
+        """
+        Load raw data from the JSON file only.
         
         Returns:
             list: List of dictionaries from JSON file, or empty list if error
@@ -75,30 +321,528 @@ class BaseManager:
 
     def _save_data(self, data):
         """
-        Save raw data to the JSON file.
+        Save raw data to the JSON file, replacing all stored records.
+        
+        In journal mode the journal is emptied: the JSON file now holds
+        everything.
         
         Args:
             data (list): List of dictionaries to save
         """
+        if self.storage_backend is not None:
+            self.storage_backend._save_data(data)
+            return
+
         with open(self.file_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=4, ensure_ascii=False)
+        
+        if self.storage_mode == STORAGE_JOURNAL and os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+
+    def _write_record(self, record):
+        """
+        Insert or replace a single raw record in storage.
+        
+        JSON mode rewrites the file; journal mode appends one line.
+        
+        Args:
+            record (dict): Dehydrated item (must contain its ID)
+        """
+        if self.storage_backend is not None:
+            self.storage_backend._write_record(record)
+            return
+
+        if self.storage_mode == STORAGE_JOURNAL:
+            self._append_journal(record)
+            return
+
+        data = self._merge_records(self._load_json_file(), [record])
+        self._save_data(data)
+
+    def _append_records(self, records):
+        """
+        Add new raw records after the stored ones, reading them one by one.
+        
+        JSON mode copies the stored records to a temporary file one at a
+        time, writes the new ones after them and renames the file; journal
+        mode appends one line per record, and cuts them off again if the
+        stream fails. Either way an error leaves the storage as it was.
+        
+        Args:
+            records (iterable): Raw dictionaries with IDs not stored yet
+                                (e.g., a generator)
+        
+        Returns:
+            int: Number of records written
+        
+        Raises:
+            json.JSONDecodeError: If the stored JSON file is corrupted
+        """
+        if self.storage_backend is not None:
+            return self.storage_backend._append_records(records)
+
+        count = 0
+        if self.storage_mode == STORAGE_JOURNAL:
+            start = None
+            try:
+                with open(self.journal_path, 'a', encoding='utf-8') as f:
+                    start = f.tell()
+                    for record in records:
+                        line = json.dumps({"op": "upsert", "item": record}, ensure_ascii=False)
+                        f.write(line + "\n")
+                        count += 1
+            except Exception:
+                if start == 0:
+                    os.remove(self.journal_path)
+                elif start is not None:
+                    os.truncate(self.journal_path, start)
+                raise
+            return count
+
+        temp_path = self.file_path + ".tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                separator = "[\n"
+                for raw in iter_json_array(self.file_path):
+                    f.write(separator + self._format_record(raw))
+                    separator = ",\n"
+                for record in records:
+                    f.write(separator + self._format_record(record))
+                    separator = ",\n"
+                    count += 1
+                f.write("[]" if separator == "[\n" else "\n]")
+            os.replace(temp_path, self.file_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return count
+
+    @staticmethod
+    def _format_record(record):
+        """
+        Encode a record as an element of the indented JSON array.
+        
+        Args:
+            record (dict): Raw dictionary
+        
+        Returns:
+            str: The record, indented like json.dump(data, indent=4)
+        """
+        return "    " + _RECORD_ENCODER.encode(record).replace("\n", "\n    ")
+
+    def _merge_records(self, data, records):
+        """
+        Apply insert-or-replace records over a list of raw dictionaries.
+        
+        A record replaces the stored dict with the same ID in place,
+        otherwise it is appended.
+        
+        Args:
+            data (list): Raw dictionaries (modified in place)
+            records (iterable): Raw dictionaries to apply, in order
+        
+        Returns:
+            list: The merged list
+        """
+        positions = {
+            raw.get(self.id_attribute_name): i for i, raw in enumerate(data)
+        }
+        for record in records:
+            record_id = record.get(self.id_attribute_name)
+            position = positions.get(record_id)
+            if record_id is not None and position is not None:
+                data[position] = record
+            else:
+                positions[record_id] = len(data)
+                data.append(record)
+        return data
 
     # ========================================
-    # CRUD OPERATIONS
+    # JOURNAL OPERATIONS
     # ========================================
 
-    def load_items(self):
+    def _load_journal(self):
         """
-        Load all items from JSON and convert them to model objects.
+        Read the journal records in write order.
         
-        This performs "hydration": raw dict data -> model instances
+        A truncated last line (interrupted write) is ignored.
         
         Returns:
-            list: List of model instances (e.g., [Player, Player, ...])
+            list: Raw dictionaries recorded in the journal
+        """
+        records = []
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        break
+                    if entry.get("op") == "upsert":
+                        records.append(entry["item"])
+        except FileNotFoundError:
+            pass
+        return records
+
+    def _append_journal(self, record):
+        """
+        Append an insert-or-replace record to the journal.
+        
+        Args:
+            record (dict): Dehydrated item
+        """
+        line = json.dumps({"op": "upsert", "item": record}, ensure_ascii=False)
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            f.write(line + "\n")
+
+    def compact(self):
+        """
+        Fold the journal into the JSON file and delete the journal.
+        
+        Runs under the file lock, so it is safe to call from a background
+        thread. The cache stays valid if it was up to date beforehand.
+        """
+        if self.storage_mode != STORAGE_JOURNAL:
+            return
+
+        cache = self._cache
+        with cache.lock:
+            if not os.path.exists(self.journal_path):
+                return
+            cache_was_current = (
+                cache.items is not None
+                and cache.signature == self._file_signature()
+            )
+            
+            data = self._load_data()
+            temp_path = self.file_path + ".tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=4, ensure_ascii=False)
+            os.replace(temp_path, self.file_path)
+            os.remove(self.journal_path)
+            
+            if cache_was_current:
+                cache.signature = self._file_signature()
+
+    def _maybe_compact(self):
         """
+        Compact the journal if it grew past the threshold.
+        """
+        journal_signature = self._stat_signature(self.journal_path)
+        if journal_signature is None or journal_signature[1] < self.journal_threshold:
+            return
+
+        if self.background_compaction:
+            threading.Thread(target=self.compact, daemon=False).start()
+        else:
+            self.compact()
+
+    # ========================================
+    # CACHE OPERATIONS
+    # ========================================
+
+    @property
+    def _cache(self):
+        """
+        Return the identity-map entry for this manager's storage file.
+        
+        Returns:
+            _CacheEntry: Entry shared with every manager on the same file
+        """
+        key = self._cache_key()
+        entry = BaseManager._cache_registry.get(key)
+        if entry is None:
+            entry = _CacheEntry()
+            BaseManager._cache_registry[key] = entry
+        return entry
+
+    def _cache_key(self):
+        """
+        Identify the stored collection in the shared identity map.
+        
+        Returns:
+            str: Absolute path of the storage file
+        """
+        if self.storage_backend is not None:
+            return self.storage_backend._cache_key()
+        return os.path.abspath(self.file_path)
+
+    def _get_cached_items(self):
+        """
+        Return the cached items, re-reading the file only if it changed.
+        
+        Returns:
+            list: The cached list of model instances (do not mutate it)
+        """
+        cache = self._cache
+        signature = self._file_signature()
+
+        if cache.items is not None and signature == cache.signature:
+            cache.hits += 1
+            return cache.items
+
+        cache.misses += 1
+        if signature != cache.signature:
+            cache.index = {}
+        cache.unique_indexes = None
+        cache.search_index = None
         raw_data = self._load_data()
+
+        # Keep instances already loaded by an ID-restricted load
+        new_items = iter(self._hydrate_items([
+            raw for raw in raw_data
+            if raw.get(self.id_attribute_name) not in cache.index
+        ]))
+        cache.items = [
+            cache.index[raw[self.id_attribute_name]]
+            if raw.get(self.id_attribute_name) in cache.index
+            else next(new_items)
+            for raw in raw_data
+        ]
+        cache.index = self._build_index(cache.items)
+        cache.signature = signature
+        return cache.items
+
+    def _get_cached_items_by_ids(self, ids):
+        """
+        Return cached items for some IDs, loading only the missing ones.
+        
+        Args:
+            ids (list): IDs to return
+        
+        Returns:
+            list: Model instances found, in the order requested
+        """
+        cache = self._cache
+        signature = self._file_signature()
+
+        if signature != cache.signature:
+            cache.items = None
+            cache.index = {}
+            cache.unique_indexes = None
+            cache.search_index = None
+            cache.signature = signature
+
+        wanted_ids = list(dict.fromkeys(ids))
+        missing_ids = [item_id for item_id in wanted_ids if item_id not in cache.index]
+
+        if missing_ids and cache.items is None:
+            cache.misses += 1
+            loaded = self._hydrate_items(self._load_data(ids=missing_ids))
+            cache.index.update(self._build_index(loaded))
+        else:
+            cache.hits += 1
+
+        return [cache.index[item_id] for item_id in wanted_ids if item_id in cache.index]
+
+    def _get_cached_index(self):
+        """
+        Return the primary-key index matching the cached items.
+        
+        Returns:
+            dict: Mapping of item ID -> model instance (do not mutate it)
+        """
+        self._get_cached_items()
+        return self._cache.index
+
+    def _build_index(self, items):
+        """
+        Build the primary-key index for a list of items.
+        
+        Items without an ID are left out of the index.
+        
+        Args:
+            items (list): Model instances
+        
+        Returns:
+            dict: Mapping of item ID -> model instance
+        """
+        index = {}
+        for item in items:
+            item_id = getattr(item, self.id_attribute_name, None)
+            if item_id is not None:
+                index[item_id] = item
+        return index
+
+    def _set_cached_items(self, items):
+        """
+        Store freshly written items in the cache (write-through).
+        
+        Must be called right after the file was written so that the
+        recorded signature matches the data in memory.
+        
+        Args:
+            items (list): Model instances that were just saved
+        """
+        cache = self._cache
+        cache.items = list(items)
+        cache.index = self._build_index(cache.items)
+        cache.unique_indexes = None
+        cache.search_index = None
+        cache.signature = self._file_signature()
+
+    def _build_unique_indexes(self, items, strict=True):
+        """
+        Build the unique secondary indexes for a list of items.
+        
+        Empty values (None or "") are not indexed.
+        
+        Args:
+            items (list): Model instances
+            strict (bool, optional): If True, raise on a duplicate value;
+                                     if False, keep the first item (used
+                                     for data already stored)
+        
+        Returns:
+            dict: Unique field -> (value -> model instance, item ID -> value)
+        
+        Raises:
+            DuplicateKeyError: If strict and two items share a value
+        """
+        indexes = {}
+        for field in self.unique_fields:
+            by_value = {}
+            by_id = {}
+            for item in items:
+                value = getattr(item, field, None)
+                if value is None or value == "":
+                    continue
+                existing = by_value.get(value)
+                if existing is not None and existing is not item:
+                    if strict:
+                        raise DuplicateKeyError(
+                            field, value, getattr(existing, self.id_attribute_name, None)
+                        )
+                    continue
+                by_value[value] = item
+                by_id[getattr(item, self.id_attribute_name, None)] = value
+            indexes[field] = (by_value, by_id)
+        return indexes
+
+    def _get_unique_indexes(self):
+        """
+        Return the unique indexes matching the cached items.
+        
+        Built on the first use after a file load, then kept up to date
+        by the writes.
+        
+        Returns:
+            dict: See _build_unique_indexes (do not mutate it)
+        """
+        items = self._get_cached_items()
+        cache = self._cache
+        if cache.unique_indexes is None:
+            cache.unique_indexes = self._build_unique_indexes(items, strict=False)
+        return cache.unique_indexes
+
+    def _check_unique(self, item):
+        """
+        Check that an item's unique values are free (or already its own).
+        
+        Args:
+            item: Model instance about to be written
+        
+        Raises:
+            DuplicateKeyError: If another item uses one of the values
+        """
+        item_id = getattr(item, self.id_attribute_name, None)
+        for field, (by_value, _) in self._get_unique_indexes().items():
+            value = getattr(item, field, None)
+            existing = by_value.get(value)
+            if (
+                existing is not None
+                and existing is not item
+                and getattr(existing, self.id_attribute_name, None) != item_id
+            ):
+                raise DuplicateKeyError(
+                    field, value, getattr(existing, self.id_attribute_name, None)
+                )
+
+    def _update_unique_indexes(self, item):
+        """
+        Record an item's current unique values (after an upsert).
+        
+        Args:
+            item: Model instance that was just written
+        """
+        unique_indexes = self._cache.unique_indexes
+        if unique_indexes is None:
+            return
+        item_id = getattr(item, self.id_attribute_name, None)
+        for field, (by_value, by_id) in unique_indexes.items():
+            old_value = by_id.pop(item_id, None)
+            if old_value is not None:
+                by_value.pop(old_value, None)
+            value = getattr(item, field, None)
+            if value is not None and value != "":
+                by_value[value] = item
+                by_id[item_id] = value
+
+    def invalidate_cache(self):
+        """
+        Drop the cached items so the next access re-reads the file.
+        """
+        cache = self._cache
+        cache.items = None
+        cache.index = {}
+        cache.unique_indexes = None
+        cache.search_index = None
+        cache.signature = None
+
+    def cache_stats(self):
+        """
+        Get hit/miss counters for this manager's cache.
+        
+        Returns:
+            dict: Keys 'hits', 'misses' and 'cached_items'
+        """
+        cache = self._cache
+        return {
+            "hits": cache.hits,
+            "misses": cache.misses,
+            "cached_items": len(cache.index),
+        }
+
+    # ========================================
+    # CRUD OPERATIONS
+    # ========================================
+
+    def _hydrate_items(self, raw_data):
+        """
+        Convert raw dictionaries to model instances.
+        
+        Child managers can override this to add extra hydration steps.
+        
+        Args:
+            raw_data (list): List of dictionaries from storage
+        
+        Returns:
+            list: List of model instances
+        """
         return [self.model_class(**data) for data in raw_data]
 
+    def load_items(self, ids=None):
+        """
+        Load items from JSON and convert them to model objects.
+        
+        This performs "hydration": raw dict data -> model instances.
+        Objects come from the shared identity map: the same ID always
+        yields the same instance until the file changes on disk.
+        
+        Args:
+            ids (list, optional): Only load these IDs (in this order).
+                                  Storage backends that can read records
+                                  individually skip all the others.
+        
+        Returns:
+            list: List of model instances (e.g., [Player, Player, ...])
+        """
+        if ids is not None:
+            return self._get_cached_items_by_ids(ids)
+        return list(self._get_cached_items())
+
     def save_items(self, items):
         """
         Convert model objects to dictionaries and save to JSON.
@@ -107,9 +851,50 @@ class BaseManager:
         
         Args:
             items (list): List of model instances to save
+        
+        Raises:
+            DuplicateKeyError: If two items share a unique field value
+                               (nothing is written)
         """
+        unique_indexes = self._build_unique_indexes(items)
         data_to_save = [item.to_dict() for item in items]
-        self._save_data(data_to_save)
+        with self._cache.lock:
+            self._save_data(data_to_save)
+            self._set_cached_items(items)
+            self._cache.unique_indexes = unique_indexes
+
+    def append_items(self, items):
+        """
+        Store new items after the existing ones, as they are produced.
+        
+        For bulk inserts too large to hold in memory (e.g., player
+        imports): the stored items are not loaded, and the new ones are
+        dehydrated one at a time and not cached. Unlike upsert_item,
+        nothing is checked: the items must carry new IDs (see reserve_ids)
+        and new unique field values.
+        
+        Args:
+            items (iterable): Model instances (e.g., a generator)
+        
+        Returns:
+            int: Number of items stored (storage is untouched if 0)
+        
+        Raises:
+            json.JSONDecodeError: If the stored JSON file is corrupted
+                                  (nothing is written)
+        """
+        records = (item.to_dict() for item in items)
+        first = next(records, None)
+        if first is None:
+            return 0
+
+        with self._cache.lock:
+            count = self._append_records(itertools.chain([first], records))
+            self.invalidate_cache()
+
+        if self.storage_mode == STORAGE_JOURNAL:
+            self._maybe_compact()
+        return count
 
     def add_item(self, item):
         """
@@ -117,10 +902,61 @@ class BaseManager:
         
         Args:
             item: Model instance to add (must have to_dict() method)
+        
+        Raises:
+            DuplicateKeyError: See upsert_item
         """
-        items = self.load_items()
-        items.append(item)
-        self.save_items(items)
+        self.upsert_item(item)
+
+    def upsert_item(self, item):
+        """
+        Insert an item, or replace the stored item with the same ID.
+        
+        Only this item is dehydrated. In journal mode the write is a single
+        appended line; in JSON mode the file is rewritten.
+        
+        Args:
+            item: Model instance to store (must have to_dict() method)
+        
+        Raises:
+            DuplicateKeyError: If another item uses one of the item's
+                               unique field values (nothing is written)
+        """
+        cache = self._cache
+
+        with cache.lock:
+            if self.unique_fields:
+                self._check_unique(item)
+            cache_is_current = (
+                cache.signature is not None
+                and cache.signature == self._file_signature()
+            )
+            self._write_record(item.to_dict())
+
+            # Update the cache in place instead of reloading
+            if not cache_is_current:
+                cache.items = None
+                cache.index = {}
+                cache.unique_indexes = None
+                cache.search_index = None
+            item_id = getattr(item, self.id_attribute_name, None)
+            previous = cache.index.get(item_id) if item_id is not None else None
+            if cache.items is not None:
+                if previous is None:
+                    cache.items.append(item)
+                elif previous is not item:
+                    cache.items[cache.items.index(previous)] = item
+            if item_id is not None:
+                cache.index[item_id] = item
+            self._update_unique_indexes(item)
+            if cache.search_index is not None:
+                cache.search_index.add(item)
+            cache.signature = self._file_signature()
+
+        self.sequences.observe(self.id_attribute_name, item_id)
+
+        if self.storage_mode == STORAGE_JOURNAL:
+            self._maybe_compact()
 
     # ========================================
     # ID MANAGEMENT
@@ -128,26 +964,36 @@ class BaseManager:
 
     def get_next_id(self):
         """
-        Generate the next available ID using auto-increment logic.
+        Allocate the next ID from the persistent sequence.
         
-        Finds the maximum existing ID and returns max + 1.
+        O(1): the items are only scanned once, to seed a sequence that
+        does not exist yet. Allocated IDs are never handed out again.
         
         Returns:
             int: Next available ID (starts at 1 if no items exist)
         """
-        items = self.load_items()
+        return self.sequences.next_value(self.id_attribute_name, self._get_max_id)
+
+    def reserve_ids(self, count):
+        """
+        Allocate a block of consecutive IDs (e.g., for bulk imports).
         
-        if not items:
-            return 1
+        Args:
+            count (int): Number of IDs to allocate
+        
+        Returns:
+            range: The allocated IDs
+        """
+        return self.sequences.reserve(self.id_attribute_name, count, self._get_max_id)
 
-        ids = [
-            getattr(item, self.id_attribute_name)
-            for item in items
-            if getattr(item, self.id_attribute_name, None) is not None
-        ]
+    def _get_max_id(self):
+        """
+        Find the highest stored ID (used to seed the sequence).
         
-        max_id = max(ids) if ids else 0
-        return max_id + 1
+        Returns:
+            int: Highest ID, or 0 if no items exist
+        """
+        return max(self._get_cached_index(), default=0)
 
     # ========================================
     # QUERY OPERATIONS
@@ -157,36 +1003,114 @@ class BaseManager:
         """
         Find and return a single item by its ID.
         
+        Uses the primary-key index: O(1) once the item is loaded. Only
+        this item is hydrated if it is not cached yet.
+        
         Args:
             item_id (int): ID to search for
             
         Returns:
             Model instance if found, None otherwise
         """
-        all_items = self.load_items()
-        
-        for item in all_items:
-            if getattr(item, self.id_attribute_name) == item_id:
-                return item
-        
-        return None
+        found_items = self._get_cached_items_by_ids([item_id])
+        return found_items[0] if found_items else None
 
     def get_items_by_ids(self, ids):
         """
         Find and return multiple items by their IDs.
         
+        Uses the primary-key index: O(k) for k requested IDs once they are
+        loaded. Duplicate IDs are returned once, unknown IDs are skipped.
+        
         Args:
             ids (list): List of IDs to search for
             
         Returns:
-            list: List of found model instances
+            list: List of found model instances, in the order requested
         """
-        all_items = self.load_items()
-        id_set = set(ids)
+        return self._get_cached_items_by_ids(ids)
+
+    def get_by_unique(self, field, value):
+        """
+        Find an item by the value of one of its unique fields.
         
-        found_items = [
-            item for item in all_items
-            if getattr(item, self.id_attribute_name) in id_set
-        ]
+        O(1) once the index is built (first call after a file load).
+        
+        Args:
+            field (str): One of unique_fields
+            value: Value to search for
+        
+        Returns:
+            Model instance if found, None otherwise
+        
+        Raises:
+            ValueError: If the field has no unique index
+        """
+        if field not in self.unique_fields:
+            raise ValueError(f"No unique index on {field}")
+        by_value, _ = self._get_unique_indexes()[field]
+        return by_value.get(value)
+
+    def search_items(self, query, limit=10, exclude_ids=()):
+        """
+        Find items by the words of their search fields.
         
-        return found_items
+        Accent- and case-insensitive; each query word matches the start
+        of a word of the item, with a typo-tolerant fallback (see
+        NameSearchIndex). Only `limit` items are returned: the full item
+        list is never sorted or copied.
+        
+        Args:
+            query (str): Words typed by the user
+            limit (int, optional): Maximum number of results. Defaults to 10.
+            exclude_ids (collection, optional): IDs never returned
+        
+        Returns:
+            list: Model instances, best match first
+        
+        Raises:
+            ValueError: If the manager has no search fields
+        """
+        if not self.search_fields:
+            raise ValueError(f"No search fields on {type(self).__name__}")
+        items = self._get_cached_items()
+        cache = self._cache
+        with cache.lock:
+            if cache.search_index is None:
+                cache.search_index = NameSearchIndex(
+                    self.search_fields, self.id_attribute_name, items
+                )
+            search_index = cache.search_index
+        return search_index.search(query, limit, exclude_ids)
+
+    def count_items(self):
+        """
+        Count the stored items.
+        
+        O(1) once the items are cached.
+        
+        Returns:
+            int: Number of items
+        """
+        return len(self._get_cached_index())
+
+    def iter_items(self):
+        """
+        Generate every item, one at a time, in storage order.
+        
+        Uses the cached items if they are up to date; otherwise streams
+        the records from storage and hydrates them one by one without
+        caching them, so memory does not grow with the collection. Items
+        streamed that way are not the identity-map instances: use them
+        read-only.
+        
+        Yields:
+            Model instances
+        """
+        cache = self._cache
+        if cache.items is not None and cache.signature == self._file_signature():
+            yield from cache.items
+            return
+
+        for raw in self._iter_data():
+            yield self._hydrate_items([raw])[0]
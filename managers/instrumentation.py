@@ -0,0 +1,345 @@
+"""
+Instrumentation
+
+Opt-in timing counters for the hot paths: storage reads and writes,
+hydration, dehydration (to_dict) and pairing.
+
+Enabling:
+    - CHESS_INSTRUMENT=1 environment variable, or
+    - python main.py --instrument
+    Counters are shown by the "Diagnostics" entry of the main menu and
+    written as JSON at exit (CHESS_INSTRUMENT_OUTPUT or --instrument-output,
+    default data/instrumentation.json).
+
+Zero cost when disabled:
+    Nothing is decorated in the source. enable() wraps the methods listed
+    in get_instrumented_methods() on their classes, so a run without
+    instrumentation executes exactly the original code.
+
+Counters (one per method and concrete class, e.g.
+"BaseManager._load_data (PlayerManager)"):
+    - calls: number of calls
+    - total_time / max_time: wall time in seconds, nested calls included
+      (TournamentManager._hydrate_items contains BaseManager._hydrate_items)
+    - bytes_read / bytes_written: size of the JSON files and journals
+      read or written (not measured for the SQLite and sharded backends)
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+
+ENV_VARIABLE = "CHESS_INSTRUMENT"
+OUTPUT_ENV_VARIABLE = "CHESS_INSTRUMENT_OUTPUT"
+DEFAULT_OUTPUT = "data/instrumentation.json"
+
+BYTES_READ = "read"
+BYTES_WRITTEN = "written"
+BYTES_APPENDED = "appended"
+
+
+def is_requested_by_environment():
+    """
+    Check the CHESS_INSTRUMENT environment variable.
+
+    Returns:
+        bool: True if it is set to a true value (1, true, yes, on)
+    """
+    return os.environ.get(ENV_VARIABLE, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _json_paths(manager):
+    """
+    List the files read by a BaseManager in JSON storage.
+
+    Args:
+        manager (BaseManager): The manager
+
+    Returns:
+        list: JSON file and journal paths (empty for other backends)
+    """
+    from managers.base_manager import STORAGE_JOURNAL
+
+    if manager.storage_backend is not None:
+        return []
+    if manager.storage_mode == STORAGE_JOURNAL:
+        return [manager.file_path, manager.journal_path]
+    return [manager.file_path]
+
+
+def _json_file_path(manager):
+    """
+    List the JSON file written by a BaseManager in JSON storage.
+
+    Args:
+        manager (BaseManager): The manager
+
+    Returns:
+        list: The JSON file path (empty for other backends)
+    """
+    return [] if manager.storage_backend is not None else [manager.file_path]
+
+
+def get_instrumented_methods():
+    """
+    List the methods wrapped when instrumentation is enabled.
+
+    Imported here, not at module level, so that loading this module
+    never imports the whole application.
+
+    Returns:
+        list: (class, method name, path function or None, bytes kind or None).
+              The path function returns the files whose size is counted.
+    """
+    from models.player import Player
+    from models.round import Round
+    from models.tournament import Tournament
+    from managers.base_manager import BaseManager
+    from managers.tournament_manager import TournamentManager
+    from managers.rating_manager import RatingManager
+    from managers.sqlite_manager import SqliteManager
+    from managers.sharded_manager import ShardedJsonManager
+    from managers.pairing_engine import PairingEngine, ScoreBracketPairing
+    from controllers.tournament_controller import TournamentController
+
+    def manager_file(manager):
+        return [manager.file_path]
+
+    def manager_journal(manager):
+        return [] if manager.storage_backend is not None else [manager.journal_path]
+
+    return [
+        # Storage
+        (BaseManager, "_load_data", _json_paths, BYTES_READ),
+        (BaseManager, "_save_data", _json_file_path, BYTES_WRITTEN),
+        (BaseManager, "_append_journal", manager_journal, BYTES_APPENDED),
+        (SqliteManager, "_load_data", None, None),
+        (SqliteManager, "_save_data", None, None),
+        (ShardedJsonManager, "_load_data", None, None),
+        (ShardedJsonManager, "_save_data", None, None),
+        (RatingManager, "_load_state", manager_file, BYTES_READ),
+        (RatingManager, "_save_state", manager_file, BYTES_WRITTEN),
+        # Hydration
+        (BaseManager, "_hydrate_items", None, None),
+        (TournamentManager, "_hydrate_items", None, None),
+        (TournamentManager, "_hydrate_tournament_players", None, None),
+        (TournamentManager, "_hydrate_tournament_rounds", None, None),
+        # Dehydration
+        (BaseManager, "save_items", None, None),
+        (Tournament, "to_dict", None, None),
+        (Round, "to_dict", None, None),
+        (Player, "to_dict", None, None),
+        # Pairing
+        (TournamentController, "_generate_next_round", None, None),
+        (TournamentController, "_pair_greedy", None, None),
+        (PairingEngine, "pair_players", None, None),
+        (ScoreBracketPairing, "pair_players", None, None),
+    ]
+
+
+class Instrumentation:
+    """
+    Registry of timing counters and the wrappers feeding it.
+
+    Attributes:
+        enabled (bool): True once the wrappers are installed
+        output_path (str): JSON file written at exit (None: no dump)
+        _counters (dict): Counter name -> counter dict
+        _originals (list): (class, method name, original function),
+                           to restore the classes in disable()
+        _lock (threading.Lock): Guards the counters
+        _exit_hook_registered (bool): True once the atexit dump is registered
+    """
+
+    def __init__(self):
+        """Initialize a disabled registry."""
+        self.enabled = False
+        self.output_path = None
+        self._counters = {}
+        self._originals = []
+        self._lock = threading.Lock()
+        self._exit_hook_registered = False
+
+    # ========================================
+    # ENABLING
+    # ========================================
+
+    def configure(self, enabled=None, output_path=None):
+        """
+        Enable instrumentation if requested by argument or environment.
+
+        Args:
+            enabled (bool, optional): Force on/off. Defaults to the
+                                      CHESS_INSTRUMENT environment variable.
+            output_path (str, optional): JSON dump path. Defaults to
+                                         CHESS_INSTRUMENT_OUTPUT, then
+                                         data/instrumentation.json.
+
+        Returns:
+            bool: True if instrumentation is enabled
+        """
+        if enabled is None:
+            enabled = is_requested_by_environment()
+        if enabled:
+            self.enable(
+                output_path or os.environ.get(OUTPUT_ENV_VARIABLE) or DEFAULT_OUTPUT
+            )
+        return self.enabled
+
+    def enable(self, output_path=None):
+        """
+        Install the wrappers (does nothing if already enabled).
+
+        Args:
+            output_path (str, optional): JSON file written at exit
+        """
+        self.output_path = output_path
+        if output_path and not self._exit_hook_registered:
+            atexit.register(self._dump_at_exit)
+            self._exit_hook_registered = True
+        if self.enabled:
+            return
+
+        for cls, method_name, paths, bytes_kind in get_instrumented_methods():
+            original = cls.__dict__[method_name]
+            self._originals.append((cls, method_name, original))
+            setattr(cls, method_name, self._wrap(cls, original, paths, bytes_kind))
+        self.enabled = True
+
+    def disable(self):
+        """Restore the original methods (counters are kept)."""
+        for cls, method_name, original in reversed(self._originals):
+            setattr(cls, method_name, original)
+        self._originals = []
+        self.enabled = False
+
+    def _wrap(self, cls, function, paths, bytes_kind):
+        """
+        Build the timing wrapper of one method.
+
+        Args:
+            cls (type): Class defining the method
+            function (callable): Original function
+            paths (callable): Returns the files to measure, or None
+            bytes_kind (str): BYTES_READ, BYTES_WRITTEN, BYTES_APPENDED or None
+
+        Returns:
+            callable: Wrapper recording into the counters
+        """
+        base_name = f"{cls.__name__}.{function.__name__}"
+        registry = self
+
+        @functools.wraps(function)
+        def wrapper(obj, *args, **kwargs):
+            owner = type(obj).__name__
+            name = base_name if owner == cls.__name__ else f"{base_name} ({owner})"
+            measured_paths = paths(obj) if paths is not None else []
+
+            size_before = 0
+            if bytes_kind == BYTES_APPENDED:
+                size_before = _total_size(measured_paths)
+
+            start = time.perf_counter()
+            try:
+                return function(obj, *args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                size = _total_size(measured_paths) if measured_paths else 0
+                if bytes_kind == BYTES_APPENDED:
+                    size -= size_before
+                registry.record(
+                    name, elapsed,
+                    bytes_read=size if bytes_kind == BYTES_READ else 0,
+                    bytes_written=size if bytes_kind in (BYTES_WRITTEN, BYTES_APPENDED) else 0
+                )
+
+        return wrapper
+
+    # ========================================
+    # COUNTERS
+    # ========================================
+
+    def record(self, name, elapsed, bytes_read=0, bytes_written=0):
+        """
+        Add one call to a counter.
+
+        Args:
+            name (str): Counter name
+            elapsed (float): Wall time of the call in seconds
+            bytes_read (int, optional): Bytes read by the call
+            bytes_written (int, optional): Bytes written by the call
+        """
+        with self._lock:
+            counter = self._counters.get(name)
+            if counter is None:
+                counter = self._counters[name] = {
+                    "calls": 0, "total_time": 0.0, "max_time": 0.0,
+                    "bytes_read": 0, "bytes_written": 0,
+                }
+            counter["calls"] += 1
+            counter["total_time"] += elapsed
+            counter["max_time"] = max(counter["max_time"], elapsed)
+            counter["bytes_read"] += bytes_read
+            counter["bytes_written"] += bytes_written
+
+    def get_counters(self):
+        """
+        Get a copy of all counters, slowest (total time) first.
+
+        Returns:
+            dict: Counter name -> {"calls", "total_time", "max_time",
+                  "bytes_read", "bytes_written"}
+        """
+        with self._lock:
+            items = [(name, dict(counter)) for name, counter in self._counters.items()]
+        items.sort(key=lambda item: item[1]["total_time"], reverse=True)
+        return dict(items)
+
+    def reset(self):
+        """Set all counters back to zero."""
+        with self._lock:
+            self._counters = {}
+
+    def dump(self, path):
+        """
+        Write the counters as JSON.
+
+        Args:
+            path (str): Destination file
+        """
+        dir_name = os.path.dirname(path)
+        if dir_name:
+            os.makedirs(dir_name, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.get_counters(), f, indent=4)
+
+    def _dump_at_exit(self):
+        """Write the counters to output_path (registered with atexit)."""
+        if self.output_path:
+            self.dump(self.output_path)
+
+
+def _total_size(paths):
+    """
+    Add up the sizes of existing files.
+
+    Args:
+        paths (list): File paths
+
+    Returns:
+        int: Total size in bytes (missing files count as 0)
+    """
+    total = 0
+    for path in paths:
+        try:
+            total += os.path.getsize(path)
+        except OSError:
+            pass
+    return total
+
+
+# Application-wide registry
+instrumentation = Instrumentation()
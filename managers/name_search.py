@@ -0,0 +1,297 @@
+"""
+Name Search
+
+In-memory search index over name fields (e.g., a player's last and first
+names), for selecting one player among tens of thousands.
+
+Folding:
+    Names are compared lowercase and without accents or punctuation:
+    "Éloïse LEFÈVRE-DURAND" is indexed as the tokens "eloise", "lefevre"
+    and "durand", so typing "lefev" or "Eloise" finds it.
+
+Matching:
+    - Prefix: each word of the query must start a token of the item
+      ("dur elo" finds Éloïse LEFÈVRE-DURAND). Tokens are kept in a
+      sorted list, so a prefix is one binary search plus a scan of the
+      matching tokens only.
+    - Trigram (fallback for typos, when the prefix search finds nothing):
+      items sharing most of the query's 3-letter sequences
+      ("dupnot" still finds DUPONT).
+
+Ranking:
+    Exact token matches first, then alphabetical order of the fields.
+    Only the requested number of results is built (heapq.nsmallest), never
+    the full sorted list.
+"""
+
+import heapq
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from collections import Counter
+
+# Minimum share of the query's trigrams an item must contain (fallback)
+TRIGRAM_THRESHOLD = 0.5
+
+_LIGATURES = str.maketrans({"œ": "oe", "æ": "ae", "ß": "ss"})
+_NON_ALPHANUMERIC = re.compile(r"[^a-z0-9]+")
+
+
+def fold(text):
+    """
+    Normalize text for comparison: lowercase, no accents, no punctuation.
+
+    Args:
+        text (str): Text to normalize
+
+    Returns:
+        str: Folded text, words separated by single spaces
+    """
+    text = str(text).lower()
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text.translate(_LIGATURES))
+        text = "".join(char for char in text if not unicodedata.combining(char))
+    return _NON_ALPHANUMERIC.sub(" ", text).strip()
+
+
+def tokenize(text):
+    """
+    Split text into folded words.
+
+    Args:
+        text (str): Text to split
+
+    Returns:
+        list: Folded words (e.g., "Lefèvre-Durand" -> ["lefevre", "durand"])
+    """
+    return fold(text).split()
+
+
+def trigrams(token):
+    """
+    List the 3-letter sequences of a word, padded at the start.
+
+    Args:
+        token (str): Folded word
+
+    Returns:
+        set: Trigrams (e.g., "dupont" -> {"  d", " du", "dup", ..., "ont"})
+    """
+    padded = f"  {token}"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameSearchIndex:
+    """
+    Prefix and trigram index over some text fields of model instances.
+
+    Attributes:
+        fields (tuple): Indexed attribute names, in ranking order
+        id_attribute_name (str): Name of the ID attribute
+        _items (dict): Item ID -> model instance
+        _item_tokens (dict): Item ID -> set of its tokens
+        _sort_keys (dict): Item ID -> folded fields (alphabetical ranking)
+        _postings (dict): Token -> set of item IDs
+        _sorted_tokens (list): All distinct tokens, sorted (prefix search)
+        _trigram_postings (dict): Trigram -> set of item IDs
+    """
+
+    def __init__(self, fields, id_attribute_name, items=()):
+        """
+        Initialize the index.
+
+        Args:
+            fields (tuple): Attribute names to index
+            id_attribute_name (str): Name of the ID attribute
+            items (iterable, optional): Items to index
+        """
+        self.fields = tuple(fields)
+        self.id_attribute_name = id_attribute_name
+        self._items = {}
+        self._item_tokens = {}
+        self._sort_keys = {}
+        self._postings = {}
+        self._sorted_tokens = []
+        self._trigram_postings = {}
+        # Bulk build: one sort of all tokens instead of one insertion each
+        for item in items:
+            self._index(item)
+        self._sorted_tokens = sorted(self._postings)
+
+    def __len__(self):
+        return len(self._items)
+
+    # ========================================
+    # MAINTENANCE
+    # ========================================
+
+    def add(self, item):
+        """
+        Index an item (replacing its previous entry, if any).
+
+        Args:
+            item: Model instance with the indexed fields
+        """
+        item_id = getattr(item, self.id_attribute_name)
+        if item_id in self._items:
+            self.remove(item_id)
+        for token in self._index(item):
+            insort(self._sorted_tokens, token)
+
+    def _index(self, item):
+        """
+        Add an item to every map except the sorted token list.
+
+        Args:
+            item: Model instance with the indexed fields
+
+        Returns:
+            list: Tokens not indexed before (to insert in _sorted_tokens)
+        """
+        item_id = getattr(item, self.id_attribute_name)
+        values = [getattr(item, field, "") or "" for field in self.fields]
+        tokens = {token for value in values for token in tokenize(value)}
+        self._items[item_id] = item
+        self._item_tokens[item_id] = tokens
+        self._sort_keys[item_id] = tuple(fold(value) for value in values)
+
+        new_tokens = []
+        for token in tokens:
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = set()
+                new_tokens.append(token)
+            posting.add(item_id)
+            for trigram in trigrams(token):
+                self._trigram_postings.setdefault(trigram, set()).add(item_id)
+        return new_tokens
+
+    def remove(self, item_id):
+        """
+        Remove an item from the index (does nothing if absent).
+
+        Args:
+            item_id (int): ID of the item
+        """
+        if self._items.pop(item_id, None) is None:
+            return
+        del self._sort_keys[item_id]
+
+        for token in self._item_tokens.pop(item_id):
+            posting = self._postings[token]
+            posting.discard(item_id)
+            if not posting:
+                del self._postings[token]
+                del self._sorted_tokens[bisect_left(self._sorted_tokens, token)]
+            for trigram in trigrams(token):
+                trigram_posting = self._trigram_postings[trigram]
+                trigram_posting.discard(item_id)
+                if not trigram_posting:
+                    del self._trigram_postings[trigram]
+
+    # ========================================
+    # SEARCH
+    # ========================================
+
+    def search(self, query, limit=10, exclude_ids=()):
+        """
+        Find the best matching items.
+
+        Args:
+            query (str): Words typed by the user (any case, accents optional)
+            limit (int, optional): Maximum number of results. Defaults to 10.
+            exclude_ids (collection, optional): IDs never returned
+
+        Returns:
+            list: Model instances, best match first
+        """
+        query_tokens = tokenize(query)
+        if not query_tokens:
+            return []
+
+        candidates = self._prefix_candidates(query_tokens)
+        if candidates:
+            candidates = [item_id for item_id in candidates if item_id not in exclude_ids]
+        if candidates:
+            exact_tokens = set(query_tokens)
+            best = heapq.nsmallest(
+                limit,
+                candidates,
+                key=lambda item_id: (
+                    -len(exact_tokens & self._item_tokens[item_id]),
+                    self._sort_keys[item_id],
+                    item_id,
+                )
+            )
+        else:
+            best = self._trigram_search(query_tokens, limit, exclude_ids)
+        return [self._items[item_id] for item_id in best]
+
+    def _prefix_ids(self, prefix):
+        """
+        Get the IDs of the items having a token that starts with a prefix.
+
+        Args:
+            prefix (str): Folded prefix
+
+        Returns:
+            set: Item IDs
+        """
+        matched = set()
+        position = bisect_left(self._sorted_tokens, prefix)
+        while position < len(self._sorted_tokens):
+            token = self._sorted_tokens[position]
+            if not token.startswith(prefix):
+                break
+            matched |= self._postings[token]
+            position += 1
+        return matched
+
+    def _prefix_candidates(self, query_tokens):
+        """
+        Get the IDs of the items matching every query word as a prefix.
+
+        Args:
+            query_tokens (list): Folded query words
+
+        Returns:
+            set: Item IDs
+        """
+        # Longest words first: they usually match fewer items
+        candidates = None
+        for token in sorted(set(query_tokens), key=len, reverse=True):
+            matched = self._prefix_ids(token)
+            candidates = matched if candidates is None else candidates & matched
+            if not candidates:
+                break
+        return candidates
+
+    def _trigram_search(self, query_tokens, limit, exclude_ids):
+        """
+        Rank items by the share of query trigrams they contain.
+
+        Args:
+            query_tokens (list): Folded query words
+            limit (int): Maximum number of results
+            exclude_ids (collection): IDs never returned
+
+        Returns:
+            list: Item IDs, best first, above TRIGRAM_THRESHOLD
+        """
+        query_trigrams = set()
+        for token in query_tokens:
+            query_trigrams |= trigrams(token)
+
+        hits = Counter()
+        for trigram in query_trigrams:
+            hits.update(self._trigram_postings.get(trigram, ()))
+
+        minimum = TRIGRAM_THRESHOLD * len(query_trigrams)
+        return heapq.nsmallest(
+            limit,
+            (
+                item_id for item_id, count in hits.items()
+                if count >= minimum and item_id not in exclude_ids
+            ),
+            key=lambda item_id: (-hits[item_id], self._sort_keys[item_id], item_id)
+        )
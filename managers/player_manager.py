@@ -6,7 +6,10 @@ Inherits all functionality from BaseManager.
 """
 
 from models.player import Player
-from managers.base_manager import BaseManager
+from managers.base_manager import BaseManager, STORAGE_JSON
+from managers.sqlite_manager import (
+    SqliteManager, BACKEND_SQLITE, get_backend_name, get_db_path
+)
 
 
 class PlayerManager(BaseManager):
@@ -14,19 +17,51 @@ class PlayerManager(BaseManager):
     Manager for Player data operations.
     
     Handles loading, saving, and querying players from JSON storage.
-    All logic is inherited from BaseManager.
+    All logic is inherited from BaseManager; national_id has a unique
+    index (no two players share a federation ID) and names are searchable
+    (search_items).
     """
 
-    def __init__(self, file_path='data/players.json'):
+    unique_fields = ("national_id",)
+    search_fields = ("last_name", "first_name")
+
+    def __init__(self, file_path='data/players.json', storage_mode=STORAGE_JSON, backend=None):
         """
         Initialize the PlayerManager.
         
         Args:
             file_path (str, optional): Path to players JSON file.
                                       Defaults to 'data/players.json'.
+            storage_mode (str, optional): STORAGE_JSON (default) or
+                                          STORAGE_JOURNAL (append-only writes).
+            backend (str, optional): "json" or "sqlite". Defaults to the
+                                     CHESS_STORAGE_BACKEND environment variable,
+                                     then "json".
         """
+        storage_backend = None
+        if get_backend_name(backend) == BACKEND_SQLITE:
+            storage_backend = SqliteManager(
+                get_db_path(), Player, 'player_id', 'players'
+            )
+
         super().__init__(
             file_path=file_path,
             model_class=Player,
-            id_attribute_name='player_id'
+            id_attribute_name='player_id',
+            storage_mode=storage_mode,
+            storage_backend=storage_backend
         )
+
+    def get_by_national_id(self, national_id):
+        """
+        Find a player by national chess federation ID.
+        
+        O(1): uses the unique national_id index.
+        
+        Args:
+            national_id (str): Federation ID (e.g., "AB12345")
+        
+        Returns:
+            Player: The player, or None if no player has this ID
+        """
+        return self.get_by_unique("national_id", national_id)
@@ -0,0 +1,342 @@
+"""
+Rating Manager
+
+Elo ratings computed from every finished match of every tournament.
+
+Replay:
+    Finished rounds of all tournaments are replayed in chronological order
+    (Round.start_date_time, then round_id). Each round is one rating
+    period: all its games are rated from the ratings before the round,
+    which also makes a round a single vectorized update (NumPy, if
+    installed; a plain loop gives the same numbers otherwise).
+
+Incremental update:
+    When a round is finished, update_with_round applies just that round.
+    A round older than the last one applied (e.g., results entered late
+    in another tournament) triggers a full recomputation instead, so the
+    ratings always match a chronological replay.
+
+Storage (data/ratings.json):
+    {
+        "ratings": {"1": 1512.3, ...},          current rating per player
+        "games": {"1": 8, ...},                 rated games per player
+        "history": {"1": [[18, 1512.3], ...]},  [round_id, rating after]
+        "rounds": [1, 2, ...],                  round IDs applied, in order
+        "last_start": "2025-10-01T10:00:00"     start of the last round applied
+    }
+    Showing current ratings reads this file only; the first use on
+    existing data replays the archive once to create it.
+
+Caching:
+    The parsed store is kept in a registry shared by all rating managers,
+    tagged with the file's (mtime, size) signature like BaseManager's
+    identity map: repeated reads (one get_rating per player of a
+    standings table) parse the file, history included, only once until
+    it changes on disk.
+"""
+
+import json
+import os
+
+from managers.base_manager import BaseManager
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_RATING = 1500.0
+DEFAULT_K_FACTOR = 20
+
+
+class RatingManager:
+    """
+    Elo rating engine with a persisted rating-history store.
+
+    Attributes:
+        file_path (str): Path to the ratings JSON file
+        tournament_manager (TournamentManager): Source of the finished rounds
+        k_factor (float): Elo K-factor
+        initial_rating (float): Rating of a player without games
+    """
+
+    # Parsed stores shared by all rating managers: absolute path -> (signature, state)
+    _state_registry = {}
+
+    def __init__(
+        self,
+        file_path='data/ratings.json',
+        tournament_manager=None,
+        k_factor=DEFAULT_K_FACTOR,
+        initial_rating=DEFAULT_RATING
+    ):
+        """
+        Initialize the rating manager.
+
+        Args:
+            file_path (str, optional): Path to the ratings file.
+                                       Defaults to 'data/ratings.json'.
+            tournament_manager (TournamentManager, optional): Source of the
+                                                              match archive
+            k_factor (float, optional): Elo K-factor. Defaults to 20.
+            initial_rating (float, optional): Starting rating. Defaults to 1500.
+        """
+        self.file_path = file_path
+        self.tournament_manager = tournament_manager
+        self.k_factor = k_factor
+        self.initial_rating = initial_rating
+
+    # ========================================
+    # FILE SYSTEM OPERATIONS
+    # ========================================
+
+    def _empty_state(self):
+        """
+        Build the state of a store without any rated game.
+
+        Returns:
+            dict: Empty rating state
+        """
+        return {"ratings": {}, "games": {}, "history": {}, "rounds": [], "last_start": None}
+
+    def _load_state(self):
+        """
+        Read the rating store, replaying the archive if it doesn't exist yet.
+
+        The parsed state is cached until the file's signature changes.
+        Callers must not modify it unless they save it (_save_state).
+
+        Returns:
+            dict: Rating state (player ID keys as strings, like in JSON)
+        """
+        key = os.path.abspath(self.file_path)
+        signature = BaseManager._stat_signature(self.file_path)
+        cached = RatingManager._state_registry.get(key)
+        if signature is not None and cached is not None and cached[0] == signature:
+            return cached[1]
+
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return self.recompute()
+        RatingManager._state_registry[key] = (signature, state)
+        return state
+
+    def _save_state(self, state):
+        """
+        Write the rating store through a temporary file, and cache it.
+
+        Args:
+            state (dict): Rating state
+        """
+        key = os.path.abspath(self.file_path)
+        dir_name = os.path.dirname(self.file_path)
+        if dir_name:
+            os.makedirs(dir_name, exist_ok=True)
+
+        temp_path = self.file_path + ".tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, separators=(",", ":"))
+            os.replace(temp_path, self.file_path)
+        except OSError:
+            # The cached state may hold changes that never reached the disk
+            RatingManager._state_registry.pop(key, None)
+            raise
+        RatingManager._state_registry[key] = (
+            BaseManager._stat_signature(self.file_path), state
+        )
+
+    # ========================================
+    # READING RATINGS (NO REPLAY)
+    # ========================================
+
+    def get_ratings(self):
+        """
+        Get the current rating of every rated player.
+
+        Returns:
+            dict: Player ID (int) -> rating
+        """
+        return {
+            int(player_id): rating
+            for player_id, rating in self._load_state()["ratings"].items()
+        }
+
+    def get_rating(self, player_id):
+        """
+        Get a player's current rating.
+
+        Args:
+            player_id (int): The player's ID
+
+        Returns:
+            float: Rating (initial rating if the player has no rated game)
+        """
+        return self._load_state()["ratings"].get(str(player_id), self.initial_rating)
+
+    def get_games_played(self):
+        """
+        Get the number of rated games of every rated player.
+
+        Returns:
+            dict: Player ID (int) -> number of games
+        """
+        return {
+            int(player_id): games
+            for player_id, games in self._load_state()["games"].items()
+        }
+
+    def get_history(self, player_id):
+        """
+        Get a player's rating after each round they played.
+
+        Args:
+            player_id (int): The player's ID
+
+        Returns:
+            list: [round_id, rating] pairs, oldest first
+        """
+        return list(self._load_state()["history"].get(str(player_id), []))
+
+    # ========================================
+    # RECOMPUTATION
+    # ========================================
+
+    def recompute(self):
+        """
+        Replay every finished round of every tournament and save the result.
+
+        Reads raw tournament records: nothing is hydrated.
+
+        Returns:
+            dict: The new rating state
+        """
+        finished_rounds = []
+        if self.tournament_manager is not None:
+            for tournament_data in self.tournament_manager._load_data():
+                for round_data in tournament_data.get("rounds", []):
+                    if round_data.get("end_date_time") is not None:
+                        finished_rounds.append(round_data)
+        finished_rounds.sort(key=self._round_order)
+
+        state = self._empty_state()
+        self._apply_rounds(state, finished_rounds)
+        self._save_state(state)
+        return state
+
+    def update_with_round(self, round_obj):
+        """
+        Apply one newly finished round to the stored ratings.
+
+        Args:
+            round_obj (Round or dict): The finished round
+
+        Returns:
+            bool: True if the ratings changed
+        """
+        round_data = round_obj.to_dict() if hasattr(round_obj, "to_dict") else round_obj
+        if round_data.get("end_date_time") is None:
+            return False
+
+        state = self._load_state()
+        if round_data.get("round_id") in state["rounds"]:
+            # Already included (e.g., by the replay that created the store)
+            return False
+
+        last_start = state.get("last_start")
+        if last_start is not None and (round_data.get("start_date_time") or "") < last_start:
+            self.recompute()
+            return True
+
+        self._apply_rounds(state, [round_data])
+        self._save_state(state)
+        return True
+
+    @staticmethod
+    def _round_order(round_data):
+        """
+        Sort key putting rounds in chronological order.
+
+        Args:
+            round_data (dict): Raw round
+
+        Returns:
+            tuple: (start_date_time, round_id)
+        """
+        return (round_data.get("start_date_time") or "", round_data.get("round_id") or 0)
+
+    # ========================================
+    # ELO COMPUTATION
+    # ========================================
+
+    def _apply_rounds(self, state, rounds_data):
+        """
+        Rate the games of several rounds, in the given order.
+
+        Args:
+            state (dict): Rating state, updated in place
+            rounds_data (list): Raw finished rounds, chronological
+        """
+        ratings = state["ratings"]
+        games = state["games"]
+        history = state["history"]
+
+        for round_data in rounds_data:
+            white_ids = []
+            black_ids = []
+            white_scores = []
+            for (white_id, white_score), (black_id, _) in round_data.get("matches", []):
+                white_ids.append(str(white_id))
+                black_ids.append(str(black_id))
+                white_scores.append(white_score)
+
+            white_ratings = [ratings.get(player_id, self.initial_rating) for player_id in white_ids]
+            black_ratings = [ratings.get(player_id, self.initial_rating) for player_id in black_ids]
+            changes = self._rating_changes(white_ratings, black_ratings, white_scores)
+
+            round_id = round_data.get("round_id")
+            for player_id, rating, change in zip(
+                white_ids + black_ids,
+                white_ratings + black_ratings,
+                changes + [-change for change in changes]
+            ):
+                new_rating = round(rating + change, 1)
+                ratings[player_id] = new_rating
+                games[player_id] = games.get(player_id, 0) + 1
+                history.setdefault(player_id, []).append([round_id, new_rating])
+
+            state["rounds"].append(round_id)
+            state["last_start"] = max(
+                state["last_start"] or "", round_data.get("start_date_time") or ""
+            )
+
+    def _rating_changes(self, white_ratings, black_ratings, white_scores):
+        """
+        Compute the rating change of the first player of each game.
+
+        The second player's change is the opposite (same K-factor).
+
+        Args:
+            white_ratings (list): First players' ratings before the round
+            black_ratings (list): Second players' ratings before the round
+            white_scores (list): Points of the first players
+
+        Returns:
+            list: Rating change of each first player
+        """
+        if not white_scores:
+            return []
+
+        if np is not None:
+            white = np.asarray(white_ratings, dtype=np.float64)
+            black = np.asarray(black_ratings, dtype=np.float64)
+            expected = 1.0 / (1.0 + 10.0 ** ((black - white) / 400.0))
+            changes = self.k_factor * (np.asarray(white_scores, dtype=np.float64) - expected)
+            return changes.tolist()
+
+        return [
+            self.k_factor * (score - 1.0 / (1.0 + 10.0 ** ((black - white) / 400.0)))
+            for white, black, score in zip(white_ratings, black_ratings, white_scores)
+        ]
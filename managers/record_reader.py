@@ -0,0 +1,167 @@
+"""
+Record Reader
+
+Streams records from CSV or JSONL import files, one row at a time, so
+imports never hold the whole input file in memory.
+
+Formats (chosen by file extension):
+    - .csv: header line with the field names, then one record per line
+      (UTF-8, with or without BOM)
+    - .jsonl / .ndjson: one JSON object per line (blank lines skipped)
+
+Storage files:
+    iter_json_array() streams the elements of a JSON array file (the
+    format of players.json and tournaments.json) the same way: only the
+    element being decoded is held in memory, never the whole file.
+"""
+
+import csv
+import json
+import os
+import re
+
+CSV_EXTENSIONS = (".csv",)
+JSONL_EXTENSIONS = (".jsonl", ".ndjson")
+
+# Characters read at a time by iter_json_array
+JSON_CHUNK_SIZE = 64 * 1024
+
+# Characters that may follow an array element
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+_AFTER_ELEMENT = frozenset(" \t\r\n,]")
+
+
+class UnsupportedFormatError(ValueError):
+    """Raised for a file that is neither CSV nor JSONL."""
+
+
+def read_records(file_path):
+    """
+    Stream the records of an import file.
+
+    Args:
+        file_path (str): CSV or JSONL file
+
+    Yields:
+        tuple: (line number, record dict, or None for a JSONL line that
+               is not a JSON object)
+
+    Raises:
+        UnsupportedFormatError: If the extension is not supported
+        OSError: If the file cannot be read
+        csv.Error: If the CSV file is malformed
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension in CSV_EXTENSIONS:
+        with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+            reader = csv.DictReader(f)
+            for record in reader:
+                yield reader.line_num, record
+    elif extension in JSONL_EXTENSIONS:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    record = None
+                yield line_number, record if isinstance(record, dict) else None
+    else:
+        raise UnsupportedFormatError(
+            f"Format non pris en charge : {extension or 'sans extension'} "
+            "(utilisez .csv ou .jsonl)."
+        )
+
+
+def clean_field(value):
+    """
+    Normalize an empty CSV cell or missing JSON field to None.
+
+    Args:
+        value: Raw field value
+
+    Returns:
+        The value (stripped if it is a string), or None if empty
+    """
+    if isinstance(value, str):
+        value = value.strip()
+        return value or None
+    return value
+
+
+def iter_json_array(file_path, chunk_size=JSON_CHUNK_SIZE):
+    """
+    Stream the elements of a file holding one JSON array.
+
+    The file is read in chunks; an element split across chunks is decoded
+    once the rest of it has been read (the read size doubles while an
+    element is incomplete, so a large element is not re-parsed too often).
+
+    Args:
+        file_path (str): JSON file whose top-level value is an array
+        chunk_size (int, optional): Characters per read
+
+    Yields:
+        The decoded elements, in file order (nothing if the file is missing)
+
+    Raises:
+        json.JSONDecodeError: If the file is not a valid JSON array
+    """
+    decoder = json.JSONDecoder()
+    try:
+        f = open(file_path, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        return
+
+    with f:
+        buffer = ""
+        position = 0
+        at_end = False
+        expecting = "["
+
+        def read_more(size):
+            nonlocal buffer, position, at_end
+            chunk = f.read(size)
+            at_end = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+
+        while True:
+            position = _WHITESPACE.match(buffer, position).end()
+            if position == len(buffer):
+                if at_end:
+                    raise json.JSONDecodeError("Unexpected end of file", buffer, position)
+                read_more(chunk_size)
+                continue
+
+            char = buffer[position]
+            if expecting == "[":
+                if char != "[":
+                    raise json.JSONDecodeError("Expecting '['", buffer, position)
+                position += 1
+                expecting = "first"
+            elif expecting == "separator":
+                if char == "]":
+                    return
+                if char != ",":
+                    raise json.JSONDecodeError("Expecting ',' or ']'", buffer, position)
+                position += 1
+                expecting = "element"
+            elif char == "]" and expecting == "first":
+                return
+            else:
+                try:
+                    element, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if at_end:
+                        raise
+                    read_more(max(chunk_size, len(buffer)))
+                    continue
+                if not at_end and (end == len(buffer) or buffer[end] not in _AFTER_ELEMENT):
+                    # A number cut by the chunk ("2." of "2.5") decodes too early
+                    read_more(max(chunk_size, len(buffer)))
+                    continue
+                position = end
+                expecting = "separator"
+                yield element
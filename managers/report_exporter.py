@@ -0,0 +1,192 @@
+"""
+Report Exporter
+
+Writes report rows to a file as they are produced, for reports too large
+for the terminal (e.g., the federation's whole player archive). Rows are
+never collected in a list: given a row generator fed by
+BaseManager.iter_items, an export runs in constant memory.
+
+Formats (chosen by file extension):
+    - .csv: header line with the column keys, then one row per line
+      (UTF-8). A players export can be imported back with
+      "Importer des joueurs".
+    - .jsonl / .ndjson: one JSON object per row, keyed by column key
+    - .html / .htm: self-contained page (inline style, no external file)
+      with the report title and one table headed by the column labels
+
+The file is written through a temporary file next to the destination
+and renamed at the end: an interrupted export never leaves half a file.
+"""
+
+import csv
+import html
+import json
+import os
+
+from managers.record_reader import CSV_EXTENSIONS, JSONL_EXTENSIONS, UnsupportedFormatError
+
+HTML_EXTENSIONS = (".html", ".htm")
+
+# Shared encoder: json.dumps(ensure_ascii=False) would build one per row
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+HTML_HEADER = """<!DOCTYPE html>
+<html lang="fr">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 8px; text-align: left; }}
+th {{ background: #eee; position: sticky; top: 0; }}
+tbody tr:nth-child(even) {{ background: #f7f7f7; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+<table>
+<thead><tr>{header_cells}</tr></thead>
+<tbody>
+"""
+
+HTML_FOOTER = """</tbody>
+</table>
+<p>{count} ligne(s)</p>
+</body>
+</html>
+"""
+
+
+class ReportExporter:
+    """
+    Streams report rows to CSV, JSONL or HTML files.
+
+    Stateless: the same exporter can write any number of files.
+    """
+
+    # ========================================
+    # EXPORT
+    # ========================================
+
+    def export(self, file_path, title, columns, rows):
+        """
+        Write a report to a file, in the format given by its extension.
+
+        Args:
+            file_path (str): Destination (.csv, .jsonl, .ndjson, .html, .htm)
+            title (str): Report title (HTML only)
+            columns (list): (key, label) pairs: keys name the CSV and JSONL
+                            fields, labels head the HTML table
+            rows (iterable): Row data (each row is a list, one value per
+                             column), e.g. a generator
+
+        Returns:
+            int: Number of rows written
+
+        Raises:
+            UnsupportedFormatError: If the extension is not supported
+            OSError: If the file cannot be written
+        """
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension in CSV_EXTENSIONS:
+            writer = self._write_csv
+        elif extension in JSONL_EXTENSIONS:
+            writer = self._write_jsonl
+        elif extension in HTML_EXTENSIONS:
+            writer = self._write_html
+        else:
+            raise UnsupportedFormatError(
+                f"Format non pris en charge : {extension or 'sans extension'} "
+                "(utilisez .csv, .jsonl ou .html)."
+            )
+
+        dir_name = os.path.dirname(file_path)
+        if dir_name:
+            os.makedirs(dir_name, exist_ok=True)
+
+        temp_path = file_path + ".tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8', newline='') as f:
+                count = writer(f, title, columns, rows)
+            os.replace(temp_path, file_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return count
+
+    # ========================================
+    # WRITERS
+    # ========================================
+
+    @staticmethod
+    def _write_csv(f, title, columns, rows):
+        """
+        Write a header line of column keys, then one line per row.
+
+        Args:
+            f (file): Destination, opened with newline=''
+            title (str): Report title (unused)
+            columns (list): (key, label) pairs
+            rows (iterable): Row data
+
+        Returns:
+            int: Number of rows written
+        """
+        writer = csv.writer(f)
+        writer.writerow([key for key, _ in columns])
+        count = 0
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+        return count
+
+    @staticmethod
+    def _write_jsonl(f, title, columns, rows):
+        """
+        Write one JSON object per row, keyed by column key.
+
+        Args:
+            f (file): Destination
+            title (str): Report title (unused)
+            columns (list): (key, label) pairs
+            rows (iterable): Row data
+
+        Returns:
+            int: Number of rows written
+        """
+        keys = [key for key, _ in columns]
+        count = 0
+        for row in rows:
+            f.write(_JSON_ENCODER.encode(dict(zip(keys, row))) + "\n")
+            count += 1
+        return count
+
+    @staticmethod
+    def _write_html(f, title, columns, rows):
+        """
+        Write a self-contained HTML page with one table row per row.
+
+        Args:
+            f (file): Destination
+            title (str): Page title
+            columns (list): (key, label) pairs
+            rows (iterable): Row data
+
+        Returns:
+            int: Number of rows written
+        """
+        f.write(HTML_HEADER.format(
+            title=html.escape(title),
+            header_cells="".join(f"<th>{html.escape(label)}</th>" for _, label in columns),
+        ))
+        count = 0
+        for row in rows:
+            cells = "".join(
+                f"<td>{html.escape('' if value is None else str(value))}</td>"
+                for value in row
+            )
+            f.write(f"<tr>{cells}</tr>\n")
+            count += 1
+        f.write(HTML_FOOTER.format(count=count))
+        return count
@@ -0,0 +1,260 @@
+"""
+Result Importer
+
+Reads the results of a whole round from a CSV or JSONL file, for large
+rounds where typing each board is too slow.
+
+File formats (one record per board, in any order):
+    CSV with a header line, or JSONL (one JSON object per line), with
+    the same field names:
+    - board: 1-based board number in the round, and/or
+    - white_id, black_id: player IDs of the board (either order)
+    - result: "1-0", "0-1", "1/2-1/2" (also "½-½", "0.5-0.5", "="),
+      or the menu codes "1", "2", "3", or
+    - white_score, black_score: points of each player (1, 0.5 or 0)
+
+    Example (CSV):
+        board,result
+        1,1-0
+        2,1/2-1/2
+
+    Example (JSONL):
+        {"white_id": 12, "black_id": 7, "result": "0-1"}
+
+Validation:
+    The whole file is checked before anything is applied: unknown boards
+    or players, pairings that don't match the round, invalid results,
+    duplicates and missing boards are all reported together, with their
+    line numbers. Nothing is recorded unless the file is entirely valid.
+"""
+
+import csv
+
+from managers.record_reader import read_records, clean_field, UnsupportedFormatError
+
+WHITE_WINS = (1.0, 0.0)
+BLACK_WINS = (0.0, 1.0)
+DRAW = (0.5, 0.5)
+
+RESULT_CODES = {
+    "1-0": WHITE_WINS,
+    "0-1": BLACK_WINS,
+    "1/2-1/2": DRAW,
+    "½-½": DRAW,
+    "0.5-0.5": DRAW,
+    "=": DRAW,
+    "1": WHITE_WINS,
+    "2": BLACK_WINS,
+    "3": DRAW,
+}
+
+VALID_SCORES = {(1.0, 0.0), (0.0, 1.0), (0.5, 0.5)}
+
+
+class ResultImportError(ValueError):
+    """
+    Raised when a results file cannot be applied.
+
+    Attributes:
+        errors (list): One message per problem found
+    """
+
+    def __init__(self, errors):
+        super().__init__(f"{len(errors)} erreur(s) dans le fichier de résultats")
+        self.errors = errors
+
+
+def _player_id(player):
+    """
+    Get the ID of a match player (Player object or raw ID).
+
+    Args:
+        player (Player or int): Match side
+
+    Returns:
+        int: Player ID
+    """
+    return getattr(player, "player_id", player)
+
+
+class ResultImporter:
+    """
+    Parses and validates a round's results file.
+
+    Stateless: the same importer can read any number of files.
+    """
+
+    # ========================================
+    # READING
+    # ========================================
+
+    def read_round_results(self, round_obj, file_path):
+        """
+        Read and validate the results of every board of a round.
+
+        Args:
+            round_obj (Round): The round being closed
+            file_path (str): CSV or JSONL file
+
+        Returns:
+            list: (score_a, score_b) for each match, in the round's order
+
+        Raises:
+            ResultImportError: With every problem found, if the file is
+                               unreadable or invalid in any way
+        """
+        try:
+            return self.validate(round_obj, read_records(file_path))
+        except UnsupportedFormatError as error:
+            raise ResultImportError([str(error)])
+        except OSError as error:
+            raise ResultImportError([f"Lecture impossible de {file_path} : {error.strerror}."])
+        except csv.Error as error:
+            raise ResultImportError([f"Fichier CSV invalide : {error}."])
+
+    # ========================================
+    # VALIDATION
+    # ========================================
+
+    def validate(self, round_obj, records):
+        """
+        Check all records against the round's pairings.
+
+        Args:
+            round_obj (Round): The round being closed
+            records (iterable): (line number, record dict or None) pairs
+
+        Returns:
+            list: (score_a, score_b) for each match, in the round's order
+
+        Raises:
+            ResultImportError: With every problem found
+        """
+        matches = round_obj.matches
+        boards_by_pair = {}
+        for board_index, match in enumerate(matches):
+            white_id, black_id = _player_id(match.white), _player_id(match.black)
+            boards_by_pair[(white_id, black_id)] = (board_index, False)
+            boards_by_pair[(black_id, white_id)] = (board_index, True)
+
+        scores = [None] * len(matches)
+        source_lines = [None] * len(matches)
+        errors = []
+
+        for line_number, record in records:
+            if record is None:
+                errors.append(f"Ligne {line_number} : objet JSON invalide.")
+                continue
+            try:
+                board_index, reversed_colors = self._find_board(record, matches, boards_by_pair)
+                score_a, score_b = self._parse_scores(record)
+            except ValueError as error:
+                errors.append(f"Ligne {line_number} : {error}")
+                continue
+
+            if reversed_colors:
+                score_a, score_b = score_b, score_a
+            if scores[board_index] is not None:
+                errors.append(
+                    f"Ligne {line_number} : échiquier {board_index + 1} déjà saisi "
+                    f"(ligne {source_lines[board_index]})."
+                )
+                continue
+            scores[board_index] = (score_a, score_b)
+            source_lines[board_index] = line_number
+
+        missing = [str(index + 1) for index, score in enumerate(scores) if score is None]
+        if missing:
+            shown = ", ".join(missing[:20]) + (" ..." if len(missing) > 20 else "")
+            errors.append(f"{len(missing)} échiquier(s) sans résultat : {shown}")
+
+        if errors:
+            raise ResultImportError(errors)
+        return scores
+
+    @staticmethod
+    def _find_board(record, matches, boards_by_pair):
+        """
+        Find the match a record refers to.
+
+        Args:
+            record (dict): File record
+            matches (list): Matches of the round
+            boards_by_pair (dict): (player_id, player_id) -> (board index,
+                                   True if the colors are reversed)
+
+        Returns:
+            tuple: (board index, True if the record lists black first)
+
+        Raises:
+            ValueError: If the record doesn't designate a board of the round
+        """
+        board = clean_field(record.get("board"))
+        white_id = clean_field(record.get("white_id"))
+        black_id = clean_field(record.get("black_id"))
+
+        board_index = None
+        if board is not None:
+            try:
+                board_index = int(board) - 1
+            except ValueError:
+                raise ValueError(f"numéro d'échiquier invalide : {board!r}.")
+            if not 0 <= board_index < len(matches):
+                raise ValueError(
+                    f"échiquier {board} inexistant (1 à {len(matches)})."
+                )
+
+        if white_id is None and black_id is None:
+            if board_index is None:
+                raise ValueError("indiquez 'board' ou 'white_id' et 'black_id'.")
+            return board_index, False
+
+        try:
+            pair = (int(white_id), int(black_id))
+        except (TypeError, ValueError):
+            raise ValueError("'white_id' et 'black_id' doivent être deux IDs de joueurs.")
+
+        found = boards_by_pair.get(pair)
+        if found is None:
+            raise ValueError(f"les joueurs {pair[0]} et {pair[1]} ne jouent pas ensemble ce round.")
+        if board_index is not None and found[0] != board_index:
+            raise ValueError(
+                f"les joueurs {pair[0]} et {pair[1]} jouent à l'échiquier "
+                f"{found[0] + 1}, pas {board}."
+            )
+        return found
+
+    @staticmethod
+    def _parse_scores(record):
+        """
+        Read the result of a record.
+
+        Args:
+            record (dict): File record
+
+        Returns:
+            tuple: (first player's points, second player's points),
+                   for the players in the order of the record
+
+        Raises:
+            ValueError: If the result is missing or invalid
+        """
+        result = clean_field(record.get("result"))
+        if result is not None:
+            scores = RESULT_CODES.get(str(result).replace(" ", ""))
+            if scores is None:
+                raise ValueError(f"résultat invalide : {result!r}.")
+            return scores
+
+        white_score = clean_field(record.get("white_score"))
+        black_score = clean_field(record.get("black_score"))
+        if white_score is None or black_score is None:
+            raise ValueError("indiquez 'result' ou 'white_score' et 'black_score'.")
+        try:
+            scores = (float(white_score), float(black_score))
+        except ValueError:
+            raise ValueError(f"scores invalides : {white_score!r}, {black_score!r}.")
+        if scores not in VALID_SCORES:
+            raise ValueError(f"scores impossibles : {scores[0]} - {scores[1]}.")
+        return scores
+
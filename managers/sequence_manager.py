@@ -0,0 +1,132 @@
+"""
+Sequence Manager
+
+Persistent, monotonic ID sequences stored in a small JSON file next to
+the data files (e.g., data/sequences.json).
+
+Each sequence remembers the last ID it handed out, so allocating an ID
+costs one read and one write of a tiny file instead of loading every
+item to find the maximum. IDs are never reused, even if the item that
+received one is never saved.
+
+File format:
+    {"player_id": 20, "round_id": 18}
+"""
+
+import json
+import os
+
+
+class SequenceManager:
+    """
+    Named ID counters persisted in a JSON file.
+
+    A sequence that does not exist yet is created from a seed function
+    (typically a one-time scan of the existing items for the highest ID).
+
+    Attributes:
+        file_path (str): Path to the sequences JSON file
+    """
+
+    def __init__(self, file_path):
+        """
+        Initialize the sequence manager.
+
+        Args:
+            file_path (str): Path to the sequences file (created on first write)
+        """
+        self.file_path = file_path
+
+    # ========================================
+    # FILE SYSTEM OPERATIONS
+    # ========================================
+
+    def _load_values(self):
+        """
+        Read all sequence values.
+
+        Returns:
+            dict: Sequence name -> last allocated ID
+        """
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return {}
+
+    def _save_values(self, values):
+        """
+        Write all sequence values through a temporary file.
+
+        Args:
+            values (dict): Sequence name -> last allocated ID
+        """
+        dir_name = os.path.dirname(self.file_path)
+        if dir_name:
+            os.makedirs(dir_name, exist_ok=True)
+
+        temp_path = self.file_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(values, f, indent=4)
+        os.replace(temp_path, self.file_path)
+
+    # ========================================
+    # ID ALLOCATION
+    # ========================================
+
+    def reserve(self, name, count, seed):
+        """
+        Allocate a block of consecutive IDs.
+
+        Args:
+            name (str): Sequence name (e.g., "player_id")
+            count (int): Number of IDs to allocate (must be positive)
+            seed (callable): Returns the highest ID already in use; only
+                             called if the sequence does not exist yet
+
+        Returns:
+            range: The allocated IDs
+        """
+        if count <= 0:
+            raise ValueError(f"Cannot reserve {count} IDs: count must be positive")
+
+        values = self._load_values()
+        last_value = values.get(name)
+        if last_value is None:
+            last_value = seed()
+
+        values[name] = last_value + count
+        self._save_values(values)
+        return range(last_value + 1, last_value + count + 1)
+
+    def next_value(self, name, seed):
+        """
+        Allocate a single ID.
+
+        Args:
+            name (str): Sequence name (e.g., "player_id")
+            seed (callable): Returns the highest ID already in use; only
+                             called if the sequence does not exist yet
+
+        Returns:
+            int: The allocated ID
+        """
+        return self.reserve(name, 1, seed)[0]
+
+    def observe(self, name, value):
+        """
+        Move a sequence forward if an ID was assigned outside of it.
+
+        Keeps the sequence ahead of items saved with explicit IDs.
+        Does nothing for sequences that don't exist yet (they will be
+        seeded from the data) or that are already past this value.
+
+        Args:
+            name (str): Sequence name
+            value (int): ID that was just stored
+        """
+        values = self._load_values()
+        last_value = values.get(name)
+        if last_value is not None and isinstance(value, int) and value > last_value:
+            values[name] = value
+            self._save_values(values)
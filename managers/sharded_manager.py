@@ -0,0 +1,319 @@
+"""
+Sharded JSON Manager
+
+Storage backend keeping one JSON file (shard) per item plus a small
+manifest file, instead of a single JSON array for the whole collection.
+
+Layout (tournaments):
+    data/tournaments/index.json            manifest: one header per tournament
+    data/tournaments/tournament_1.json     shard: full tournament 1
+    data/tournaments/tournament_2.json     shard: full tournament 2
+    ...
+
+Saving one item rewrites only its shard and the manifest, and loading
+some IDs reads only their shards, so write cost scales with the size of
+one item instead of the whole archive.
+
+The manifest is the change marker used by the cache: every write through
+this manager rewrites it. Shards edited by hand are not detected until
+the manifest changes.
+
+Layout selection:
+    TournamentManager uses this backend when created with layout="sharded"
+    or when the CHESS_TOURNAMENT_LAYOUT environment variable is set to
+    "sharded". On first use, an existing single-file tournaments.json is
+    split into shards (the original file is left untouched).
+"""
+
+import json
+import os
+
+from managers.base_manager import BaseManager
+
+LAYOUT_SINGLE = "single"
+LAYOUT_SHARDED = "sharded"
+
+MANIFEST_FILE_NAME = "index.json"
+
+
+def get_layout_name(layout=None):
+    """
+    Resolve which tournament file layout to use.
+
+    Args:
+        layout (str, optional): Explicit choice, LAYOUT_SINGLE or LAYOUT_SHARDED
+
+    Returns:
+        str: The layout name (environment variable if none given)
+    """
+    if layout is None:
+        layout = os.environ.get("CHESS_TOURNAMENT_LAYOUT", LAYOUT_SINGLE)
+    if layout not in (LAYOUT_SINGLE, LAYOUT_SHARDED):
+        raise ValueError(f"Unknown tournament layout: {layout}")
+    return layout
+
+
+class ShardedJsonManager(BaseManager):
+    """
+    Manager storing each item in its own JSON file, indexed by a manifest.
+
+    Only the raw storage hooks are overridden, so caching, the primary-key
+    index and hydration work exactly as with a single JSON file. It is
+    used as the storage_backend of TournamentManager.
+
+    Attributes:
+        directory (str): Directory holding the manifest and the shards
+        manifest_path (str): Path to the manifest file
+        shard_prefix (str): Shard file name prefix (e.g., "tournament_")
+        header_fields (tuple): Fields copied into each manifest entry
+        legacy_file_path (str): Single-file JSON array to migrate from
+    """
+
+    def __init__(
+        self,
+        directory,
+        model_class,
+        id_attribute_name,
+        shard_prefix,
+        header_fields=(),
+        legacy_file_path=None,
+    ):
+        """
+        Initialize the sharded manager.
+
+        Args:
+            directory (str): Directory for the manifest and shards
+            model_class (class): Model class to create instances from
+            id_attribute_name (str): Name of the ID attribute
+            shard_prefix (str): Shard file name prefix (e.g., "tournament_")
+            header_fields (tuple, optional): Fields kept in the manifest so
+                                             listings don't need the shards
+            legacy_file_path (str, optional): JSON array file split into
+                                              shards when no manifest exists
+        """
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, MANIFEST_FILE_NAME)
+        self.shard_prefix = shard_prefix
+        self.header_fields = tuple(header_fields)
+        self.legacy_file_path = legacy_file_path
+        super().__init__(
+            file_path=self.manifest_path,
+            model_class=model_class,
+            id_attribute_name=id_attribute_name
+        )
+
+    # ========================================
+    # FILE SYSTEM OPERATIONS
+    # ========================================
+
+    def _ensure_file_exists(self):
+        """
+        Create the directory and manifest if they don't exist.
+
+        If a legacy single-file JSON array exists, it is split into shards.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+
+        if os.path.exists(self.manifest_path):
+            return
+
+        legacy_data = []
+        if self.legacy_file_path and os.path.exists(self.legacy_file_path):
+            try:
+                with open(self.legacy_file_path, 'r', encoding='utf-8') as f:
+                    legacy_data = json.load(f)
+            except json.JSONDecodeError:
+                legacy_data = []
+
+        self._save_data(legacy_data)
+
+    def _cache_key(self):
+        """
+        Identify the sharded collection in the shared identity map.
+
+        Returns:
+            str: Absolute path of the manifest
+        """
+        return os.path.abspath(self.manifest_path)
+
+    def _file_signature(self):
+        """
+        Describe the current state of the manifest.
+
+        Returns:
+            tuple: (mtime in nanoseconds, size in bytes), or None if missing
+        """
+        return self._stat_signature(self.manifest_path)
+
+    def _shard_path(self, item_id):
+        """
+        Get the shard file path of an item.
+
+        Args:
+            item_id (int): Item ID
+
+        Returns:
+            str: Path to the shard file
+        """
+        return os.path.join(self.directory, f"{self.shard_prefix}{item_id}.json")
+
+    @staticmethod
+    def _write_json_atomic(path, data):
+        """
+        Write JSON through a temporary file so readers never see half a file.
+
+        Args:
+            path (str): Target file
+            data: JSON-serializable data
+        """
+        temp_path = path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+    # ========================================
+    # MANIFEST
+    # ========================================
+
+    def load_manifest(self):
+        """
+        Read the manifest entries without opening any shard.
+
+        Returns:
+            list: One dict per item, with the ID, the header fields and
+                  the shard file name ("file")
+        """
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return []
+
+    def _manifest_entry(self, record):
+        """
+        Build the manifest entry of a record.
+
+        Args:
+            record (dict): Full item record
+
+        Returns:
+            dict: ID, header fields and shard file name
+        """
+        item_id = record[self.id_attribute_name]
+        entry = {self.id_attribute_name: item_id}
+        for field in self.header_fields:
+            entry[field] = record.get(field)
+        entry["file"] = os.path.basename(self._shard_path(item_id))
+        return entry
+
+    # ========================================
+    # RAW STORAGE HOOKS
+    # ========================================
+
+    def _load_data(self, ids=None):
+        """
+        Load raw records from their shards.
+
+        Args:
+            ids (list, optional): Only read the shards of these IDs.
+                                  Reads every shard if None.
+
+        Returns:
+            list: Records in manifest order
+        """
+        entries = self.load_manifest()
+        if ids is not None:
+            id_set = set(ids)
+            entries = [
+                entry for entry in entries
+                if entry[self.id_attribute_name] in id_set
+            ]
+
+        return list(self._read_shards(entries))
+
+    def _iter_data(self):
+        """
+        Stream raw records shard by shard (see BaseManager._iter_data).
+
+        Yields:
+            dict: Records in manifest order
+        """
+        yield from self._read_shards(self.load_manifest())
+
+    def _read_shards(self, entries):
+        """
+        Read the shards of some manifest entries, skipping unreadable ones.
+
+        Args:
+            entries (list): Manifest entries
+
+        Yields:
+            dict: One record per readable shard
+        """
+        for entry in entries:
+            shard_path = os.path.join(self.directory, entry["file"])
+            try:
+                with open(shard_path, 'r', encoding='utf-8') as f:
+                    yield json.load(f)
+            except (json.JSONDecodeError, FileNotFoundError):
+                continue
+
+    def _save_data(self, data):
+        """
+        Replace the whole collection: every shard, then the manifest.
+
+        Shards of items no longer present are deleted.
+
+        Args:
+            data (list): List of dictionaries to save
+        """
+        previous_files = {entry["file"] for entry in self.load_manifest()}
+
+        manifest = []
+        for record in data:
+            self._write_json_atomic(
+                self._shard_path(record[self.id_attribute_name]), record
+            )
+            manifest.append(self._manifest_entry(record))
+        self._write_json_atomic(self.manifest_path, manifest)
+
+        for file_name in previous_files - {entry["file"] for entry in manifest}:
+            try:
+                os.remove(os.path.join(self.directory, file_name))
+            except FileNotFoundError:
+                pass
+
+    def _append_records(self, records):
+        """
+        Write the shards of new items, then the manifest once.
+
+        Args:
+            records (iterable): Dehydrated items with new IDs (e.g., a generator)
+
+        Returns:
+            int: Number of records written
+        """
+        entries = []
+        for record in records:
+            self._write_json_atomic(
+                self._shard_path(record[self.id_attribute_name]), record
+            )
+            entries.append(self._manifest_entry(record))
+        if entries:
+            self._write_json_atomic(self.manifest_path, self.load_manifest() + entries)
+        return len(entries)
+
+    def _write_record(self, record):
+        """
+        Insert or replace one item: rewrite its shard and the manifest only.
+
+        Args:
+            record (dict): Dehydrated item
+        """
+        self._write_json_atomic(
+            self._shard_path(record[self.id_attribute_name]), record
+        )
+        manifest = self._merge_records(
+            self.load_manifest(), [self._manifest_entry(record)]
+        )
+        self._write_json_atomic(self.manifest_path, manifest)
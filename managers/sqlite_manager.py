@@ -0,0 +1,596 @@
+"""
+SQLite Manager
+
+SQLite storage backend implementing the BaseManager contract
+(load_items, save_items, add_item, get_item_by_id, get_next_id) on top
+of the standard library sqlite3 module.
+
+Instead of one JSON document per entity, data is stored in proper tables:
+    players             one row per player
+    tournaments         one row per tournament (header fields)
+    tournament_players  enrolled players, in enrollment order
+    rounds              one row per round
+    matches             one row per board
+    player_scores       one row per (tournament, player)
+
+Indexes on player_id, national_id and tournament_id make point queries
+and per-tournament updates cheap: writing one tournament only touches
+that tournament's rows.
+
+Backend selection:
+    PlayerManager and TournamentManager use this backend when created with
+    backend="sqlite" or when the CHESS_STORAGE_BACKEND environment variable
+    is set to "sqlite". The database path comes from CHESS_SQLITE_PATH
+    (defaults to 'data/chess.db').
+
+Migration:
+    python -m managers.sqlite_manager
+    copies data/players.json and data/tournaments/tournaments.json into
+    the database (existing rows are replaced).
+"""
+
+import json
+import os
+import sqlite3
+from contextlib import closing
+from itertools import islice
+
+from managers.base_manager import BaseManager
+
+BACKEND_JSON = "json"
+BACKEND_SQLITE = "sqlite"
+
+DEFAULT_DB_PATH = "data/chess.db"
+
+# Tournaments rebuilt per query when streaming (see _iter_data)
+ITER_BATCH_SIZE = 100
+
+# Records per executemany when appending (see _append_records)
+WRITE_BATCH_SIZE = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    player_id INTEGER PRIMARY KEY,
+    last_name TEXT NOT NULL,
+    first_name TEXT NOT NULL,
+    date_of_birth TEXT,
+    national_id TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_players_national_id ON players (national_id);
+
+CREATE TABLE IF NOT EXISTS tournaments (
+    tournament_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    location TEXT,
+    description TEXT,
+    start_date TEXT,
+    end_date TEXT,
+    number_of_rounds INTEGER,
+    current_round INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS tournament_players (
+    tournament_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    PRIMARY KEY (tournament_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_tournament_players_player_id
+    ON tournament_players (player_id);
+
+CREATE TABLE IF NOT EXISTS rounds (
+    tournament_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    round_id INTEGER,
+    name TEXT,
+    start_date_time TEXT,
+    end_date_time TEXT,
+    PRIMARY KEY (tournament_id, position)
+);
+
+CREATE TABLE IF NOT EXISTS matches (
+    tournament_id INTEGER NOT NULL,
+    round_position INTEGER NOT NULL,
+    board INTEGER NOT NULL,
+    player_a_id INTEGER NOT NULL,
+    score_a REAL NOT NULL,
+    player_b_id INTEGER NOT NULL,
+    score_b REAL NOT NULL,
+    PRIMARY KEY (tournament_id, round_position, board)
+);
+CREATE INDEX IF NOT EXISTS idx_matches_player_a_id ON matches (player_a_id);
+CREATE INDEX IF NOT EXISTS idx_matches_player_b_id ON matches (player_b_id);
+
+CREATE TABLE IF NOT EXISTS player_scores (
+    tournament_id INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    total_points REAL NOT NULL,
+    opponents_history TEXT NOT NULL,
+    PRIMARY KEY (tournament_id, player_id)
+);
+CREATE INDEX IF NOT EXISTS idx_player_scores_player_id ON player_scores (player_id);
+"""
+
+PLAYER_COLUMNS = (
+    "player_id", "last_name", "first_name", "date_of_birth", "national_id"
+)
+
+TOURNAMENT_COLUMNS = (
+    "tournament_id", "name", "location", "description", "start_date",
+    "end_date", "number_of_rounds", "current_round"
+)
+
+# Child tables rewritten when a tournament is saved
+TOURNAMENT_CHILD_TABLES = (
+    "tournament_players", "rounds", "matches", "player_scores"
+)
+
+
+def get_backend_name(backend=None):
+    """
+    Resolve which storage backend a manager should use.
+
+    Args:
+        backend (str, optional): Explicit choice, BACKEND_JSON or BACKEND_SQLITE
+
+    Returns:
+        str: The backend name (environment variable if none given)
+    """
+    if backend is None:
+        backend = os.environ.get("CHESS_STORAGE_BACKEND", BACKEND_JSON)
+    if backend not in (BACKEND_JSON, BACKEND_SQLITE):
+        raise ValueError(f"Unknown storage backend: {backend}")
+    return backend
+
+
+def get_db_path():
+    """
+    Get the SQLite database path from the environment.
+
+    Returns:
+        str: Value of CHESS_SQLITE_PATH, or DEFAULT_DB_PATH
+    """
+    return os.environ.get("CHESS_SQLITE_PATH", DEFAULT_DB_PATH)
+
+
+class SqliteManager(BaseManager):
+    """
+    Manager storing one entity type ("players" or "tournaments") in SQLite.
+
+    Only the raw storage hooks are overridden, so caching, the primary-key
+    index and hydration work exactly as with JSON files. It can be used on
+    its own or as the storage_backend of PlayerManager/TournamentManager.
+
+    Attributes:
+        db_path (str): Path to the SQLite database file
+        entity (str): "players" or "tournaments"
+    """
+
+    ENTITIES = ("players", "tournaments")
+
+    def __init__(self, db_path, model_class, id_attribute_name, entity):
+        """
+        Initialize the SQLite manager.
+
+        Args:
+            db_path (str): Path to the database file (e.g., "data/chess.db")
+            model_class (class): Model class to create instances from
+            id_attribute_name (str): Name of the ID attribute
+            entity (str): "players" or "tournaments"
+        """
+        if entity not in self.ENTITIES:
+            raise ValueError(f"Unknown SQLite entity: {entity}")
+
+        self.db_path = db_path
+        self.entity = entity
+        super().__init__(
+            file_path=db_path,
+            model_class=model_class,
+            id_attribute_name=id_attribute_name
+        )
+
+    # ========================================
+    # CONNECTION AND SCHEMA
+    # ========================================
+
+    def _connect(self):
+        """
+        Open a connection to the database.
+
+        Returns:
+            sqlite3.Connection: Connection with rows accessible by column name
+        """
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _ensure_file_exists(self):
+        """
+        Create the database file, its directory and all tables if needed.
+        """
+        dir_name = os.path.dirname(self.db_path)
+
+        if dir_name:
+            os.makedirs(dir_name, exist_ok=True)
+
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def _cache_key(self):
+        """
+        Identify this entity's table set in the shared identity map.
+
+        Returns:
+            tuple: (absolute database path, entity name)
+        """
+        return (os.path.abspath(self.db_path), self.entity)
+
+    def _file_signature(self):
+        """
+        Describe the current state of the database file.
+
+        Combines the file's mtime/size with the header's file change
+        counter, which SQLite increments on every committed transaction
+        (default rollback journal mode).
+
+        Returns:
+            tuple: (mtime in nanoseconds, size in bytes, change counter),
+                   or None if missing
+        """
+        signature = self._stat_signature(self.db_path)
+        if signature is None:
+            return None
+
+        with open(self.db_path, 'rb') as f:
+            f.seek(24)
+            change_counter = f.read(4)
+        return signature + (change_counter,)
+
+    # ========================================
+    # RAW STORAGE HOOKS
+    # ========================================
+
+    def _load_data(self, ids=None):
+        """
+        Load raw records from the database.
+
+        Args:
+            ids (list, optional): Only load these IDs. Loads everything if None.
+
+        Returns:
+            list: Records in the same dict format as the JSON files
+        """
+        with closing(self._connect()) as conn:
+            if self.entity == "players":
+                return self._read_players(conn, ids)
+            return self._read_tournaments(conn, ids)
+
+    def _iter_data(self):
+        """
+        Stream raw records from the database (see BaseManager._iter_data).
+
+        Players are read straight from the cursor; tournaments, whose
+        records are rebuilt from several tables, by batches of
+        ITER_BATCH_SIZE.
+
+        Yields:
+            dict: Records in the same dict format as the JSON files
+        """
+        with closing(self._connect()) as conn:
+            if self.entity == "players":
+                query = f"SELECT {', '.join(PLAYER_COLUMNS)} FROM players ORDER BY player_id"
+                for row in conn.execute(query):
+                    yield dict(row)
+                return
+
+            tournament_ids = [
+                row[0] for row in
+                conn.execute("SELECT tournament_id FROM tournaments ORDER BY tournament_id")
+            ]
+            for start in range(0, len(tournament_ids), ITER_BATCH_SIZE):
+                yield from self._read_tournaments(
+                    conn, tournament_ids[start:start + ITER_BATCH_SIZE]
+                )
+
+    def _save_data(self, data):
+        """
+        Replace every stored record of this entity in one transaction.
+
+        Args:
+            data (list): List of dictionaries to save
+        """
+        with closing(self._connect()) as conn, conn:
+            if self.entity == "players":
+                conn.execute("DELETE FROM players")
+                self._write_players(conn, data)
+            else:
+                for table in ("tournaments",) + TOURNAMENT_CHILD_TABLES:
+                    conn.execute(f"DELETE FROM {table}")
+                for record in data:
+                    self._write_tournament(conn, record)
+
+    def _write_record(self, record):
+        """
+        Insert or replace a single record in one transaction.
+
+        Args:
+            record (dict): Dehydrated item
+        """
+        with closing(self._connect()) as conn, conn:
+            if self.entity == "players":
+                self._write_players(conn, [record])
+            else:
+                self._write_tournament(conn, record)
+
+    def _append_records(self, records):
+        """
+        Insert new records in batches, all in one transaction.
+
+        Args:
+            records (iterable): Dehydrated items with new IDs (e.g., a generator)
+
+        Returns:
+            int: Number of records written
+        """
+        count = 0
+        records = iter(records)
+        with closing(self._connect()) as conn, conn:
+            while True:
+                batch = list(islice(records, WRITE_BATCH_SIZE))
+                if not batch:
+                    break
+                if self.entity == "players":
+                    self._write_players(conn, batch)
+                else:
+                    for record in batch:
+                        self._write_tournament(conn, record)
+                count += len(batch)
+        return count
+
+    # ========================================
+    # TABLE MAPPING: PLAYERS
+    # ========================================
+
+    def _read_players(self, conn, ids=None):
+        """
+        Read player rows as dictionaries.
+
+        Args:
+            conn (sqlite3.Connection): Open connection
+            ids (list, optional): Player IDs to read, or None for all
+
+        Returns:
+            list: Player dictionaries ordered by player_id
+        """
+        query = f"SELECT {', '.join(PLAYER_COLUMNS)} FROM players"
+        where, params = self._id_filter("player_id", ids)
+        rows = conn.execute(f"{query}{where} ORDER BY player_id", params)
+        return [dict(row) for row in rows]
+
+    def _write_players(self, conn, records):
+        """
+        Insert or replace player rows.
+
+        Args:
+            conn (sqlite3.Connection): Open connection inside a transaction
+            records (list): Player dictionaries
+        """
+        placeholders = ", ".join("?" for _ in PLAYER_COLUMNS)
+        conn.executemany(
+            f"INSERT OR REPLACE INTO players ({', '.join(PLAYER_COLUMNS)}) "
+            f"VALUES ({placeholders})",
+            [tuple(record.get(column) for column in PLAYER_COLUMNS) for record in records]
+        )
+
+    # ========================================
+    # TABLE MAPPING: TOURNAMENTS
+    # ========================================
+
+    def _read_tournaments(self, conn, ids=None):
+        """
+        Read tournaments and rebuild their nested JSON-style structure.
+
+        Args:
+            conn (sqlite3.Connection): Open connection
+            ids (list, optional): Tournament IDs to read, or None for all
+
+        Returns:
+            list: Tournament dictionaries ordered by tournament_id
+        """
+        where, params = self._id_filter("tournament_id", ids)
+
+        tournaments = {}
+        rows = conn.execute(
+            f"SELECT {', '.join(TOURNAMENT_COLUMNS)} FROM tournaments"
+            f"{where} ORDER BY tournament_id",
+            params
+        )
+        for row in rows:
+            record = dict(row)
+            record["rounds"] = []
+            record["players"] = []
+            record["player_scores"] = {}
+            tournaments[record["tournament_id"]] = record
+
+        rows = conn.execute(
+            f"SELECT tournament_id, player_id FROM tournament_players"
+            f"{where} ORDER BY tournament_id, position",
+            params
+        )
+        for row in rows:
+            tournaments[row["tournament_id"]]["players"].append(row["player_id"])
+
+        rounds_by_key = {}
+        rows = conn.execute(
+            f"SELECT tournament_id, position, round_id, name, start_date_time, "
+            f"end_date_time FROM rounds{where} ORDER BY tournament_id, position",
+            params
+        )
+        for row in rows:
+            round_data = {
+                "round_id": row["round_id"],
+                "name": row["name"],
+                "start_date_time": row["start_date_time"],
+                "end_date_time": row["end_date_time"],
+                "matches": [],
+            }
+            tournaments[row["tournament_id"]]["rounds"].append(round_data)
+            rounds_by_key[(row["tournament_id"], row["position"])] = round_data
+
+        rows = conn.execute(
+            f"SELECT tournament_id, round_position, player_a_id, score_a, "
+            f"player_b_id, score_b FROM matches{where} "
+            f"ORDER BY tournament_id, round_position, board",
+            params
+        )
+        for row in rows:
+            rounds_by_key[(row["tournament_id"], row["round_position"])]["matches"].append(
+                [[row["player_a_id"], row["score_a"]], [row["player_b_id"], row["score_b"]]]
+            )
+
+        rows = conn.execute(
+            f"SELECT tournament_id, player_id, total_points, opponents_history "
+            f"FROM player_scores{where} ORDER BY tournament_id, player_id",
+            params
+        )
+        for row in rows:
+            # Keys are strings, exactly as after a JSON round-trip
+            tournaments[row["tournament_id"]]["player_scores"][str(row["player_id"])] = {
+                "total_points": row["total_points"],
+                "opponents_history": json.loads(row["opponents_history"]),
+            }
+
+        return list(tournaments.values())
+
+    def _write_tournament(self, conn, record):
+        """
+        Insert or replace one tournament and all of its child rows.
+
+        Args:
+            conn (sqlite3.Connection): Open connection inside a transaction
+            record (dict): Tournament dictionary (Tournament.to_dict format)
+        """
+        tournament_id = record["tournament_id"]
+
+        placeholders = ", ".join("?" for _ in TOURNAMENT_COLUMNS)
+        conn.execute(
+            f"INSERT OR REPLACE INTO tournaments ({', '.join(TOURNAMENT_COLUMNS)}) "
+            f"VALUES ({placeholders})",
+            tuple(record.get(column) for column in TOURNAMENT_COLUMNS)
+        )
+        for table in TOURNAMENT_CHILD_TABLES:
+            conn.execute(f"DELETE FROM {table} WHERE tournament_id = ?", (tournament_id,))
+
+        conn.executemany(
+            "INSERT INTO tournament_players (tournament_id, position, player_id) "
+            "VALUES (?, ?, ?)",
+            [
+                (tournament_id, position, player_id)
+                for position, player_id in enumerate(record.get("players", []))
+            ]
+        )
+
+        round_rows = []
+        match_rows = []
+        for position, round_data in enumerate(record.get("rounds", [])):
+            round_rows.append((
+                tournament_id, position, round_data.get("round_id"),
+                round_data.get("name"), round_data.get("start_date_time"),
+                round_data.get("end_date_time"),
+            ))
+            for board, match in enumerate(round_data.get("matches", [])):
+                match_rows.append((
+                    tournament_id, position, board,
+                    match[0][0], match[0][1], match[1][0], match[1][1],
+                ))
+        conn.executemany(
+            "INSERT INTO rounds (tournament_id, position, round_id, name, "
+            "start_date_time, end_date_time) VALUES (?, ?, ?, ?, ?, ?)",
+            round_rows
+        )
+        conn.executemany(
+            "INSERT INTO matches (tournament_id, round_position, board, "
+            "player_a_id, score_a, player_b_id, score_b) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            match_rows
+        )
+
+        conn.executemany(
+            "INSERT INTO player_scores (tournament_id, player_id, total_points, "
+            "opponents_history) VALUES (?, ?, ?, ?)",
+            [
+                (
+                    tournament_id, int(player_id), score_data["total_points"],
+                    json.dumps(list(score_data["opponents_history"])),
+                )
+                for player_id, score_data in record.get("player_scores", {}).items()
+            ]
+        )
+
+    # ========================================
+    # HELPER METHODS
+    # ========================================
+
+    @staticmethod
+    def _id_filter(column, ids):
+        """
+        Build a WHERE clause restricting a query to some IDs.
+
+        Args:
+            column (str): ID column name
+            ids (list): IDs to keep, or None for no restriction
+
+        Returns:
+            tuple: (SQL fragment, parameters)
+        """
+        if ids is None:
+            return "", ()
+        ids = list(ids)
+        placeholders = ", ".join("?" for _ in ids) or "NULL"
+        return f" WHERE {column} IN ({placeholders})", tuple(ids)
+
+
+# ========================================
+# MIGRATION FROM JSON FILES
+# ========================================
+
+def migrate_json_to_sqlite(
+    db_path=DEFAULT_DB_PATH,
+    players_path='data/players.json',
+    tournaments_path='data/tournaments/tournaments.json',
+):
+    """
+    Copy the JSON data files into a SQLite database in one pass.
+
+    Existing players and tournaments in the database are replaced.
+
+    Args:
+        db_path (str, optional): Target database file
+        players_path (str, optional): Source players JSON file
+        tournaments_path (str, optional): Source tournaments JSON file
+
+    Returns:
+        tuple: (number of players, number of tournaments) migrated
+    """
+    from models.player import Player
+    from models.tournament import Tournament
+
+    counts = []
+    for entity, source_path, model_class, id_attribute_name in (
+        ("players", players_path, Player, "player_id"),
+        ("tournaments", tournaments_path, Tournament, "tournament_id"),
+    ):
+        source = BaseManager(source_path, model_class, id_attribute_name)
+        target = SqliteManager(db_path, model_class, id_attribute_name, entity)
+        data = source._load_data()
+        target._save_data(data)
+        counts.append(len(data))
+
+    return tuple(counts)
+
+
+if __name__ == "__main__":
+    players_count, tournaments_count = migrate_json_to_sqlite(get_db_path())
+    print(
+        f"Migration terminée : {players_count} joueurs et "
+        f"{tournaments_count} tournois copiés dans {get_db_path()}."
+    )
@@ -0,0 +1,307 @@
+"""
+Standings Engine
+
+Live tournament ranking with tiebreaks, updated one result at a time.
+
+Ranking order:
+    1. Points
+    2. Buchholz: sum of the opponents' points
+    3. Buchholz cut-1: Buchholz without the weakest opponent
+    4. Sonneborn-Berger: sum of (opponent's points x points scored against them)
+    5. Progressive score: sum of the running totals after each round
+    6. Player ID (stable order for complete ties)
+
+Byes give points (and count in the progressive score) but no opponent,
+so they add nothing to Buchholz or Sonneborn-Berger.
+
+Incremental updates:
+    A result changes the points of two players, which moves the Buchholz
+    and Sonneborn-Berger of their past opponents only. Those few players
+    are re-keyed in a sorted list: the rank of a player is one binary
+    search and the top N is a slice, instead of re-sorting the whole
+    tournament after every game.
+
+    Moving a key is a binary search plus a list deletion and insertion,
+    which shift the following keys: O(n) per moved player, but a single
+    memory move, cheap at tournament sizes (hundreds of players) next to
+    the O(n log n) full re-sort it replaces.
+"""
+
+from bisect import bisect_left, insort
+
+
+class StandingsEngine:
+    """
+    Sorted standings of one tournament, kept up to date incrementally.
+
+    Attributes:
+        _points (dict): Player ID -> points
+        _games (dict): Player ID -> list of (opponent_id, own score,
+                       opponent's score)
+        _buchholz (dict): Player ID -> Buchholz
+        _sonneborn_berger (dict): Player ID -> Sonneborn-Berger
+        _progressive (dict): Player ID -> progressive score
+        _last_round (dict): Player ID -> index of the last round with a result
+        _keys (dict): Player ID -> current sort key
+        _sorted_keys (list): Sort keys of all players, best first
+    """
+
+    def __init__(self, player_ids=()):
+        """
+        Initialize the standings.
+
+        Args:
+            player_ids (iterable, optional): Players starting at 0 points
+        """
+        self._points = {}
+        self._games = {}
+        self._buchholz = {}
+        self._sonneborn_berger = {}
+        self._progressive = {}
+        self._last_round = {}
+        self._keys = {}
+        self._sorted_keys = []
+        for player_id in player_ids:
+            self.add_player(player_id)
+
+    def add_player(self, player_id):
+        """
+        Add a player with no results (does nothing if already present).
+
+        Args:
+            player_id (int): The player's ID
+        """
+        if player_id in self._keys:
+            return
+        self._points[player_id] = 0.0
+        self._games[player_id] = []
+        self._buchholz[player_id] = 0.0
+        self._sonneborn_berger[player_id] = 0.0
+        self._progressive[player_id] = 0.0
+        self._last_round[player_id] = -1
+        self._keys[player_id] = self._sort_key(player_id)
+        insort(self._sorted_keys, self._keys[player_id])
+
+    # ========================================
+    # RECORDING RESULTS
+    # ========================================
+
+    def record_game(self, player_a_id, player_b_id, score_a, score_b, round_index):
+        """
+        Record a finished game.
+
+        Args:
+            player_a_id (int): First player's ID
+            player_b_id (int): Second player's ID
+            score_a (float): Points earned by the first player
+            score_b (float): Points earned by the second player
+            round_index (int): 0-based index of the round
+        """
+        self.add_player(player_a_id)
+        self.add_player(player_b_id)
+
+        # The new opponent counts with their points before this game...
+        self._games[player_a_id].append((player_b_id, score_a, score_b))
+        self._games[player_b_id].append((player_a_id, score_b, score_a))
+        self._buchholz[player_a_id] += self._points[player_b_id]
+        self._buchholz[player_b_id] += self._points[player_a_id]
+        self._sonneborn_berger[player_a_id] += self._points[player_b_id] * score_a
+        self._sonneborn_berger[player_b_id] += self._points[player_a_id] * score_b
+
+        # ...then both point changes are propagated to all opponents
+        changed = {player_a_id, player_b_id}
+        changed.update(self._add_points(player_a_id, score_a, round_index))
+        changed.update(self._add_points(player_b_id, score_b, round_index))
+        for player_id in changed:
+            self._refresh(player_id)
+
+    def record_bye(self, player_id, round_index, points=1.0):
+        """
+        Record a bye (points without an opponent).
+
+        Args:
+            player_id (int): The player's ID
+            round_index (int): 0-based index of the round
+            points (float, optional): Points awarded. Defaults to 1.0.
+        """
+        self.add_player(player_id)
+        changed = self._add_points(player_id, points, round_index)
+        changed.add(player_id)
+        for changed_id in changed:
+            self._refresh(changed_id)
+
+    def _add_points(self, player_id, points, round_index):
+        """
+        Add points to a player and to their opponents' tiebreaks.
+
+        Args:
+            player_id (int): The player's ID
+            points (float): Points to add
+            round_index (int): 0-based index of the round
+
+        Returns:
+            set: IDs of the opponents whose tiebreaks changed
+        """
+        # Progressive score: each round's running total includes these points
+        last_round = self._last_round[player_id]
+        if round_index > last_round:
+            self._progressive[player_id] += (
+                (round_index - last_round) * self._points[player_id] + points
+            )
+            self._last_round[player_id] = round_index
+        else:
+            self._progressive[player_id] += points * (last_round - round_index + 1)
+
+        self._points[player_id] += points
+
+        opponents = set()
+        for opponent_id, _, opponent_score in self._games[player_id]:
+            self._buchholz[opponent_id] += points
+            self._sonneborn_berger[opponent_id] += points * opponent_score
+            opponents.add(opponent_id)
+        return opponents
+
+    # ========================================
+    # SORTED STRUCTURE
+    # ========================================
+
+    def _buchholz_cut1(self, player_id):
+        """
+        Compute Buchholz without the weakest opponent.
+
+        Args:
+            player_id (int): The player's ID
+
+        Returns:
+            float: Buchholz cut-1 (0.0 without games)
+        """
+        games = self._games[player_id]
+        if not games:
+            return 0.0
+        weakest = min(self._points[opponent_id] for opponent_id, _, _ in games)
+        return self._buchholz[player_id] - weakest
+
+    def _sort_key(self, player_id):
+        """
+        Build the sort key of a player (smaller is better).
+
+        Args:
+            player_id (int): The player's ID
+
+        Returns:
+            tuple: Negated scores and tiebreaks, then the player ID
+        """
+        return (
+            -self._points[player_id],
+            -self._buchholz[player_id],
+            -self._buchholz_cut1(player_id),
+            -self._sonneborn_berger[player_id],
+            -self._progressive[player_id],
+            player_id,
+        )
+
+    def _refresh(self, player_id):
+        """
+        Move a player to their new place in the sorted keys.
+
+        Both positions are found by binary search, but the deletion and
+        insertion shift the keys after them: O(n) in the number of players.
+
+        Args:
+            player_id (int): The player's ID
+        """
+        old_key = self._keys[player_id]
+        del self._sorted_keys[bisect_left(self._sorted_keys, old_key)]
+        new_key = self._sort_key(player_id)
+        self._keys[player_id] = new_key
+        insort(self._sorted_keys, new_key)
+
+    # ========================================
+    # QUERIES
+    # ========================================
+
+    def __len__(self):
+        return len(self._sorted_keys)
+
+    def rank(self, player_id):
+        """
+        Get a player's current rank.
+
+        Args:
+            player_id (int): The player's ID
+
+        Returns:
+            int: 1-based rank, or None if the player is unknown
+        """
+        key = self._keys.get(player_id)
+        if key is None:
+            return None
+        return bisect_left(self._sorted_keys, key) + 1
+
+    def top(self, count=None):
+        """
+        Get the leading players, best first.
+
+        Args:
+            count (int, optional): Number of players. All players if None.
+
+        Returns:
+            list: Standing dicts (see standing)
+        """
+        keys = self._sorted_keys if count is None else self._sorted_keys[:count]
+        return [
+            self._standing(key[-1], rank)
+            for rank, key in enumerate(keys, start=1)
+        ]
+
+    def iter_top(self):
+        """
+        Generate the standings of all players, best first, one at a time.
+
+        For paginated display: only the standings actually shown are built.
+        Results must not be recorded while iterating.
+
+        Yields:
+            dict: Standing dicts (see standing)
+        """
+        for rank, key in enumerate(self._sorted_keys, start=1):
+            yield self._standing(key[-1], rank)
+
+    def standing(self, player_id):
+        """
+        Get a player's current standing.
+
+        Args:
+            player_id (int): The player's ID
+
+        Returns:
+            dict: Keys 'rank', 'player_id', 'points', 'buchholz',
+                  'buchholz_cut1', 'sonneborn_berger' and 'progressive',
+                  or None if the player is unknown
+        """
+        rank = self.rank(player_id)
+        if rank is None:
+            return None
+        return self._standing(player_id, rank)
+
+    def _standing(self, player_id, rank):
+        """
+        Build the standing dict of a player.
+
+        Args:
+            player_id (int): The player's ID
+            rank (int): The player's rank
+
+        Returns:
+            dict: See standing
+        """
+        key = self._keys[player_id]
+        return {
+            "rank": rank,
+            "player_id": player_id,
+            "points": -key[0],
+            "buchholz": -key[1],
+            "buchholz_cut1": -key[2],
+            "sonneborn_berger": -key[3],
+            "progressive": -key[4],
+        }
@@ -10,12 +10,36 @@ Hydration Process:
     3. Convert round dicts -> Round objects
     4. Convert player IDs in matches -> Player objects
     Result: Fully hydrated Tournament objects ready for use
+
+Lazy Hydration:
+    Step 1 runs at load time and only builds tournament headers.
+    Steps 2-4 run per tournament, the first time its `players` or
+    `rounds` attribute is read. Listing tournaments by name never
+    touches their rounds, matches or the players file.
+
+Header listings:
+    load_headers() / iter_headers() return plain dicts with the ID and
+    HEADER_FIELDS only. With the sharded layout they come from the
+    manifest alone (one file, no shard opened); the selected tournament
+    is then loaded by ID, which reads its shard only.
 """
 
+import os
+
 from models.tournament import Tournament
 from models.round import Round
-from managers.base_manager import BaseManager
+from models.opponent_history import OpponentHistory
+from models.match_columns import MatchColumns
+from managers.base_manager import BaseManager, STORAGE_JSON, STORAGE_JOURNAL
+from managers.sqlite_manager import (
+    SqliteManager, BACKEND_SQLITE, get_backend_name, get_db_path
+)
+from managers.sharded_manager import ShardedJsonManager, LAYOUT_SHARDED, get_layout_name
 from managers.player_manager import PlayerManager
+from managers.standings_engine import StandingsEngine
+
+# Tournament fields shown in listings (and kept in the sharded manifest)
+HEADER_FIELDS = ('name', 'location', 'start_date', 'end_date')
 
 
 class TournamentManager(BaseManager):
@@ -26,84 +50,245 @@ class TournamentManager(BaseManager):
     - Automatic hydration of players and rounds
     - Score management methods
     - Opponent history tracking
+    - Live standings (StandingsEngine), updated by each recorded result
     """
 
-    def __init__(self, file_path='data/tournaments/tournaments.json'):
+    def __init__(
+        self,
+        file_path='data/tournaments/tournaments.json',
+        storage_mode=STORAGE_JSON,
+        backend=None,
+        layout=None,
+        columnar=False,
+        player_manager=None
+    ):
         """
         Initialize the TournamentManager.
         
         Args:
             file_path (str, optional): Path to tournaments JSON file.
                                       Defaults to 'data/tournaments/tournaments.json'.
+            storage_mode (str, optional): STORAGE_JSON (default) or
+                                          STORAGE_JOURNAL (append-only writes).
+            backend (str, optional): "json" or "sqlite". Defaults to the
+                                     CHESS_STORAGE_BACKEND environment variable,
+                                     then "json".
+            layout (str, optional): "single" (one JSON file) or "sharded" (one
+                                    file per tournament + manifest, JSON backend
+                                    only). Defaults to the CHESS_TOURNAMENT_LAYOUT
+                                    environment variable, then "single".
+                                    The sharded layout has no journal mode.
+            columnar (bool, optional): If True, build each tournament's
+                                       MatchColumns at load time.
+            player_manager (PlayerManager, optional): Manager used to hydrate
+                                                      players. Defaults to a
+                                                      PlayerManager on the
+                                                      default players file,
+                                                      with the same storage_mode
+                                                      and backend.
         """
+        storage_backend = None
+        if get_backend_name(backend) == BACKEND_SQLITE:
+            storage_backend = SqliteManager(
+                get_db_path(), Tournament, 'tournament_id', 'tournaments'
+            )
+        elif get_layout_name(layout) == LAYOUT_SHARDED:
+            if storage_mode == STORAGE_JOURNAL:
+                raise ValueError(
+                    "The sharded tournament layout does not support journal storage mode"
+                )
+            storage_backend = ShardedJsonManager(
+                directory=os.path.dirname(file_path),
+                model_class=Tournament,
+                id_attribute_name='tournament_id',
+                shard_prefix='tournament_',
+                header_fields=HEADER_FIELDS,
+                legacy_file_path=file_path
+            )
+
         super().__init__(
             file_path=file_path,
             model_class=Tournament,
-            id_attribute_name='tournament_id'
+            id_attribute_name='tournament_id',
+            storage_mode=storage_mode,
+            storage_backend=storage_backend
+        )
+        self.player_manager = player_manager or PlayerManager(
+            storage_mode=storage_mode, backend=backend
         )
-        self.player_manager = PlayerManager()
+        self.columnar = columnar
 
     # ========================================
     # DATA LOADING WITH HYDRATION
     # ========================================
 
-    def load_items(self):
+    def _file_signature(self):
         """
-        Load all tournaments with automatic hydration.
+        Describe the state of both the tournaments and the players files.
+        
+        Hydrated tournaments embed Player objects, so the cached tournaments
+        must be rebuilt whenever either file changes.
+        
+        Returns:
+            tuple: (tournaments file signature, players file signature)
+        """
+        return (
+            super()._file_signature(),
+            self.player_manager._file_signature(),
+        )
+
+    def _hydrate_items(self, raw_data):
+        """
+        Build tournament headers and defer the rest of the hydration.
         
         Hydration steps:
         1. Load basic tournament data (player IDs, round dicts)
-        2. Convert player IDs to Player objects
-        3. Convert round dicts to Round objects
-        4. Convert player IDs in matches to Player objects
+        2. Convert player IDs to Player objects (on first access)
+        3. Convert round dicts to Round objects (on first access)
+        4. Convert player IDs in matches to Player objects (on first access)
+        
+        Args:
+            raw_data (list): List of tournament dictionaries from storage
         
         Returns:
-            list: Fully hydrated Tournament objects
+            list: Tournament objects, hydrated lazily
         """
         # Load basic tournament objects
-        tournaments = super().load_items()
+        tournaments = super()._hydrate_items(raw_data)
         
-        # Create a player ID -> Player object map for fast lookups
-        all_players_map = {
-            player.player_id: player
-            for player in self.player_manager.load_items()
-        }
+        for tournament, data in zip(tournaments, raw_data):
+            tournament.defer_hydration(
+                self._hydrate_tournament_players,
+                self._hydrate_tournament_rounds
+            )
+            if self.columnar:
+                # Built from the raw dicts: does not trigger hydration
+                tournament.match_columns = MatchColumns.from_rounds(
+                    data.get("rounds", [])
+                )
+        
+        return tournaments
 
-        # Hydrate each tournament
-        for tournament in tournaments:
-            self._hydrate_tournament_players(tournament, all_players_map)
-            self._hydrate_tournament_rounds(tournament, all_players_map)
+    def load_items(self, ids=None):
+        """
+        Load tournaments (see BaseManager.load_items).
+        
+        In columnar mode, tournaments cached by a non-columnar manager
+        get their MatchColumns built here.
+        
+        Args:
+            ids (list, optional): Only load these tournament IDs
         
+        Returns:
+            list: Tournament objects
+        """
+        tournaments = super().load_items(ids)
+        if self.columnar:
+            for tournament in tournaments:
+                if tournament.match_columns is None:
+                    self.build_match_columns(tournament)
         return tournaments
 
-    def _hydrate_tournament_players(self, tournament, players_map):
+    def iter_headers(self):
         """
-        Convert player IDs to Player objects in a tournament.
+        Generate the tournament headers, in storage order.
+        
+        The sharded layout reads them from its manifest without opening
+        any shard; other storages take them from the (lazily hydrated)
+        tournaments, streamed if the cache is cold.
+        
+        Yields:
+            dict: tournament_id and HEADER_FIELDS (read-only listing data)
+        
+        Raises:
+            json.JSONDecodeError: If the tournaments file is corrupted
+        """
+        if isinstance(self.storage_backend, ShardedJsonManager):
+            yield from self._manifest_headers()
+            return
+
+        for tournament in self.iter_items():
+            yield self._tournament_header(tournament)
+
+    def load_headers(self):
+        """
+        List the tournament headers (see iter_headers).
+        
+        The whole list is built anyway, so non-sharded storages load the
+        tournaments through the cache (a corrupted file reads as empty,
+        as in load_items) instead of streaming them.
+        
+        Returns:
+            list: Header dicts, in storage order
+        """
+        if isinstance(self.storage_backend, ShardedJsonManager):
+            return list(self._manifest_headers())
+        return [self._tournament_header(tournament) for tournament in self.load_items()]
+
+    def _manifest_headers(self):
+        """
+        Generate the headers stored in the sharded layout's manifest.
+        
+        Yields:
+            dict: tournament_id and HEADER_FIELDS
+        """
+        for entry in self.storage_backend.load_manifest():
+            header = {'tournament_id': entry['tournament_id']}
+            for field in HEADER_FIELDS:
+                header[field] = entry.get(field)
+            yield header
+
+    @staticmethod
+    def _tournament_header(tournament):
+        """
+        Build the header of a tournament.
         
         Args:
-            tournament (Tournament): Tournament to hydrate
-            players_map (dict): Mapping of player_id -> Player object
+            tournament (Tournament): Tournament to describe
+        
+        Returns:
+            dict: tournament_id and HEADER_FIELDS
+        """
+        header = {'tournament_id': tournament.tournament_id}
+        for field in HEADER_FIELDS:
+            header[field] = getattr(tournament, field)
+        return header
+
+    def _hydrate_tournament_players(self, player_ids):
         """
+        Convert player IDs to Player objects.
+        
+        Args:
+            player_ids (list): Raw player IDs of a tournament
+        
+        Returns:
+            list: Player objects (unknown IDs are dropped)
+        """
+        # Reuse the players' primary-key index for fast lookups
+        players_map = self.player_manager._get_cached_index()
         hydrated_players = []
         
-        for player_id in tournament.players:
+        for player_id in player_ids:
             player_obj = players_map.get(player_id)
             if player_obj:
                 hydrated_players.append(player_obj)
         
-        tournament.players = hydrated_players
+        return hydrated_players
 
-    def _hydrate_tournament_rounds(self, tournament, players_map):
+    def _hydrate_tournament_rounds(self, rounds_data):
         """
         Convert round dicts to Round objects and hydrate matches.
         
         Args:
-            tournament (Tournament): Tournament to hydrate
-            players_map (dict): Mapping of player_id -> Player object
+            rounds_data (list): Raw round dicts (or Round objects)
+        
+        Returns:
+            list: Round objects with hydrated matches
         """
+        players_map = self.player_manager._get_cached_index()
         hydrated_rounds = []
         
-        for round_data in tournament.rounds:
+        for round_data in rounds_data:
             # Convert dict to Round object if needed
             if isinstance(round_data, Round):
                 current_round = round_data
@@ -114,11 +299,13 @@ class TournamentManager(BaseManager):
             self._hydrate_round_matches(current_round, players_map)
             hydrated_rounds.append(current_round)
         
-        tournament.rounds = hydrated_rounds
+        return hydrated_rounds
 
     def _hydrate_round_matches(self, round_obj, players_map):
         """
-        Convert player IDs to Player objects in match tuples.
+        Convert player IDs to Player objects in matches.
+        
+        Matches whose players no longer exist are dropped.
         
         Args:
             round_obj (Round): Round to hydrate
@@ -126,22 +313,108 @@ class TournamentManager(BaseManager):
         """
         hydrated_matches = []
         
-        for match_tuple in round_obj.matches:
-            player_a_id = match_tuple[0][0]
-            player_b_id = match_tuple[1][0]
-            
-            player_a_obj = players_map.get(player_a_id)
-            player_b_obj = players_map.get(player_b_id)
+        for match in round_obj.matches:
+            player_a_obj = players_map.get(getattr(match.white, 'player_id', match.white))
+            player_b_obj = players_map.get(getattr(match.black, 'player_id', match.black))
 
             if player_a_obj and player_b_obj:
-                hydrated_match = (
-                    [player_a_obj, match_tuple[0][1]],
-                    [player_b_obj, match_tuple[1][1]]
-                )
-                hydrated_matches.append(hydrated_match)
+                match.white = player_a_obj
+                match.black = player_b_obj
+                hydrated_matches.append(match)
         
         round_obj.matches = hydrated_matches
 
+    # ========================================
+    # SINGLE-TOURNAMENT PERSISTENCE
+    # ========================================
+
+    def save_tournament(self, tournament):
+        """
+        Save one tournament without touching the others.
+        
+        Only this tournament is dehydrated; other tournaments are neither
+        hydrated nor re-serialized. Depending on the storage, the write is
+        a journal line, a shard, a few table rows, or (plain JSON file)
+        a rewrite of the raw records.
+        
+        Args:
+            tournament (Tournament): Tournament to insert or update
+        """
+        self.upsert_item(tournament)
+
+    # ========================================
+    # COLUMNAR MATCH STORE
+    # ========================================
+
+    def build_match_columns(self, tournament):
+        """
+        Build (or rebuild) the columnar copy of a tournament's finished games.
+        
+        Args:
+            tournament (Tournament): The tournament
+        
+        Returns:
+            MatchColumns: The columns, also stored in tournament.match_columns
+        """
+        tournament.match_columns = MatchColumns.from_rounds(tournament.rounds)
+        return tournament.match_columns
+
+    def add_round_to_match_columns(self, tournament, round_obj):
+        """
+        Append a just-finished round to the tournament's columns, if built.
+        
+        Args:
+            tournament (Tournament): The tournament
+            round_obj (Round): The round whose results were recorded
+        """
+        if tournament.match_columns is None:
+            return
+        round_index = tournament.rounds.index(round_obj)
+        tournament.match_columns.extend_round(round_index, round_obj.matches)
+
+    # ========================================
+    # ROUND ID MANAGEMENT
+    # ========================================
+
+    def get_next_round_id(self):
+        """
+        Allocate the next round ID (unique across all tournaments).
+        
+        Returns:
+            int: Next available round ID
+        """
+        return self.sequences.next_value("round_id", self._get_max_round_id)
+
+    def reserve_round_ids(self, count):
+        """
+        Allocate a block of consecutive round IDs.
+        
+        Args:
+            count (int): Number of IDs to allocate
+        
+        Returns:
+            range: The allocated round IDs
+        """
+        return self.sequences.reserve("round_id", count, self._get_max_round_id)
+
+    def _get_max_round_id(self):
+        """
+        Find the highest stored round ID (used to seed the sequence).
+        
+        Reads raw round dicts: no tournament is hydrated.
+        
+        Returns:
+            int: Highest round ID, or 0 if no rounds exist
+        """
+        return max(
+            (
+                round_data.get("round_id") or 0
+                for tournament_data in self._load_data()
+                for round_data in tournament_data.get("rounds", [])
+            ),
+            default=0
+        )
+
     # ========================================
     # BUSINESS LOGIC: SCORE MANAGEMENT
     # ========================================
@@ -156,12 +429,15 @@ class TournamentManager(BaseManager):
         
         Returns:
             dict: Score data with keys 'total_points' and 'opponents_history'
+                  (an OpponentHistory)
         """
         if player_id not in tournament.player_scores:
             tournament.player_scores[player_id] = {
                 "total_points": 0.0,
-                "opponents_history": []
+                "opponents_history": OpponentHistory()
             }
+            if tournament.standings is not None:
+                tournament.standings.add_player(player_id)
         return tournament.player_scores[player_id]
 
     def add_points_to_player(self, tournament, player_id, points):
@@ -189,5 +465,116 @@ class TournamentManager(BaseManager):
             opponent_id (int): The opponent's ID (or -1 for bye)
         """
         score_data = self.get_player_score(tournament, player_id)
-        if opponent_id not in score_data["opponents_history"]:
-            score_data["opponents_history"].append(opponent_id)
+        score_data["opponents_history"].add(opponent_id)
+
+    def record_match_result(self, tournament, round_index, player_a_id, player_b_id, score_a, score_b):
+        """
+        Record a finished game: points, opponent histories and standings.
+        
+        Args:
+            tournament (Tournament): The tournament
+            round_index (int): 0-based index of the round
+            player_a_id (int): First player's ID
+            player_b_id (int): Second player's ID
+            score_a (float): Points earned by the first player
+            score_b (float): Points earned by the second player
+        """
+        self.add_points_to_player(tournament, player_a_id, score_a)
+        self.add_points_to_player(tournament, player_b_id, score_b)
+        self.add_opponent_to_player(tournament, player_a_id, player_b_id)
+        self.add_opponent_to_player(tournament, player_b_id, player_a_id)
+        
+        if tournament.standings is not None:
+            tournament.standings.record_game(
+                player_a_id, player_b_id, score_a, score_b, round_index
+            )
+
+    def record_bye(self, tournament, player_id, round_index):
+        """
+        Record a bye: 1 point, -1 in the opponent history, and standings.
+        
+        Args:
+            tournament (Tournament): The tournament
+            player_id (int): The player's ID
+            round_index (int): 0-based index of the round
+        """
+        self.add_points_to_player(tournament, player_id, 1.0)
+        self.add_opponent_to_player(tournament, player_id, -1)
+        
+        if tournament.standings is not None:
+            tournament.standings.record_bye(player_id, round_index)
+
+    # ========================================
+    # STANDINGS
+    # ========================================
+
+    def get_standings(self, tournament):
+        """
+        Get the live standings of a tournament, built on first use.
+        
+        Once built, the standings are kept up to date by
+        record_match_result and record_bye.
+        
+        Args:
+            tournament (Tournament): The tournament
+        
+        Returns:
+            StandingsEngine: The standings, also stored in tournament.standings
+        """
+        if tournament.standings is None:
+            tournament.standings = self._build_standings(tournament)
+        return tournament.standings
+
+    def _build_standings(self, tournament):
+        """
+        Replay a tournament's finished games and byes into new standings.
+        
+        The games are read from the tournament's match columns (built for
+        the occasion if the manager is not columnar). Byes are not stored
+        per round: a player missing from a round's matches gets a bye for
+        it while their points exceed their game points.
+        
+        Args:
+            tournament (Tournament): The tournament
+        
+        Returns:
+            StandingsEngine: The standings
+        """
+        standings = StandingsEngine(player.player_id for player in tournament.players)
+        columns = tournament.match_columns
+        if columns is None:
+            columns = MatchColumns.from_rounds(tournament.rounds)
+        
+        for player_a_id, player_b_id, score_a, score_b, round_index in zip(
+            columns.player_a, columns.player_b, columns.score_a, columns.score_b,
+            columns.round_index
+        ):
+            standings.record_game(player_a_id, player_b_id, score_a, score_b, round_index)
+        
+        game_points = columns.points_by_player()
+        bye_points = {
+            player_id: score_data["total_points"] - game_points.get(player_id, 0.0)
+            for player_id, score_data in tournament.player_scores.items()
+        }
+        
+        # Finished rounds are in the columns; the round in progress is not
+        rounds_player_ids = [set() for _ in tournament.rounds]
+        for round_index, player_a_id, player_b_id in zip(
+            columns.round_index, columns.player_a, columns.player_b
+        ):
+            rounds_player_ids[round_index].update((player_a_id, player_b_id))
+        for round_index, round_obj in enumerate(tournament.rounds):
+            if round_obj.end_date_time is None:
+                for match in round_obj.matches:
+                    rounds_player_ids[round_index].update((
+                        getattr(match.white, 'player_id', match.white),
+                        getattr(match.black, 'player_id', match.black),
+                    ))
+        
+        for round_index, round_player_ids in enumerate(rounds_player_ids):
+            for player_id, points in bye_points.items():
+                if player_id not in round_player_ids and points >= 1.0:
+                    standings.record_bye(player_id, round_index)
+                    bye_points[player_id] = points - 1.0
+        
+        return standings
@@ -0,0 +1,65 @@
+"""
+Match Model
+
+Represents a single game between two players within a round.
+Uses __slots__ and fixed fields instead of nested lists to keep the
+per-game memory footprint small.
+"""
+
+
+class Match:
+    """
+    A game between two players with their scores.
+    
+    Attributes:
+        white (Player or int): First player (Player object once hydrated,
+                               player ID when freshly loaded)
+        black (Player or int): Second player (same as white)
+        white_score (float): Points earned by the first player
+        black_score (float): Points earned by the second player
+    
+    JSON format (unchanged from the original tuple-based matches):
+        [[white_id, white_score], [black_id, black_score]]
+    """
+
+    __slots__ = ("white", "black", "white_score", "black_score")
+
+    def __init__(self, white, black, white_score=0.0, black_score=0.0):
+        """
+        Initialize a new Match instance.
+        
+        Args:
+            white (Player or int): First player
+            black (Player or int): Second player
+            white_score (float, optional): First player's points. Defaults to 0.0.
+            black_score (float, optional): Second player's points. Defaults to 0.0.
+        """
+        self.white = white
+        self.black = black
+        self.white_score = white_score
+        self.black_score = black_score
+
+    @classmethod
+    def from_list(cls, match_data):
+        """
+        Build a Match from its serialized form.
+        
+        Args:
+            match_data (list): [[white, white_score], [black, black_score]]
+        
+        Returns:
+            Match: The new match
+        """
+        (white, white_score), (black, black_score) = match_data
+        return cls(white, black, white_score, black_score)
+
+    def to_list(self):
+        """
+        Convert the Match to its JSON form, with player IDs instead of objects.
+        
+        Returns:
+            list: [[white_id, white_score], [black_id, black_score]]
+        """
+        white_id = getattr(self.white, 'player_id', self.white)
+        black_id = getattr(self.black, 'player_id', self.black)
+        return [[white_id, self.white_score], [black_id, self.black_score]]
@@ -0,0 +1,108 @@
+"""
+Match Columns Model
+
+Columnar (structure-of-arrays) representation of a tournament's games.
+Each finished game is one position in five parallel typed arrays, so
+aggregations over a whole tournament run as tight loops over machine
+integers and floats instead of walking Round -> Match -> Player objects.
+"""
+
+from array import array
+
+
+class MatchColumns:
+    """
+    Parallel arrays describing every recorded game of a tournament.
+    
+    Attributes:
+        round_index (array('i')): 0-based index of the game's round
+        player_a (array('i')): First player's ID
+        player_b (array('i')): Second player's ID
+        score_a (array('f')): First player's points
+        score_b (array('f')): Second player's points
+    
+    Position i of every array describes the same game.
+    """
+
+    __slots__ = ("round_index", "player_a", "player_b", "score_a", "score_b")
+
+    def __init__(self):
+        """Initialize empty columns."""
+        self.round_index = array('i')
+        self.player_a = array('i')
+        self.player_b = array('i')
+        self.score_a = array('f')
+        self.score_b = array('f')
+
+    def __len__(self):
+        """Return the number of games stored."""
+        return len(self.round_index)
+
+    # ========================================
+    # BUILDING
+    # ========================================
+
+    @classmethod
+    def from_rounds(cls, rounds):
+        """
+        Build columns from a tournament's rounds.
+        
+        Only finished rounds (end_date_time set) are included. Rounds may
+        be Round objects or raw round dicts, so columns can be built at
+        load time without hydrating the tournament.
+        
+        Args:
+            rounds (list): Round objects or round dicts, in play order
+        
+        Returns:
+            MatchColumns: The new columns
+        """
+        columns = cls()
+        for position, round_item in enumerate(rounds):
+            if isinstance(round_item, dict):
+                if round_item.get("end_date_time") is None:
+                    continue
+                columns.extend_round(position, round_item.get("matches", []))
+            elif round_item.end_date_time is not None:
+                columns.extend_round(position, round_item.matches)
+        return columns
+
+    def extend_round(self, round_index, matches):
+        """
+        Append the games of one round.
+        
+        Args:
+            round_index (int): 0-based index of the round
+            matches (list): Match objects or serialized matches
+                            ([[player_a_id, score_a], [player_b_id, score_b]])
+        """
+        for match in matches:
+            if isinstance(match, (list, tuple)):
+                (player_a, score_a), (player_b, score_b) = match
+            else:
+                player_a, player_b = match.white, match.black
+                score_a, score_b = match.white_score, match.black_score
+            self.round_index.append(round_index)
+            self.player_a.append(getattr(player_a, 'player_id', player_a))
+            self.player_b.append(getattr(player_b, 'player_id', player_b))
+            self.score_a.append(score_a)
+            self.score_b.append(score_b)
+
+    # ========================================
+    # AGGREGATIONS
+    # ========================================
+
+    def points_by_player(self):
+        """
+        Sum the points scored over the board by each player (byes excluded).
+        
+        Returns:
+            dict: player_id -> points
+        """
+        points = {}
+        for player_a, player_b, score_a, score_b in zip(
+            self.player_a, self.player_b, self.score_a, self.score_b
+        ):
+            points[player_a] = points.get(player_a, 0.0) + score_a
+            points[player_b] = points.get(player_b, 0.0) + score_b
+        return points
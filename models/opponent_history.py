@@ -0,0 +1,66 @@
+"""
+Opponent History Model
+
+Opponents already faced by a player in a tournament.
+Behaves like a list for iteration (first opponent first) and like a set
+for membership, so rematch checks cost O(1) instead of O(rounds).
+"""
+
+
+class OpponentHistory:
+    """
+    Insertion-ordered set of opponent IDs.
+    
+    Attributes:
+        _opponents (dict): Opponent ID -> None, in the order they were met
+    
+    JSON format (unchanged):
+        [3, 7, -1]   (-1 marks a bye)
+    """
+
+    __slots__ = ("_opponents",)
+
+    def __init__(self, opponent_ids=None):
+        """
+        Initialize a new OpponentHistory instance.
+        
+        Args:
+            opponent_ids (iterable, optional): Opponent IDs, in the order
+                                               they were met. Defaults to none.
+        """
+        self._opponents = dict.fromkeys(opponent_ids if opponent_ids is not None else ())
+
+    def add(self, opponent_id):
+        """
+        Record an opponent (ignored if already recorded).
+        
+        Args:
+            opponent_id (int): The opponent's ID (or -1 for a bye)
+        """
+        self._opponents[opponent_id] = None
+
+    def __contains__(self, opponent_id):
+        return opponent_id in self._opponents
+
+    def __iter__(self):
+        return iter(self._opponents)
+
+    def __len__(self):
+        return len(self._opponents)
+
+    def __eq__(self, other):
+        if isinstance(other, OpponentHistory):
+            return list(self._opponents) == list(other._opponents)
+        return list(self._opponents) == other
+
+    def __repr__(self):
+        return f"OpponentHistory({list(self._opponents)!r})"
+
+    def to_list(self):
+        """
+        Convert the history to its JSON form.
+        
+        Returns:
+            list: Opponent IDs in the order they were met
+        """
+        return list(self._opponents)
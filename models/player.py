@@ -19,6 +19,8 @@ class Player:
         national_id (str): National chess federation ID (e.g., "AB12345")
     """
 
+    __slots__ = ("player_id", "last_name", "first_name", "date_of_birth", "national_id")
+
     def __init__(
         self,
         last_name,
@@ -7,6 +7,8 @@ Each round contains a list of matches and timing information.
 
 import datetime
 
+from models.match import Match
+
 
 class Round:
     """
@@ -15,16 +17,17 @@ class Round:
     Attributes:
         round_id (int): Unique identifier for the round
         name (str): Round name (e.g., "Round 1", "Round 2")
-        matches (list): List of match tuples in format:
-                       [([player_obj, score], [player_obj, score]), ...]
+        matches (list): List of Match objects
         start_date_time (str): Round start time in ISO format
         end_date_time (str): Round end time in ISO format (None if ongoing)
     
-    Match tuple structure:
-        ([Player_A, score_A], [Player_B, score_B])
-        Example: ([<Player obj>, 1.0], [<Player obj>, 0.0])
+    Serialized match structure (see Match.to_list):
+        [[Player_A_id, score_A], [Player_B_id, score_B]]
+        Example: [[1, 1.0], [2, 0.0]]
     """
 
+    __slots__ = ("round_id", "name", "matches", "start_date_time", "end_date_time")
+
     def __init__(
         self,
         name,
@@ -38,14 +41,18 @@ class Round:
         
         Args:
             name (str): Round name (e.g., "Round 1")
-            matches (list, optional): List of match tuples. Defaults to empty list.
+            matches (list, optional): List of Match objects, or serialized
+                                      matches (converted). Defaults to empty list.
             start_date_time (str, optional): Start time in ISO format. Defaults to now.
             end_date_time (str, optional): End time in ISO format. None if ongoing.
             round_id (int, optional): Unique identifier. Auto-generated if None.
         """
         self.round_id = round_id
         self.name = name
-        self.matches = matches if matches is not None else []
+        self.matches = [
+            match if isinstance(match, Match) else Match.from_list(match)
+            for match in (matches if matches is not None else [])
+        ]
         self.start_date_time = (
             start_date_time if start_date_time else datetime.datetime.now().isoformat()
         )
@@ -62,31 +69,7 @@ class Round:
         Returns:
             dict: Round data with matches containing player IDs instead of objects
         """
-        serialized_matches = []
-        
-        for match_tuple in self.matches:
-            # Extract player and score data
-            player_a_data = match_tuple[0]  # [player_obj/id, score]
-            player_b_data = match_tuple[1]  # [player_obj/id, score]
-            
-            # Convert Player objects to IDs if needed
-            player_a_id = (
-                player_a_data[0].player_id
-                if hasattr(player_a_data[0], 'player_id')
-                else player_a_data[0]
-            )
-            player_b_id = (
-                player_b_data[0].player_id
-                if hasattr(player_b_data[0], 'player_id')
-                else player_b_data[0]
-            )
-            
-            # Rebuild match tuple with IDs
-            serialized_match = (
-                [player_a_id, player_a_data[1]],
-                [player_b_id, player_b_data[1]]
-            )
-            serialized_matches.append(serialized_match)
+        serialized_matches = [match.to_list() for match in self.matches]
 
         return {
             "round_id": self.round_id,
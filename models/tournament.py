@@ -7,6 +7,7 @@ Business logic is handled by TournamentManager.
 """
 
 from models.round import Round
+from models.opponent_history import OpponentHistory
 
 
 class Tournament:
@@ -26,13 +27,34 @@ class Tournament:
         players (list): List of Player objects (hydrated by manager)
         player_scores (dict): Tournament-specific player data
                              Format: {player_id: {"total_points": float,
-                                                  "opponents_history": list}}
+                                                  "opponents_history": OpponentHistory}}
+        match_columns (MatchColumns): Optional columnar copy of the finished
+                                      games (built by TournamentManager,
+                                      never serialized)
+        standings (StandingsEngine): Optional live ranking with tiebreaks
+                                     (built by TournamentManager, never
+                                     serialized)
     
     Note on player_scores:
         - total_points: Player's cumulative score in this tournament
-        - opponents_history: List of opponent IDs faced (includes -1 for byes)
+        - opponents_history: Opponent IDs faced (includes -1 for byes),
+          stored as an OpponentHistory (O(1) rematch checks) and
+          serialized as a list
+        - Player IDs are normalized to int: JSON turns dict keys into strings
+    
+    Note on lazy hydration:
+        When loaded by TournamentManager, `players` and `rounds` first hold
+        raw IDs/dicts and are converted to objects on first access
+        (see defer_hydration). to_dict() never triggers that conversion.
     """
 
+    __slots__ = (
+        "tournament_id", "name", "location", "description", "start_date",
+        "end_date", "number_of_rounds", "current_round", "player_scores",
+        "match_columns", "standings", "_rounds", "_players", "_rounds_loader",
+        "_players_loader",
+    )
+
     def __init__(
         self,
         name,
@@ -71,9 +93,74 @@ class Tournament:
         self.end_date = end_date
         self.number_of_rounds = number_of_rounds
         self.current_round = current_round
-        self.rounds = rounds if rounds is not None else []
-        self.players = players if players is not None else []
-        self.player_scores = player_scores if player_scores is not None else {}
+        self._rounds = rounds if rounds is not None else []
+        self._players = players if players is not None else []
+        self._rounds_loader = None
+        self._players_loader = None
+        self.player_scores = self._normalize_player_scores(player_scores or {})
+        self.match_columns = None
+        self.standings = None
+
+    @staticmethod
+    def _normalize_player_scores(player_scores):
+        """
+        Convert loaded player_scores to their in-memory form.
+        
+        Args:
+            player_scores (dict): Player scores as stored (keys may be strings,
+                                  histories may be lists)
+        
+        Returns:
+            dict: {int player_id: {"total_points": float,
+                                   "opponents_history": OpponentHistory}}
+        """
+        normalized = {}
+        for player_id, score_data in player_scores.items():
+            score_data = dict(score_data)
+            history = score_data.get("opponents_history")
+            if not isinstance(history, OpponentHistory):
+                score_data["opponents_history"] = OpponentHistory(history)
+            normalized[int(player_id)] = score_data
+        return normalized
+
+    @property
+    def players(self):
+        """list: Player objects, hydrated on first access if deferred."""
+        if self._players_loader is not None:
+            loader, self._players_loader = self._players_loader, None
+            self._players = loader(self._players)
+        return self._players
+
+    @players.setter
+    def players(self, value):
+        self._players = value
+        self._players_loader = None
+
+    @property
+    def rounds(self):
+        """list: Round objects, hydrated on first access if deferred."""
+        if self._rounds_loader is not None:
+            loader, self._rounds_loader = self._rounds_loader, None
+            self._rounds = loader(self._rounds)
+        return self._rounds
+
+    @rounds.setter
+    def rounds(self, value):
+        self._rounds = value
+        self._rounds_loader = None
+
+    def defer_hydration(self, players_loader, rounds_loader):
+        """
+        Postpone conversion of raw players/rounds until they are accessed.
+        
+        Args:
+            players_loader (callable): Takes the raw player IDs and returns
+                                       a list of Player objects
+            rounds_loader (callable): Takes the raw round dicts and returns
+                                      a list of Round objects
+        """
+        self._players_loader = players_loader
+        self._rounds_loader = rounds_loader
 
     def to_dict(self):
         """
@@ -82,14 +169,14 @@ class Tournament:
         This method "dehydrates" the tournament:
         - Converts Player objects to player IDs
         - Converts Round objects to dictionaries
-        - Preserves player_scores as-is (IDs are sufficient)
+        - Converts opponent histories back to lists (IDs are sufficient)
         
         Returns:
             dict: Tournament data ready for JSON storage
         """
-        # Convert Player objects to IDs
+        # Convert Player objects to IDs (raw IDs if not hydrated yet)
         player_ids = []
-        for player in self.players:
+        for player in self._players:
             player_id = (
                 player.player_id
                 if hasattr(player, 'player_id')
@@ -97,9 +184,9 @@ class Tournament:
             )
             player_ids.append(player_id)
 
-        # Convert Round objects to dictionaries
+        # Convert Round objects to dictionaries (raw dicts if not hydrated yet)
         serialized_rounds = []
-        for round_item in self.rounds:
+        for round_item in self._rounds:
             if isinstance(round_item, Round):
                 serialized_rounds.append(round_item.to_dict())
             else:
@@ -116,5 +203,11 @@ class Tournament:
             "current_round": self.current_round,
             "rounds": serialized_rounds,
             "players": player_ids,
-            "player_scores": self.player_scores,
+            "player_scores": {
+                player_id: {
+                    **score_data,
+                    "opponents_history": list(score_data["opponents_history"]),
+                }
+                for player_id, score_data in self.player_scores.items()
+            },
         }
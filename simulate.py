@@ -0,0 +1,94 @@
+"""
+Headless Tournament Simulator
+
+Plays a complete synthetic tournament without user interaction and
+reports the time spent in pairing, hydration and saving per round.
+
+Usage:
+    python simulate.py --players 500 --rounds 7
+    python simulate.py --players 5000 --results rating --seed 1
+    CHESS_PAIRING_MODE=brackets python simulate.py --players 50000
+
+Files are written to a temporary directory (removed at the end) unless
+--data-dir is given. The application's data/ directory is never used.
+"""
+
+import argparse
+import json
+import shutil
+import tempfile
+
+from controllers.simulation_controller import (
+    SimulationController, RESULTS_RANDOM, RESULTS_RATING, TIMING_NAMES
+)
+from views.report_view import ReportView
+
+
+def parse_arguments():
+    """
+    Read the command line options.
+
+    Returns:
+        argparse.Namespace: Parsed options
+    """
+    parser = argparse.ArgumentParser(description="Simulateur de tournoi sans interface")
+    parser.add_argument("--players", type=int, default=500, help="nombre de joueurs")
+    parser.add_argument("--rounds", type=int, default=7, help="nombre de rounds")
+    parser.add_argument(
+        "--results", choices=(RESULTS_RANDOM, RESULTS_RATING), default=RESULTS_RANDOM,
+        help="résultats aléatoires ou selon la force des joueurs"
+    )
+    parser.add_argument("--seed", type=int, default=None, help="graine aléatoire")
+    parser.add_argument("--data-dir", default=None, help="dossier des données (conservé)")
+    parser.add_argument("--json", default=None, help="écrit les temps mesurés dans ce fichier")
+    return parser.parse_args()
+
+
+def main():
+    """
+    Simulator entry point.
+
+    Runs the simulation and displays the timings per round.
+    """
+    arguments = parse_arguments()
+    data_dir = arguments.data_dir or tempfile.mkdtemp(prefix="chess_simulation_")
+
+    try:
+        simulation = SimulationController(
+            data_dir=data_dir,
+            player_count=arguments.players,
+            number_of_rounds=arguments.rounds,
+            results_mode=arguments.results,
+            seed=arguments.seed
+        )
+        timings = simulation.run()
+    finally:
+        if arguments.data_dir is None:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    headers = ["Round", "Appariement (s)", "Hydratation (s)", "Sauvegarde (s)", "Total (s)"]
+    rows = [
+        [round_number] + [f"{round_timings[name]:.3f}" for name in TIMING_NAMES]
+        for round_number, round_timings in sorted(timings.items())
+    ]
+    ReportView().display_table(
+        f"Simulation : {arguments.players} joueurs, {arguments.rounds} rounds", headers, rows
+    )
+    if simulation.view.errors:
+        print(f"\n{len(simulation.view.errors)} erreur(s) : {simulation.view.errors[0]}")
+
+    if arguments.json:
+        with open(arguments.json, 'w', encoding='utf-8') as f:
+            json.dump(
+                {
+                    "players": arguments.players,
+                    "rounds": arguments.rounds,
+                    "results": arguments.results,
+                    "timings": {str(number): values for number, values in timings.items()},
+                },
+                f, indent=4
+            )
+
+
+if __name__ == "__main__":
+    main()
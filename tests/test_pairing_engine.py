@@ -0,0 +1,291 @@
+"""
+Pairing Engine Tests
+
+max_weight_matching is compared with a brute force search on small
+random graphs (fixed seeds). Graphs cover:
+    - odd and even vertex counts
+    - missing edges (forbidden rematches), down to disconnected graphs
+    - tied weights (drawn from a few values, like equal score gaps)
+    - maxcardinality on and off (the engine always uses it)
+    - a starting matching of maximum-weight edges (initial_pairs), as
+      built by PairingEngine
+
+A result is correct when it is a valid matching over the given edges
+with the best possible weight (and, with maxcardinality, the largest
+possible size first). Several optimal matchings may exist, so only these
+totals are compared.
+
+PairingEngine and ScoreBracketPairing are then run on simulated Swiss
+tournaments to check the round invariants: everybody plays once or gets
+the bye, no rematch, no second bye while someone has not had one.
+"""
+
+import random
+
+import pytest
+
+from managers.pairing_engine import (
+    BYE_OPPONENT_ID,
+    PairingEngine,
+    ScoreBracketPairing,
+    max_weight_matching,
+)
+from models.player import Player
+
+# Edge weights are drawn from this many distinct values (ties are likely)
+WEIGHT_VALUES = 4
+
+
+# ========================================
+# MATCHING AGAINST BRUTE FORCE
+# ========================================
+
+def _random_graph(rng, max_vertices):
+    """
+    Draw a random graph.
+
+    Args:
+        rng (random.Random): Random source
+        max_vertices (int): Largest vertex count
+
+    Returns:
+        tuple: (vertex count, list of (i, j, weight) edges)
+    """
+    vertex_count = rng.randint(1, max_vertices)
+    density = rng.choice((0.3, 0.6, 0.9, 1.0))
+    base = rng.randint(0, 20)
+    edges = [
+        (i, j, base + rng.randrange(WEIGHT_VALUES))
+        for i in range(vertex_count)
+        for j in range(i + 1, vertex_count)
+        if rng.random() < density
+    ]
+    rng.shuffle(edges)
+    return vertex_count, edges
+
+
+def _greedy_initial_pairs(edges):
+    """
+    Pick disjoint edges of maximum weight, as a starting matching.
+
+    Args:
+        edges (list): (i, j, weight) edges
+
+    Returns:
+        list: (i, j) pairs
+    """
+    if not edges:
+        return []
+    max_weight = max(weight for _, _, weight in edges)
+    used = set()
+    pairs = []
+    for i, j, weight in edges:
+        if weight == max_weight and i not in used and j not in used:
+            pairs.append((i, j))
+            used.update((i, j))
+    return pairs
+
+
+def _brute_force_best(vertex_count, edges, maxcardinality):
+    """
+    Find the best matching totals by trying every matching.
+
+    Args:
+        vertex_count (int): Number of vertices
+        edges (list): (i, j, weight) edges
+        maxcardinality (bool): Compare size before weight
+
+    Returns:
+        tuple: (size, weight) of the best matching, size being 0 when
+               only the weight counts
+    """
+    neighbors = {v: [] for v in range(vertex_count)}
+    for i, j, weight in edges:
+        neighbors[i].append((j, weight))
+        neighbors[j].append((i, weight))
+
+    # Size first only with maxcardinality; otherwise weight alone decides
+    if maxcardinality:
+        def key(totals):
+            return totals
+    else:
+        def key(totals):
+            return totals[1]
+
+    def best_from(vertex, used):
+        while vertex < vertex_count and vertex in used:
+            vertex += 1
+        if vertex == vertex_count:
+            return (0, 0)
+        best = best_from(vertex + 1, used)
+        for partner, weight in neighbors[vertex]:
+            if partner in used:
+                continue
+            size, total = best_from(vertex + 1, used | {vertex, partner})
+            best = max(best, (size + 1, total + weight), key=key)
+        return best
+
+    size, weight = best_from(0, frozenset())
+    return (size if maxcardinality else 0, weight)
+
+
+def _matching_totals(vertex_count, edges, mate, maxcardinality):
+    """
+    Check a mate list and add up its matching.
+
+    Args:
+        vertex_count (int): Number of vertices
+        edges (list): (i, j, weight) edges
+        mate (list): Result of max_weight_matching
+        maxcardinality (bool): Report the size (else 0)
+
+    Returns:
+        tuple: (size, weight), or None if mate is not a valid matching
+    """
+    weights = {}
+    for i, j, weight in edges:
+        weights[(i, j)] = weights[(j, i)] = max(weight, weights.get((i, j), weight))
+
+    if len(mate) != vertex_count:
+        return None
+    size = total = 0
+    for v, partner in enumerate(mate):
+        if partner == -1:
+            continue
+        if not 0 <= partner < vertex_count or mate[partner] != v or (v, partner) not in weights:
+            return None
+        if v < partner:
+            size += 1
+            total += weights[(v, partner)]
+    return (size if maxcardinality else 0, total)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_max_weight_matching_matches_brute_force(seed):
+    """Optimal totals on 150 random graphs of up to 8 vertices per seed."""
+    rng = random.Random(seed)
+    for _ in range(150):
+        vertex_count, edges = _random_graph(rng, 8)
+        maxcardinality = rng.random() < 0.5
+        initial_pairs = _greedy_initial_pairs(edges) if rng.random() < 0.5 else []
+
+        mate = max_weight_matching(vertex_count, edges, maxcardinality, initial_pairs)
+
+        assert _matching_totals(vertex_count, edges, mate, maxcardinality) == (
+            _brute_force_best(vertex_count, edges, maxcardinality)
+        ), (vertex_count, maxcardinality, initial_pairs, edges)
+
+
+def test_max_weight_matching_without_edges():
+    """Every vertex stays single."""
+    assert max_weight_matching(3, []) == [-1, -1, -1]
+
+
+# ========================================
+# SWISS ROUND INVARIANTS
+# ========================================
+
+def _players(count):
+    """
+    Build numbered players.
+
+    Args:
+        count (int): Number of players
+
+    Returns:
+        list: Player objects with IDs 1..count
+    """
+    return [
+        Player(f"Nom{i}", f"Prénom{i}", "1990-01-01", f"AB{i:05d}", player_id=i)
+        for i in range(1, count + 1)
+    ]
+
+
+def _players_with_scores(players, scores, opponents):
+    """
+    Build the pairing input, sorted by score (highest first).
+
+    Args:
+        players (list): Player objects
+        scores (dict): player_id -> points
+        opponents (dict): player_id -> list of opponent IDs (-1 for a bye)
+
+    Returns:
+        list: Dicts with keys 'player', 'score' and 'opponents'
+    """
+    return sorted(
+        (
+            {
+                'player': player,
+                'score': scores[player.player_id],
+                'opponents': opponents[player.player_id],
+            }
+            for player in players
+        ),
+        key=lambda data: (-data['score'], data['player'].player_id)
+    )
+
+
+@pytest.mark.parametrize("engine", [
+    PairingEngine(),
+    PairingEngine(window=2),
+    ScoreBracketPairing(parallel_threshold=10 ** 6),
+], ids=["matching", "small-window", "brackets"])
+@pytest.mark.parametrize("player_count", [2, 9, 10, 15])
+def test_swiss_rounds_have_no_rematch_and_fair_byes(engine, player_count):
+    """Simulated rounds: full coverage, no rematch, one bye per player at most."""
+    rng = random.Random(player_count)
+    players = _players(player_count)
+    scores = {player.player_id: 0.0 for player in players}
+    opponents = {player.player_id: [] for player in players}
+    rounds = min(5, player_count - 1)
+
+    for _ in range(rounds):
+        pairing = engine.pair_players(_players_with_scores(players, scores, opponents))
+        assert pairing is not None
+        pairs, bye_player = pairing
+
+        seated = [player.player_id for pair in pairs for player in pair]
+        if bye_player is not None:
+            seated.append(bye_player.player_id)
+        assert sorted(seated) == sorted(scores)
+        assert (bye_player is None) == (player_count % 2 == 0)
+
+        for player_a, player_b in pairs:
+            assert player_b.player_id not in opponents[player_a.player_id]
+            score_a = rng.choice((1.0, 0.5, 0.0))
+            scores[player_a.player_id] += score_a
+            scores[player_b.player_id] += 1.0 - score_a
+            opponents[player_a.player_id].append(player_b.player_id)
+            opponents[player_b.player_id].append(player_a.player_id)
+
+        if bye_player is not None:
+            assert BYE_OPPONENT_ID not in opponents[bye_player.player_id]
+            scores[bye_player.player_id] += 1.0
+            opponents[bye_player.player_id].append(BYE_OPPONENT_ID)
+
+
+def test_bye_goes_to_the_lowest_ranked_eligible_player():
+    """The last player already had a bye: the one above them gets it."""
+    players = _players(5)
+    scores = {1: 2.0, 2: 2.0, 3: 1.0, 4: 1.0, 5: 0.0}
+    opponents = {1: [], 2: [], 3: [], 4: [], 5: [BYE_OPPONENT_ID]}
+
+    pairs, bye_player = PairingEngine().pair_players(
+        _players_with_scores(players, scores, opponents)
+    )
+
+    assert bye_player.player_id == 4
+    assert len(pairs) == 2
+
+
+def test_no_rematch_free_pairing_returns_none():
+    """Two players who already met cannot be paired again."""
+    players = _players(2)
+    opponents = {1: [2], 2: [1]}
+
+    result = PairingEngine().pair_players(
+        _players_with_scores(players, {1: 1.0, 2: 0.0}, opponents)
+    )
+
+    assert result is None
@@ -0,0 +1,176 @@
+"""
+Result Importer Tests
+
+Reading a round's results from CSV and JSONL files, and the validation
+that rejects a file as a whole (every problem reported, nothing applied).
+"""
+
+import pytest
+
+from managers.result_importer import (
+    BLACK_WINS,
+    DRAW,
+    WHITE_WINS,
+    ResultImporter,
+    ResultImportError,
+)
+from models.match import Match
+from models.round import Round
+
+
+@pytest.fixture
+def round_obj():
+    """Round of three boards: 1-2, 3-4, 5-6 (raw player IDs)."""
+    return Round("Round 1", matches=[Match(1, 2), Match(3, 4), Match(5, 6)])
+
+
+def _validate(round_obj, *records):
+    """
+    Validate records numbered from line 2 (after a CSV header).
+
+    Args:
+        round_obj (Round): Round being closed
+        *records: Record dicts (or None for an invalid JSON line)
+
+    Returns:
+        list: Scores per board
+    """
+    return ResultImporter().validate(round_obj, enumerate(records, start=2))
+
+
+def _errors(round_obj, *records):
+    """
+    Validate records that must be rejected.
+
+    Args:
+        round_obj (Round): Round being closed
+        *records: Record dicts
+
+    Returns:
+        list: Error messages
+    """
+    with pytest.raises(ResultImportError) as raised:
+        _validate(round_obj, *records)
+    return raised.value.errors
+
+
+# ========================================
+# VALID FILES
+# ========================================
+
+def test_csv_by_board(tmp_path, round_obj):
+    """Boards in any order, every result notation."""
+    file_path = tmp_path / "results.csv"
+    file_path.write_text("board,result\n3,=\n1,1-0\n2,0-1\n", encoding="utf-8")
+
+    scores = ResultImporter().read_round_results(round_obj, str(file_path))
+
+    assert scores == [WHITE_WINS, BLACK_WINS, DRAW]
+
+
+def test_jsonl_by_players_in_either_order(tmp_path, round_obj):
+    """Colors given reversed are swapped back to the match's order."""
+    file_path = tmp_path / "results.jsonl"
+    file_path.write_text(
+        '{"white_id": 1, "black_id": 2, "result": "1/2-1/2"}\n'
+        '{"white_id": 4, "black_id": 3, "result": "1-0"}\n'
+        '{"white_id": 5, "black_id": 6, "white_score": 0, "black_score": 1}\n',
+        encoding="utf-8"
+    )
+
+    scores = ResultImporter().read_round_results(round_obj, str(file_path))
+
+    assert scores == [DRAW, BLACK_WINS, BLACK_WINS]
+
+
+def test_menu_codes_and_scores(round_obj):
+    """Codes 1/2/3 and explicit scores are accepted."""
+    scores = _validate(
+        round_obj,
+        {"board": "1", "result": "2"},
+        {"board": "2", "result": "3"},
+        {"board": "3", "white_score": "0.5", "black_score": "0.5"},
+    )
+
+    assert scores == [BLACK_WINS, DRAW, DRAW]
+
+
+# ========================================
+# REJECTED FILES
+# ========================================
+
+def test_missing_board(round_obj):
+    """A board without result is reported."""
+    errors = _errors(round_obj, {"board": 1, "result": "1-0"}, {"board": 2, "result": "0-1"})
+
+    assert errors == ["1 échiquier(s) sans résultat : 3"]
+
+
+def test_duplicate_board(round_obj):
+    """A board entered twice points to the first line."""
+    errors = _errors(
+        round_obj,
+        {"board": 1, "result": "1-0"},
+        {"white_id": 2, "black_id": 1, "result": "1-0"},
+        {"board": 2, "result": "1-0"},
+        {"board": 3, "result": "1-0"},
+    )
+
+    assert errors == ["Ligne 3 : échiquier 1 déjà saisi (ligne 2)."]
+
+
+@pytest.mark.parametrize("record, message", [
+    ({"board": 4, "result": "1-0"}, "échiquier 4 inexistant (1 à 3)."),
+    ({"board": "x", "result": "1-0"}, "numéro d'échiquier invalide : 'x'."),
+    ({"white_id": 1, "black_id": 3, "result": "1-0"},
+     "les joueurs 1 et 3 ne jouent pas ensemble ce round."),
+    ({"board": 2, "white_id": 1, "black_id": 2, "result": "1-0"},
+     "les joueurs 1 et 2 jouent à l'échiquier 1, pas 2."),
+    ({"result": "1-0"}, "indiquez 'board' ou 'white_id' et 'black_id'."),
+    ({"board": 1, "result": "2-0"}, "résultat invalide : '2-0'."),
+    ({"board": 1, "white_score": 1, "black_score": 1}, "scores impossibles : 1.0 - 1.0."),
+    ({"board": 1}, "indiquez 'result' ou 'white_score' et 'black_score'."),
+])
+def test_invalid_record(round_obj, record, message):
+    """Each invalid record is reported with its line number."""
+    errors = _errors(
+        round_obj,
+        record,
+        {"board": 1, "result": "1-0"},
+        {"board": 2, "result": "1-0"},
+        {"board": 3, "result": "1-0"},
+    )
+
+    assert errors == [f"Ligne 2 : {message}"]
+
+
+def test_all_errors_reported_together(round_obj):
+    """Invalid lines and missing boards are collected in one error."""
+    errors = _errors(round_obj, None, {"board": 9, "result": "1-0"})
+
+    assert errors == [
+        "Ligne 2 : objet JSON invalide.",
+        "Ligne 3 : échiquier 9 inexistant (1 à 3).",
+        "3 échiquier(s) sans résultat : 1, 2, 3",
+    ]
+
+
+def test_unsupported_format(tmp_path, round_obj):
+    """Unknown extensions are rejected before reading."""
+    file_path = tmp_path / "results.txt"
+    file_path.write_text("board,result\n", encoding="utf-8")
+
+    with pytest.raises(ResultImportError) as raised:
+        ResultImporter().read_round_results(round_obj, str(file_path))
+
+    assert len(raised.value.errors) == 1
+
+
+def test_missing_file(tmp_path, round_obj):
+    """An unreadable file is a single import error."""
+    file_path = tmp_path / "absent.csv"
+
+    with pytest.raises(ResultImportError) as raised:
+        ResultImporter().read_round_results(round_obj, str(file_path))
+
+    assert raised.value.errors[0].startswith(f"Lecture impossible de {file_path}")
@@ -39,6 +39,8 @@ class MainView:
         print("3. Gérer un tournoi existant")
         print("4. Voir les rapports")
         print("5. Quitter l'application")
+        print("6. Importer des joueurs (CSV/JSONL)")
+        print("7. Diagnostics de performance")
         return input("\nEntrez votre choix : ")
 
     def display_reports_menu(self):
@@ -55,6 +57,22 @@ class MainView:
         print("4. Lister les joueurs d'un tournoi")
         print("5. Lister tous les rounds et matchs d'un tournoi")
         print("6. Retour au menu principal")
+        print("7. Classement Elo des joueurs")
+        print("8. Exporter un rapport (CSV/JSONL/HTML)")
+        return input("\nEntrez votre choix : ")
+
+    def display_export_menu(self):
+        """
+        Display the list of exportable reports.
+        
+        Returns:
+            str: User's menu choice
+        """
+        print("\n--- Exporter un Rapport ---")
+        print("1. Tous les joueurs (par ID)")
+        print("2. Tous les tournois (par ID)")
+        print("3. Joueurs d'un tournoi")
+        print("0. Annuler")
         return input("\nEntrez votre choix : ")
 
     def display_tournament_management_menu(
@@ -91,8 +109,12 @@ class MainView:
             print("1. (Inscriptions fermées)")
             print("2. Saisir les résultats du round")
             
-        print("3. Afficher les résultats (Pas encore implémenté)")
+        print("3. Afficher le classement")
         print("4. Retourner au menu principal")
+        if tournament.rounds and not is_tournament_finished:
+            print("5. Importer les résultats du round (CSV/JSONL)")
+        else:
+            print("5. (Import de résultats indisponible)")
         return input("\nEntrez votre choix : ")
 
     # ========================================
@@ -176,6 +198,65 @@ class MainView:
         """
         return input("\nEntrez le numéro de votre choix : ")
 
+    def prompt_for_player_search(self):
+        """
+        Ask for the name of the player to find.
+        
+        Returns:
+            str: Search text (empty or "0" to cancel)
+        """
+        return input("\nRechercher un joueur (nom et/ou prénom, 0 pour annuler) : ").strip()
+
+    def prompt_for_player_choice_or_search(self):
+        """
+        Ask for a number in the search results, or a new search.
+        
+        Returns:
+            str: Number typed, or new search text (empty or "0" to cancel)
+        """
+        return input(
+            "\nEntrez le numéro du joueur, ou une nouvelle recherche : "
+        ).strip()
+
+    def prompt_for_players_file(self):
+        """
+        Ask for the path of a players file to import.
+        
+        Returns:
+            str: File path as typed (not validated)
+        """
+        return input("\nChemin du fichier de joueurs (.csv ou .jsonl) : ").strip()
+
+    def prompt_for_results_file(self):
+        """
+        Ask for the path of a round results file.
+        
+        Returns:
+            str: File path as typed (not validated)
+        """
+        return input("\nChemin du fichier de résultats (.csv ou .jsonl) : ").strip()
+
+    def prompt_for_export_file(self):
+        """
+        Ask for the path of the file to export to.
+        
+        Returns:
+            str: File path as typed (empty to cancel)
+        """
+        return input(
+            "\nFichier de destination (.csv, .jsonl ou .html, vide pour annuler) : "
+        ).strip()
+
+    def prompt_for_counters_reset(self):
+        """
+        Ask whether the performance counters should be reset.
+        
+        Returns:
+            bool: True if the user answered yes
+        """
+        answer = input("\nRemettre les compteurs à zéro ? (o/n) : ")
+        return answer.strip().lower() == "o"
+
     def prompt_for_match_result(self, player_a, player_b):
         """
         Prompt for the result of a match between two players.
@@ -232,6 +313,22 @@ class MainView:
         """Display info message when user cancels a selection."""
         print("\nSélection annulée. Retour au menu précédent.")
 
+    def display_instrumentation_disabled(self):
+        """Display how to enable the performance counters."""
+        print(
+            "\nDiagnostics désactivés. Relancez l'application avec "
+            "--instrument ou CHESS_INSTRUMENT=1."
+        )
+
+    def display_instrumentation_output(self, output_path):
+        """
+        Display where the counters will be written at exit.
+        
+        Args:
+            output_path (str): JSON file path
+        """
+        print(f"Les compteurs seront enregistrés dans {output_path} à la fermeture.")
+
     def display_welcoming_message(self):
         """Display welcome message at application start."""
         print("Bienvenue dans le système de gestion des tournois d'échecs!")
@@ -254,6 +351,47 @@ class MainView:
         """
         print(f"\n[ERREUR] {error_message} Veuillez réessayer.\n")
 
+    def display_players_import_summary(self, imported, duplicates, rejected, errors):
+        """
+        Display the result of a players import.
+        
+        Args:
+            imported (int): Number of players added
+            duplicates (int): Rows skipped (national ID already known)
+            rejected (int): Number of invalid rows
+            errors (list): Messages of the first rejected rows
+        """
+        print(f"\n{imported} joueur(s) importé(s), {duplicates} doublon(s) ignoré(s), "
+              f"{rejected} ligne(s) rejetée(s).")
+        for error in errors:
+            print(f"  - {error}")
+        if rejected > len(errors):
+            print(f"  ... et {rejected - len(errors)} autre(s).")
+
+    def display_export_summary(self, count, file_path):
+        """
+        Display the result of a report export.
+        
+        Args:
+            count (int): Number of rows written
+            file_path (str): Destination file
+        """
+        print(f"\n{count} ligne(s) exportée(s) vers {file_path}.")
+
+    def display_results_import_errors(self, errors, limit=20):
+        """
+        Display the problems found in a results file.
+        
+        Args:
+            errors (list): Error messages
+            limit (int, optional): Maximum number of messages shown. Defaults to 20.
+        """
+        print(f"\n[ERREUR] Import refusé, aucun résultat enregistré ({len(errors)} erreur(s)) :")
+        for error in errors[:limit]:
+            print(f"  - {error}")
+        if len(errors) > limit:
+            print(f"  ... et {len(errors) - limit} autre(s).")
+
     def display_all_players_already_enrolled(self):
         """Display error when no players are available to add."""
         print("\nTous les joueurs de la base de données sont déjà inscrits à ce tournoi.")
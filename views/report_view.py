@@ -4,8 +4,28 @@ Report View
 Handles display of formatted reports and tables.
 This is a "dumb" view - it only displays pre-formatted data.
 Controllers prepare all data and formatting.
+
+Large reports:
+    display_paged_table() takes an iterator of rows and shows them one
+    page at a time (n: next, p: previous, q: quit). Column widths come
+    from the first WIDTH_SAMPLE_SIZE rows (read up front) or from declared
+    widths; longer cells are cut with "…". Beyond that sample, rows are
+    read one page ahead of the page shown. Each page is written to the
+    terminal in a single write.
 """
 
+import sys
+from itertools import islice
+
+# Rows per page of a paginated report
+PAGE_SIZE = 20
+
+# Rows read to size the columns of a paginated report
+WIDTH_SAMPLE_SIZE = 200
+
+# Spaces after each column
+COLUMN_PADDING = 2
+
 
 class ReportView:
     """
@@ -65,3 +85,183 @@ class ReportView:
             print(row_line)
         
         print(separator_line)
+
+    # ========================================
+    # PAGINATED TABLES
+    # ========================================
+
+    def display_paged_table(self, title, headers, rows, widths=None, page_size=PAGE_SIZE):
+        """
+        Display a table one page at a time, reading the rows as needed.
+        
+        A table that fits in one page is printed without any prompt.
+        Pages already seen are kept (as text) for the "previous" command.
+        Rows are read as needed, with two exceptions: without `widths`,
+        the first WIDTH_SAMPLE_SIZE rows are read up front to size the
+        columns, and the page after the one shown is always read (to
+        know whether the current page is the last one).
+        
+        Args:
+            title (str): Table title
+            headers (list): Column headers
+            rows (iterable): Row data (each row is a list), e.g. a generator
+            widths (list, optional): Column widths. Defaults to the widest
+                                     cell of the first WIDTH_SAMPLE_SIZE rows.
+            page_size (int, optional): Rows per page. Defaults to PAGE_SIZE.
+        """
+        rows = iter(rows)
+        sample = []
+        if widths is None:
+            sample = list(islice(rows, WIDTH_SAMPLE_SIZE))
+            widths = self._measure_widths(headers, sample)
+
+        pages = self._paginate(sample, rows, page_size)
+        rendered_pages = []
+        last_page_index = None
+        page_index = 0
+
+        while True:
+            if page_index == len(rendered_pages):
+                page_rows, is_last = next(pages, ([], True))
+                if not page_rows and not rendered_pages:
+                    print(f"\n--- {title} ---")
+                    print("Aucune donnée à afficher.")
+                    return
+                rendered_pages.append(self._render_rows(page_rows, widths))
+                if is_last:
+                    last_page_index = page_index
+
+            if last_page_index == 0:
+                self._write_page(title, headers, widths, rendered_pages[0], "")
+                return
+
+            body = rendered_pages[page_index]
+            first_row = page_index * page_size + 1
+            last_row = first_row + body.count("\n") - 1
+            position = f"Page {page_index + 1}"
+            if last_page_index is not None:
+                position += f"/{last_page_index + 1}"
+            self._write_page(
+                title, headers, widths, body,
+                f"{position} (lignes {first_row} à {last_row})\n"
+            )
+
+            is_last_page = page_index == last_page_index
+            while True:
+                command = self.prompt_for_page_command(is_last_page)
+                if command == "p" and page_index == 0:
+                    print("Vous êtes déjà sur la première page.")
+                elif command in ("n", "p", "q", ""):
+                    break
+                else:
+                    print("Commande invalide : n, p ou q.")
+
+            if command == "q" or (is_last_page and command in ("n", "")):
+                return
+            page_index += -1 if command == "p" else 1
+
+    def prompt_for_page_command(self, is_last_page):
+        """
+        Ask for the next page command.
+        
+        Args:
+            is_last_page (bool): True on the last page (Enter quits)
+        
+        Returns:
+            str: "n", "p", "q", "" (Enter) or any other text typed
+        """
+        if is_last_page:
+            prompt = "Fin du rapport. [p] page précédente, [q]/Entrée quitter : "
+        else:
+            prompt = "[n]/Entrée page suivante, [p] page précédente, [q] quitter : "
+        return input(prompt).strip().lower()
+
+    @staticmethod
+    def _paginate(sample, rows, page_size):
+        """
+        Split rows into pages, reading one page ahead to detect the last one.
+        
+        Args:
+            sample (list): Rows already read (width sample), shown first
+            rows (iterator): Remaining rows
+            page_size (int): Rows per page
+        
+        Yields:
+            tuple: (list of rows, True if it is the last page)
+        """
+        def read_page():
+            page = sample[:page_size]
+            del sample[:page_size]
+            if len(page) < page_size:
+                page.extend(islice(rows, page_size - len(page)))
+            return page
+
+        page = read_page()
+        while page:
+            next_page = read_page()
+            yield page, not next_page
+            page = next_page
+
+    @staticmethod
+    def _measure_widths(headers, sample):
+        """
+        Size each column to its widest header or sampled cell.
+        
+        Args:
+            headers (list): Column headers
+            sample (list): First rows of the table
+        
+        Returns:
+            list: Column widths (without padding)
+        """
+        widths = [len(str(header)) for header in headers]
+        for row in sample:
+            for i, cell in enumerate(row[:len(widths)]):
+                widths[i] = max(widths[i], len(str(cell)))
+        return widths
+
+    @staticmethod
+    def _render_rows(rows, widths):
+        """
+        Format rows as fixed-width lines, cutting cells that don't fit.
+        
+        Args:
+            rows (list): Row data
+            widths (list): Column widths (without padding)
+        
+        Returns:
+            str: One line per row, each ending with a newline
+        """
+        lines = []
+        for row in rows:
+            cells = []
+            for cell, width in zip(row, widths):
+                text = str(cell)
+                if len(text) > width:
+                    text = text[:max(width - 1, 0)] + "…"
+                cells.append(f"{text:<{width + COLUMN_PADDING}}")
+            lines.append("".join(cells).rstrip() + "\n")
+        return "".join(lines)
+
+    @staticmethod
+    def _write_page(title, headers, widths, body, footer):
+        """
+        Write a whole page (title, header, rows, footer) in a single write.
+        
+        Args:
+            title (str): Table title
+            headers (list): Column headers
+            widths (list): Column widths (without padding)
+            body (str): Rendered rows
+            footer (str): Page position line, or "" for a single page
+        """
+        header_line = "".join(
+            f"{str(header):<{width + COLUMN_PADDING}}"
+            for header, width in zip(headers, widths)
+        ).rstrip()
+        separator_line = "-" * sum(width + COLUMN_PADDING for width in widths)
+        sys.stdout.write(
+            f"\n--- {title} ---\n{header_line}\n{separator_line}\n"
+            f"{body}{separator_line}\n{footer}"
+        )
+        sys.stdout.flush()
@@ -0,0 +1,56 @@
+"""
+Simulation View
+
+Scripted, silent replacement for MainView used by the headless simulator.
+Match results come from a callback instead of the keyboard, and feedback
+messages are dropped (errors are kept for the final report).
+"""
+
+from views.main_view import MainView
+
+
+class SimulationView(MainView):
+    """
+    Console-free view driven by a result callback.
+
+    Attributes:
+        result_chooser (callable): Takes (player_a, player_b) and returns
+                                   "1", "2" or "3" like a user would
+        errors (list): Validation errors raised during the simulation
+    """
+
+    def __init__(self, result_chooser):
+        """
+        Initialize the simulation view.
+
+        Args:
+            result_chooser (callable): Result source, see class attributes
+        """
+        self.result_chooser = result_chooser
+        self.errors = []
+
+    def prompt_for_match_result(self, player_a, player_b):
+        """
+        Return the scripted result of a match.
+
+        Args:
+            player_a (Player): First player
+            player_b (Player): Second player
+
+        Returns:
+            str: "1" (first player wins), "2" (second player wins) or "3" (draw)
+        """
+        return self.result_chooser(player_a, player_b)
+
+    def display_round_started(self, round_name, num_matches):
+        """Silent."""
+
+    def display_results_saved(self, round_name):
+        """Silent."""
+
+    def display_tournament_finished(self):
+        """Silent."""
+
+    def display_validation_error(self, error_message):
+        """Record the error instead of printing it."""
+        self.errors.append(error_message)